@@ -2,6 +2,7 @@
 
 import argparse
 import os
+import shutil
 import sys
 import subprocess
 from splitversions import split_versions, rm_temp_dirs
@@ -18,6 +19,12 @@ def main():
     rm_temp_dirs(zip_dest, pypi_dest)
     split_versions(zip_dest, pypi_dest, "")
 
+    print('Precompiling translation tables...')
+    subprocess.run([sys.executable, 'build/build_translations.py', pypi_dest],
+        check=True)
+    translations_path = "cmu_graphics/meta/translations.marshal"
+    shutil.copy2(f"{pypi_dest}/{translations_path}", f"{zip_dest}/{translations_path}")
+
     zipfile_name = "cmu_graphics_installer.zip"
     print('Creating zip file...')
     subprocess.run([sys.executable, '-m', 'zipfile', '-c', zipfile_name, zip_dest],
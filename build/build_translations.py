@@ -0,0 +1,21 @@
+# Saves the expanded translation tables of the cmu_graphics package in the
+# given directory to cmu_graphics/meta/translations.marshal, so the package
+# loads them instead of building them.
+# Run me after splitting the versions, e.g. python build/build_translations.py pypi_upload
+
+import importlib.util
+import os
+import sys
+
+
+def main():
+    # Loads translations.py on its own, since importing the package needs
+    # cairo and pygame, which the build doesn't
+    path = os.path.join(sys.argv[1], 'cmu_graphics', 'translations.py')
+    spec = importlib.util.spec_from_file_location('translations', path)
+    translations = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(translations)
+    translations.savePrecompiledTranslations()
+    print(f"Saved {translations.PRECOMPILED_TRANSLATIONS_PATH}")
+
+main()
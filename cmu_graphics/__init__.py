@@ -105,6 +105,7 @@ disallowed_filenames = {
         'math',
         'ntpath',
         'numbers',
+        'numpy',
         'opcode',
         'operator',
         'os',
@@ -242,15 +243,15 @@ from random import (
     seed,
 )
 
-from cmu_graphics.shape_logic import (
+from cmu_graphics.translations import (
     TRANSLATED_GLOBALS,
     TRANSLATED_BOOLEANS,
     TRANSLATED_KEY_NAMES,
     accentCombinations,
-    PILWrapper as CMUImage,
 )
+from cmu_graphics.shape_logic import PILWrapper as CMUImage
 
-__all__ = TRANSLATED_GLOBALS['keys']
+__all__ = list(TRANSLATED_GLOBALS['keys'])
 __all__.extend(
     [
         'setLanguage',
@@ -3,7 +3,8 @@ import os
 
 os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = 'hide'
 
-from cmu_graphics.shape_logic import TRANSLATED_KEY_NAMES, _ShapeMetaclass
+from cmu_graphics.shape_logic import _ShapeMetaclass
+from cmu_graphics.translations import TRANSLATED_KEY_NAMES
 from cmu_graphics import shape_logic
 
 
@@ -27,10 +28,32 @@ class Signal:
 
 pygameEvent = Signal()
 onStepEvent = Signal()
+# Sent after each pass of the main loop with the milliseconds since the last
+# step, or since the last pass when there are no steps to run. The loop sleeps
+# while the app is idle, so passes only happen for events, steps, and every
+# IDLE_WAIT_MS.
 onMainLoopEvent = Signal()
 
 EPSILON = 10e-7
 
+# With app.incrementalRedraw, frames that damage more than this fraction of
+# the screen (or more than this many separate areas) are drawn in one piece
+MAX_DAMAGED_FRACTION = 0.5
+MAX_DIRTY_RECTS = 32
+
+# With app.fixedTimestep, at most this many steps are run to catch up before
+# a frame is drawn. Time beyond that is dropped, so the app falls behind
+# instead of never drawing again.
+MAX_CATCH_UP_STEPS = 5
+
+# When there are no steps to run, the main loop sleeps until an event comes
+# in, waking this often (in milliseconds) to draw changes made from other
+# threads, like the console
+IDLE_WAIT_MS = 100
+
+# Channel masks of cairo's FORMAT_ARGB32 pixels, read as native 32-bit ints
+CAIRO_ARGB32_MASKS = (0xFF0000, 0xFF00, 0xFF, 0xFF000000)
+
 
 def almostEqual(x, y, epsilon=EPSILON):
     return abs(x - y) <= epsilon
@@ -81,6 +104,10 @@ def assertEqual(*args, **kwargs):
 
 
 class Shape(object, metaclass=_ShapeMetaclass):
+    # _shape has a fixed field, so that shapes only get a __dict__ if the user
+    # gives them attributes of their own
+    __slots__ = ('__dict__', '_shape')
+
     # This represents the attributes and methods handled by JS that the user
     # can call/get/set
     _js_attrs = {
@@ -161,9 +188,9 @@ class Shape(object, metaclass=_ShapeMetaclass):
 
     def __setattr__(self, attr, val):
         if attr[0] == '_':
-            self.__dict__[attr] = val
+            object.__setattr__(self, attr, val)
         else:
-            en_attr = toEnglish(attr, 'shape-attr')
+            en_attr = englishShapeAttrs.get(attr, attr)
             if en_attr in self._js_attrs:
                 sli.slSetWithTypeCheck(self._shape, en_attr, val)
             else:
@@ -174,7 +201,7 @@ class Shape(object, metaclass=_ShapeMetaclass):
         if attr[0] == '_':
             return self.__dict__[attr]
 
-        en_attr = toEnglish(attr, 'shape-attr')
+        en_attr = englishShapeAttrs.get(attr, attr)
         if en_attr in self._js_attrs:
             return slGet(self._shape, en_attr)
         else:
@@ -286,6 +313,9 @@ class Group(Shape):
         'clear',
         'remove',
         'hitTest',
+        'collidingPairs',
+        'hitsAny',
+        'cached',
         # these attributes are not pass-through, so will throw an error if used
         'arrowEnd',
         'arrowStart',
@@ -306,7 +336,7 @@ class Group(Shape):
         'bold',
         'italic',
     }
-    _init_attrs = {'visible', 'db'}
+    _init_attrs = {'visible', 'db', 'cached'}
 
     def __init__(self, *args, **kwargs):
         if app is not None and app._app._isMvc:
@@ -355,7 +385,7 @@ class Sound(object):
 
         if url.startswith('http'):
             try:
-                response = webrequest.get(url)
+                response = webrequest.get(url, cache=True)
                 self.sound = io.BytesIO(response.read())
             except Exception:
                 raise Exception('Failed to load sound data')
@@ -460,6 +490,219 @@ class NoMvc:
         app._app._isMvc = self.oldMvc
 
 
+# Draw function arguments of these types can be compared with the previous
+# frame's arguments to decide whether a shape can be reused
+REUSABLE_ARG_TYPES = (
+    int,
+    float,
+    str,
+    bool,
+    type(None),
+    shape_logic.RGB,
+    shape_logic.Gradient,
+)
+
+# Shape attributes that can be set on a reused shape with the same result as
+# passing them to its constructor
+PATCHABLE_ATTRS = {'fill', 'border', 'borderWidth', 'opacity', 'dashes'}
+
+
+# With app.immediateMode, calls to these draw functions are recorded as
+# drawing commands instead of shapes, as long as they only pass these
+# arguments. Anything else falls back to making a shape.
+IMMEDIATE_MODE_ARGS = {
+    'Rect': ['left', 'top', 'width', 'height'],
+    'Circle': ['centerX', 'centerY', 'radius'],
+    'Label': ['value', 'centerX', 'centerY'],
+}
+IMMEDIATE_MODE_ATTRS = {
+    'Rect': {'fill', 'border', 'borderWidth', 'opacity', 'dashes', 'align'},
+    'Circle': {'fill', 'border', 'borderWidth', 'opacity', 'dashes'},
+    'Label': {
+        'fill',
+        'border',
+        'borderWidth',
+        'opacity',
+        'align',
+        'font',
+        'size',
+        'bold',
+        'italic',
+    },
+}
+
+
+def sameArgValue(value1, value2):
+    return (
+        type(value1) is type(value2)
+        and type(value1) in REUSABLE_ARG_TYPES
+        and value1 == value2
+    )
+
+
+class DrawCall(object):
+    def __init__(self, shapeCls, args, kwargs, shape):
+        self.shapeCls = shapeCls
+        self.args = args
+        self.kwargs = kwargs
+        self.shape = shape
+        self.version = shape.version
+
+    def getPatch(self, shapeCls, args, kwargs):
+        # Returns the attributes to set to turn this call's shape into the
+        # shape the given call would make, or None if it has to be rebuilt
+        if (
+            shapeCls is not self.shapeCls
+            or self.shape.version != self.version
+            or len(args) != len(self.args)
+            or kwargs.keys() != self.kwargs.keys()
+        ):
+            return None
+        for arg, oldArg in zip(args, self.args):
+            if not sameArgValue(arg, oldArg):
+                return None
+        patch = dict()
+        for attr in kwargs:
+            if not sameArgValue(kwargs[attr], self.kwargs[attr]):
+                enAttr = toEnglish(attr, 'shape-attr')
+                if enAttr not in PATCHABLE_ATTRS:
+                    return None
+                patch[enAttr] = kwargs[attr]
+        return patch
+
+
+class DrawCallReconciler(object):
+    # Matches the draw calls made by each run of redrawAll to the ones made
+    # by the previous run, by call site and order. Shapes drawn with the same
+    # arguments as last time are reused instead of being built again.
+    def __init__(self):
+        self.previousCalls = dict()
+        self.calls = None
+        self.shapes = []
+        self.shapeIdsBeforeFrame = set()
+        self.immediateMode = False
+        # (number of shapes drawn before, CommandBuffer) for each run of
+        # immediate mode draw calls, for the frame being drawn and for the
+        # last finished frame
+        self.commandBuffers = []
+        self.frameCommandBuffers = []
+        # Whether drawing commands appeared or went away since the last time
+        # the screen was drawn
+        self.commandsChanged = False
+
+    def startFrame(self, group):
+        self.calls = dict()
+        self.shapes = []
+        self.shapeIdsBeforeFrame = {shape.id for shape in group._shapes}
+
+    def draw(self, shapeCls, callSite, args, kwargs):
+        if self.immediateMode and self.drawImmediate(shapeCls, args, kwargs):
+            return
+
+        calls = self.calls.setdefault(callSite, [])
+        previousCalls = self.previousCalls.get(callSite, [])
+        previousCall = None
+        if len(calls) < len(previousCalls):
+            previousCall = previousCalls[len(calls)]
+
+        patch = None
+        if previousCall is not None:
+            patch = previousCall.getPatch(shapeCls, args, kwargs)
+        if patch is None:
+            with NoMvc():
+                shape = shapeCls(*args, isMvc=True, **kwargs)._shape
+        else:
+            shape = previousCall.shape
+            for attr in patch:
+                sli.slSetWithTypeCheck(shape, attr, patch[attr])
+
+        calls.append(DrawCall(shapeCls, args, kwargs, shape))
+        self.shapes.append(shape)
+
+    def getImmediateAttrs(self, shapeCls, args, kwargs):
+        # Returns the checked attributes of a draw call, or None if it has to
+        # make a shape (which also reports any error in the call)
+        clsName = shapeCls.__name__
+        argNames = IMMEDIATE_MODE_ARGS.get(clsName, None)
+        if argNames is None:
+            return None
+        attrs = dict()
+        try:
+            shape_logic.checkArgCount(clsName, None, argNames, args)
+            for attr, value in zip(argNames, args):
+                shape_logic.shapeAttrs[attr].typeCheckFn(clsName, attr, value, False)
+                if attr in ('width', 'height', 'radius'):
+                    shape_logic.checkPositive(clsName, attr, value, False)
+                attrs[attr] = value
+            for attr in kwargs:
+                value = kwargs[attr]
+                enAttr = toEnglish(attr, 'shape-attr')
+                if enAttr not in IMMEDIATE_MODE_ATTRS[clsName] or isinstance(
+                    value, shape_logic.Gradient
+                ):
+                    return None
+                if enAttr == 'align':
+                    if value is not None:
+                        shape_logic.checkAlign(clsName, enAttr, value, False)
+                else:
+                    shape_logic.shapeAttrs[enAttr].typeCheckFn(
+                        clsName, enAttr, value, False
+                    )
+                attrs[enAttr] = value
+        except Exception:
+            return None
+        return attrs
+
+    def drawImmediate(self, shapeCls, args, kwargs):
+        attrs = self.getImmediateAttrs(shapeCls, args, kwargs)
+        if attrs is None:
+            return False
+        if not self.commandBuffers or self.commandBuffers[-1][0] != len(self.shapes):
+            self.commandBuffers.append((len(self.shapes), shape_logic.CommandBuffer()))
+        commands = self.commandBuffers[-1][1]
+        getattr(commands, 'add' + shapeCls.__name__)(attrs)
+        return True
+
+    def drawFrame(self, group, ctx):
+        # Draws the group's shapes, with each run of drawing commands between
+        # the shapes drawn before and after it
+        if not self.frameCommandBuffers:
+            group.draw(ctx)
+            return
+        ctx.save()
+        shapes = group._shapes
+        start = 0
+        for index, commands in self.frameCommandBuffers:
+            for shape in shapes[start:index]:
+                shape.draw(ctx)
+            commands.draw(ctx)
+            start = index
+        for shape in shapes[start:]:
+            shape.draw(ctx)
+        ctx.restore()
+
+    def endFrame(self, group):
+        if self.calls is None:
+            return
+        if self.commandBuffers or self.frameCommandBuffers:
+            self.commandsChanged = True
+        self.frameCommandBuffers = self.commandBuffers
+        self.commandBuffers = []
+        # Shapes that were added to the group during redrawAll without a draw
+        # call (like the error screen) stay on top of the drawn ones
+        drawnIds = {shape.id for shape in self.shapes}
+        otherShapes = [
+            shape
+            for shape in group._shapes
+            if shape.id not in self.shapeIdsBeforeFrame and shape.id not in drawnIds
+        ]
+        group.setShapes(self.shapes + otherShapes)
+        self.previousCalls = self.calls
+        self.calls = None
+        self.shapes = []
+        self.shapeIdsBeforeFrame = set()
+
+
 def makeDrawFn(shape):
     def drawFn(*args, **kwargs):
         if not app._app._isMvc:
@@ -468,9 +711,8 @@ def makeDrawFn(shape):
             )
         if not app._app.inRedrawAll:
             raise MvcException('Cannot draw (modify the view) outside of redrawAll')
-        with NoMvc():
-            kwargs['isMvc'] = True
-            shape(*args, **kwargs)
+        caller = sys._getframe(1)
+        app._app.drawCalls.draw(shape, (caller.f_code, caller.f_lasti), args, kwargs)
 
     return drawFn
 
@@ -503,10 +745,11 @@ createDrawingFunctions()
 
 
 class KeyName(str):
-    def __init__(self, baseKey):
-        self.__dict__['accentCombinations'] = accentCombinations(str(self))
-
     def __eq__(self, other):
+        # The spellings are worked out on the first comparison, rather than
+        # for every key event
+        if 'accentCombinations' not in self.__dict__:
+            self.__dict__['accentCombinations'] = accentCombinations(str(self))
         return other in self.accentCombinations
 
     def __setattr__(self, attr, value):
@@ -551,7 +794,10 @@ class App(object):
 
     def getScreenshot(self, path):
         with DRAWING_LOCK:
-            pygame.image.save(self._screen, path)
+            if self._headless:
+                self._cairo_surface.write_to_png(path)
+            else:
+                pygame.image.save(self._screen, path)
 
     def quit(self):
         self._running = False
@@ -573,11 +819,9 @@ class App(object):
         for language in shape_logic.TRANSLATED_USER_FUNCTION_NAMES:
             if language == 'keys':
                 continue
-            if enFnName in shape_logic.TRANSLATED_USER_FUNCTION_NAMES[language]:
-                fnTranslations = shape_logic.TRANSLATED_USER_FUNCTION_NAMES[language][
-                    enFnName
-                ]
-                for fnTranslation in fnTranslations:
+            fnTranslations = shape_logic.getUserFunctionNames(language)
+            if enFnName in fnTranslations:
+                for fnTranslation in fnTranslations[enFnName]:
                     if fnTranslation in self.userGlobals:
                         return fnTranslation, language
 
@@ -623,6 +867,7 @@ class App(object):
 
     @_safeMethod
     def callUserFn(self, enFnName, args, kwargs=None, redraw=True):
+        self._calledUserFn = True
         if kwargs is None:
             kwargs = dict()
 
@@ -639,12 +884,14 @@ class App(object):
             self.redrawAllWrapper()
 
     def redrawAllWrapper(self):
-        self.group.clear()
+        self.drawCalls.startFrame(self._tlg._shape)
 
         self.inRedrawAll = True
         self.callUserFn('redrawAll', ())
         self.inRedrawAll = False
 
+        self.drawCalls.endFrame(self._tlg._shape)
+
     @staticmethod
     def getKey(keyCode, modifierMask):
         keyNameMap = {
@@ -695,8 +942,11 @@ class App(object):
         return keyNameMap.get(keyCode, None)
 
     def drawErrorScreen(self):
-        cairo_surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, self.width, self.height)
-        ctx = cairo.Context(cairo_surface)
+        self._fullRedraw = True
+        # Show only what a failed redrawAll managed to draw
+        self.drawCalls.endFrame(self._tlg._shape)
+        # A fresh context, in case the exception left saved states behind
+        ctx = cairo.Context(self._cairo_surface)
 
         with NoMvc():
             Rect(0, 0, self.width, self.height, fill=None, border='red', borderWidth=2)
@@ -728,7 +978,7 @@ class App(object):
                 fill='red',
             )
 
-        self.redrawAll(self._screen, cairo_surface, ctx)
+        self.redrawAll(self._screen, self._cairo_surface, ctx)
 
     def getModifiers(self, modifierMask):
         modifiers = list()
@@ -775,7 +1025,61 @@ class App(object):
         modifiers = self.getModifiers(modifierMask)
         self.callUserFn('onKeyRelease', (key, modifiers))
 
+    def getDirtyRects(self, drawInspector):
+        # Returns the screen areas that changed since the last frame, or None
+        # if the whole screen has to be repainted
+        damage = shape_logic.activeDrawing.takeDamage()
+        fullRedraw = (
+            damage is None
+            or self._fullRedraw
+            or drawInspector
+            or self._drewInspector
+            or self.background != self._drawnBackground
+            # Drawing commands aren't tracked like shapes are
+            or self.drawCalls.commandsChanged
+        )
+        self._fullRedraw = False
+        self.drawCalls.commandsChanged = False
+        self._drewInspector = drawInspector
+        self._drawnBackground = self.background
+        if fullRedraw:
+            return None
+
+        screenRect = pygame.Rect(0, 0, self.width, self.height)
+        rects = []
+        damagedArea = 0
+        for left, top, right, bottom in damage:
+            left, top = math.floor(left), math.floor(top)
+            rect = pygame.Rect(
+                left, top, math.ceil(right) - left, math.ceil(bottom) - top
+            ).clip(screenRect)
+            if rect.width > 0 and rect.height > 0:
+                rects.append(rect)
+                damagedArea += rect.width * rect.height
+
+        # Past this point clipping costs more than it saves
+        if damagedArea > screenRect.width * screenRect.height * MAX_DAMAGED_FRACTION:
+            return None
+        if len(rects) > MAX_DIRTY_RECTS:
+            rects = [rects[0].unionall(rects[1:])]
+        return rects
+
     def redrawAll(self, screen, cairo_surface, ctx):
+        self._drawnChangeCount = shape_logic.activeDrawing.changeCount
+        self._calledUserFn = False
+        drawInspector = self.shouldDrawInspector()
+        dirtyRects = self.getDirtyRects(drawInspector)
+        # Group.draw leaves saved states on the stack, so restore() can't be
+        # relied on to drop the previous frame's clip
+        ctx.reset_clip()
+        if dirtyRects is not None:
+            if not dirtyRects:
+                self.frameworkRedrew = True
+                return
+            for rect in dirtyRects:
+                ctx.rectangle(*rect)
+            ctx.clip()
+
         shape = shape_logic.Rect(
             {
                 'noGroup': True,
@@ -790,30 +1094,42 @@ class App(object):
 
         ctx.save()
         try:
-            self._tlg._shape.draw(ctx)
+            self.drawCalls.drawFrame(self._tlg._shape, ctx)
         finally:
             ctx.restore()
 
         ctx.save()
         try:
-            if self.shouldDrawInspector():
+            if drawInspector:
                 self.inspector.draw(ctx)
         finally:
             ctx.restore()
 
-        # Get the cairo buffer and convert it from BGRA to RGBA
-        data_string = cairo_surface.get_data()
+        self.presentFrame(screen, cairo_surface, dirtyRects)
 
-        # Create PyGame surface
-        pygame_surface = pygame.image.frombuffer(
-            data_string, (self.width, self.height), 'RGBA'
-        )
+        self.frameworkRedrew = True
+
+    def presentFrame(self, screen, cairo_surface, dirtyRects):
+        cairo_surface.flush()
+        if self._headless:
+            return
 
-        # Show PyGame surface
-        screen.blit(pygame_surface, (0, 0))
-        pygame.display.flip()
+        # When cairo is drawing straight into the screen's pixels there is
+        # nothing to copy
+        if self._frameSurface is not None:
+            frameView = self._frameSurface.get_view('0')
+            memoryview(frameView)[:] = cairo_surface.get_data()
+            del frameView  # Unlocks the surface so that it can be blitted
+            if dirtyRects is None:
+                screen.blit(self._frameSurface, (0, 0))
+            else:
+                for rect in dirtyRects:
+                    screen.blit(self._frameSurface, rect, rect)
 
-        self.frameworkRedrew = True
+        if dirtyRects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirtyRects)
 
     def shouldDrawInspector(self):
         return self.inspectorEnabled and (
@@ -835,7 +1151,25 @@ class App(object):
         self._modifiers = set()
         self.background = None
 
+        self._fullRedraw = True
+        self._drewInspector = False
+        self._drawnBackground = None
+        self._drawnChangeCount = None
+        # Whether any user function was called since the last frame
+        self._calledUserFn = True
+
+        self._screen = None
+        self._screenView = None
+        self._frameSurface = None
+        self._cairo_surface = None
+        self._ctx = None
+
         self._stepsPerSecond = 30
+        self._fixedTimestep = False
+        self._coalesceMouseMoves = False
+        # Milliseconds of steps that are due but haven't run yet
+        self._stepBacklog = 0
+        self._droppedFrames = 0
 
         self._tlg = Group()
         sli.setTopLevelGroup(self._tlg)
@@ -853,6 +1187,15 @@ class App(object):
 
         self._isMvc = False
         self._ranWithScreens = False
+        self.drawCalls = DrawCallReconciler()
+        # The process that shows getTextInput and showMessage modals
+        self._modalProcess = None
+
+        # Headless apps draw into an offscreen surface, without a window, and
+        # are driven by app.step and app.renderFrame instead of a main loop
+        self._headless = 'CMU_GRAPHICS_HEADLESS' in __main__.__dict__ or bool(
+            os.environ.get('CMU_GRAPHICS_HEADLESS')
+        )
 
     def get_group(self):
         return self._tlg
@@ -879,6 +1222,33 @@ class App(object):
 
     stepsPerSecond = property(getStepsPerSecond, setStepsPerSecond)
 
+    def getFixedTimestep(self):
+        return self._fixedTimestep
+
+    def setFixedTimestep(self, value):
+        shape_logic.checkBoolean(sli.t('app'), 'fixedTimestep', value, False)
+        self._fixedTimestep = value
+        self._stepBacklog = 0
+
+    fixedTimestep = property(getFixedTimestep, setFixedTimestep)
+
+    def getCoalesceMouseMoves(self):
+        return self._coalesceMouseMoves
+
+    def setCoalesceMouseMoves(self, value):
+        shape_logic.checkBoolean(sli.t('app'), 'coalesceMouseMoves', value, False)
+        self._coalesceMouseMoves = value
+
+    coalesceMouseMoves = property(getCoalesceMouseMoves, setCoalesceMouseMoves)
+
+    def getDroppedFrames(self):
+        return self._droppedFrames
+
+    def setDroppedFrames(self, _):
+        raise Exception('App.droppedFrames is readonly')
+
+    droppedFrames = property(getDroppedFrames, setDroppedFrames)
+
     def getBackground(self):
         return sli.slGetAppProperty('background')
 
@@ -895,6 +1265,35 @@ class App(object):
 
     maxShapeCount = property(getMaxShapeCount, setMaxShapeCount)
 
+    def getIncrementalRedraw(self):
+        return shape_logic.activeDrawing.damage is not None
+
+    def setIncrementalRedraw(self, value):
+        shape_logic.checkBoolean(sli.t('app'), 'incrementalRedraw', value, False)
+        shape_logic.activeDrawing.setDamageTracking(value)
+        self._fullRedraw = True
+
+    incrementalRedraw = property(getIncrementalRedraw, setIncrementalRedraw)
+
+    def getImmediateMode(self):
+        return self.drawCalls.immediateMode
+
+    def setImmediateMode(self, value):
+        shape_logic.checkBoolean(sli.t('app'), 'immediateMode', value, False)
+        self.drawCalls.immediateMode = value
+
+    immediateMode = property(getImmediateMode, setImmediateMode)
+
+    def getTextCacheSize(self):
+        return shape_logic.textDimsCache.maxSize
+
+    def setTextCacheSize(self, value):
+        shape_logic.checkInt(sli.t('app'), 'textCacheSize', value, False)
+        shape_logic.checkNonNegative(sli.t('app'), 'textCacheSize', value, False)
+        shape_logic.setTextCacheSize(value)
+
+    textCacheSize = property(getTextCacheSize, setTextCacheSize)
+
     def updateScreenSize(self):
         if self._running:
             self.updateScreen(True)
@@ -976,30 +1375,38 @@ class App(object):
     def getTextInput(self, prompt='Enter some text'):
         if self.textInputs:
             return self.textInputs.pop(0)
-        p = self.spawnModalProcess()
-        packet = bytes(
-            json.dumps({'title': self.title, 'prompt': prompt, 'getInput': True})
-            + '\n',
-            encoding='utf-8',
+        response = self.showModal(
+            {'title': self.title, 'prompt': prompt, 'getInput': True}
         )
-        result, errors = p.communicate(packet)
-        if p.returncode is not None and p.returncode != 0:
-            print(errors.decode('utf-8'))
+        if 'result' not in response:
+            print(response.get('error', ''))
             raise Exception('Exception in getTextInput.')
-        return result.decode('utf-8')
+        return response['result']
 
     def showMessage(self, prompt=''):
-        p = self.spawnModalProcess()
-        packet = bytes(
-            json.dumps({'title': self.title, 'prompt': prompt, 'getInput': False})
-            + '\n',
-            encoding='utf-8',
+        response = self.showModal(
+            {'title': self.title, 'prompt': prompt, 'getInput': False}
         )
-        unused_result, errors = p.communicate(packet)
-        if p.returncode is not None and p.returncode != 0:
-            print(errors.decode('utf-8'))
+        if 'result' not in response:
+            print(response.get('error', ''))
             raise Exception('Exception in showMessage.')
 
+    def showModal(self, request):
+        # Sends request to the modal worker and returns its response
+        p = self.startModalProcess()
+        packet = bytes(json.dumps(request) + '\n', encoding='utf-8')
+        try:
+            p.stdin.write(packet)
+            p.stdin.flush()
+            line = p.stdout.readline()
+        except OSError:
+            line = b''
+        if not line:
+            # The worker died, and printed why to stderr
+            self._modalProcess = None
+            return {'error': 'The modal window closed unexpectedly.'}
+        return json.loads(line.decode('utf-8'))
+
     def setTextInputs(self, *args):
         for arg in args:
             if not isinstance(arg, str):
@@ -1009,30 +1416,220 @@ class App(object):
                 )
         self.textInputs = list(args)
 
+    def startModalProcess(self):
+        # Starts the modal worker unless it's already running. run() calls
+        # this before its main loop, since starting Python and importing
+        # pygame and cairo takes about a second, and the worker is then kept
+        # running for every modal. Popen returns as soon as the process is
+        # started, so the app doesn't wait for those imports.
+        p = self._modalProcess
+        if p is None or p.poll() is not None:
+            p = self._modalProcess = self.spawnModalProcess()
+        return p
+
+    def stopModalProcess(self):
+        # Closing stdin ends the worker's request loop. Interpreters like IDLE
+        # outlive the app, so the worker is waited for rather than left idle
+        # until its Popen is garbage collected.
+        p = self._modalProcess
+        if p is None:
+            return
+        self._modalProcess = None
+        try:
+            p.stdin.close()
+        except OSError:
+            pass
+        p.wait()
+        p.stdout.close()
+
     def spawnModalProcess(self):
         current_directory = os.path.dirname(os.path.realpath(__file__))
         modal_path = os.path.join(current_directory, 'modal.py')
+        # The worker reports errors in its responses, and shares stderr so
+        # that nothing it prints can fill up a pipe
         p = subprocess.Popen(
-            [sys.executable, modal_path],
+            [sys.executable, modal_path, '--worker'],
             stdout=subprocess.PIPE,
             stdin=subprocess.PIPE,
-            stderr=subprocess.PIPE,
             cwd=current_directory,
         )
         return p
 
     def updateScreen(self, newScreen):
+        self._fullRedraw = True
+        # The frame buffer may point into the old screen's pixels, which
+        # pygame frees when the window changes
+        self.releaseFrameBuffer()
+        if self._headless:
+            self._screen = None
+            self._cairo_surface = cairo.ImageSurface(
+                cairo.FORMAT_ARGB32, self.width, self.height
+            )
+            self._ctx = cairo.Context(self._cairo_surface)
+            return
         if newScreen:
             self._screen = pygame.display.set_mode(
                 (self.width, self.height), pygame.RESIZABLE
             )
-        self._cairo_surface = cairo.ImageSurface(
-            cairo.FORMAT_ARGB32, self.width, self.height
-        )
+        else:
+            self._screen = pygame.display.get_surface()
+        self.createFrameBuffer()
+
+    def createFrameBuffer(self):
+        screen = self._screen
+        width, height = screen.get_size()
+        if (
+            screen.get_bitsize() == 32
+            and screen.get_masks()[:3] == CAIRO_ARGB32_MASKS[:3]
+            and screen.get_pitch() == width * 4
+        ):
+            # The screen stores its pixels exactly like cairo does, so cairo
+            # can draw into them directly
+            self._screenView = screen.get_view('0')
+            self._cairo_surface = cairo.ImageSurface.create_for_data(
+                self._screenView, cairo.FORMAT_ARGB32, width, height, width * 4
+            )
+            self._frameSurface = None
+        else:
+            self._cairo_surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+            # Shares cairo's pixel layout so that each frame is a plain copy,
+            # and has no alpha so that blitting it doesn't blend
+            self._frameSurface = pygame.Surface(
+                (width, height), 0, 32, CAIRO_ARGB32_MASKS[:3] + (0,)
+            )
         self._ctx = cairo.Context(self._cairo_surface)
 
+    def releaseFrameBuffer(self):
+        if self._cairo_surface is not None:
+            self._cairo_surface.finish()
+        self._ctx = self._cairo_surface = None
+        self._screenView = self._frameSurface = None
+
+    def startHeadless(self):
+        self._headless = True
+        self._running = True
+        self.updateScreen(True)
+
+    def step(self, n=1):
+        # Runs n steps right away, as if the main loop's timer had fired n
+        # times. Nothing is drawn until renderFrame is called.
+        with DRAWING_LOCK:
+            for _ in range(n):
+                self.doStep()
+
+    def renderFrame(self):
+        # Draws the app and returns the cairo ImageSurface it was drawn into.
+        # Apps that haven't been run are drawn offscreen.
+        with DRAWING_LOCK:
+            if self._ctx is None:
+                self.startHeadless()
+            self.inspector.clearCache()
+            self.redrawAll(self._screen, self._cairo_surface, self._ctx)
+            return self._cairo_surface
+
+    def doStep(self):
+        # Returns whether the app stepped, which it doesn't while paused or
+        # stopped
+        if self.paused or self.stopped:
+            return False
+        self.callUserFn('onStep', ())
+        if len(self._allKeysDown) > 0:
+            self.callUserFn(
+                'onKeyHold',
+                (list(self._allKeysDown), list(self._modifiers)),
+            )
+        onStepEvent.send_robust(self.callUserFn, self._wrapper)
+        return True
+
+    def needsSteps(self):
+        # Whether running a step would do anything, so that the main loop has
+        # to wake up for every step
+        if self.paused or self.stopped:
+            return False
+        return (
+            self.getFnNameAndLanguage('onStep')[0] is not None
+            or (
+                len(self._allKeysDown) > 0
+                and self.getFnNameAndLanguage('onKeyHold')[0] is not None
+            )
+            or len(onStepEvent.receivers) > 0
+        )
+
+    def hasUndrawnChanges(self):
+        return (
+            self._fullRedraw
+            or self._calledUserFn
+            or self._drawnChangeCount != shape_logic.activeDrawing.changeCount
+            or self.background != self._drawnBackground
+        )
+
+    @staticmethod
+    def waitForEvents(ms):
+        # Sleeps until an event comes in or ms milliseconds pass, and returns
+        # the event (if any) in a list
+        if ms <= 0:
+            return []
+        event = pygame.event.wait(ms)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event]
+
+    @staticmethod
+    def isSameMotion(event, nextEvent):
+        # Whether nextEvent continues the move or drag that event is part of
+        return (
+            nextEvent is not None
+            and nextEvent.type == pygame.MOUSEMOTION
+            and nextEvent.buttons == event.buttons
+        )
+
+    def callMouseMotionFn(self, event, points):
+        # Calls onMouseMove or onMouseDrag for event. With
+        # app.coalesceMouseMoves, points holds every position the mouse moved
+        # through since the last call, and is passed to handlers that take
+        # one more argument than usual.
+        if event.buttons == (0, 0, 0):
+            enFnName = 'onMouseMove'
+            args = event.pos
+        else:
+            enFnName = 'onMouseDrag'
+            args = (*event.pos, [i for i in range(3) if event.buttons[i] != 0])
+        if points is not None:
+            fnName, _ = self.getFnNameAndLanguage(enFnName)
+            argCount = len(args) + (1 if self._isMvc else 0)
+            if (
+                fnName is not None
+                and self.getPosArgCount(self.userGlobals[fnName]) > argCount
+            ):
+                args = (*args, points)
+        self.callUserFn(enFnName, args)
+
+    def takeFixedSteps(self, msPassed):
+        # Runs the steps that came due in the last msPassed milliseconds, so
+        # that steps keep to stepsPerSecond however long frames take to draw.
+        # Returns how many steps ran, which is none while paused or stopped.
+        stepMs = 1000 / self.stepsPerSecond
+        self._stepBacklog = min(
+            self._stepBacklog + msPassed, stepMs * MAX_CATCH_UP_STEPS
+        )
+        steps = 0
+        while self._stepBacklog >= stepMs:
+            self._stepBacklog -= stepMs
+            if self.doStep():
+                steps += 1
+        if steps > 1:
+            # Only the last of the steps is drawn
+            self._droppedFrames += steps - 1
+        return steps
+
     @_safeMethod
     def run(self):
+        if self._headless:
+            self.startHeadless()
+            self.renderFrame()
+            return
+
+        self.startModalProcess()
         pygame.init()
         pygame.display.set_caption(self.title)
 
@@ -1040,13 +1637,17 @@ class App(object):
         self.updateScreen(True)
 
         lastTick = 0
+        lastLoopTick = pygame.time.get_ticks()
         self._running = True
+        waitedEvents = []
 
         while self._running:
             sys.stdout.flush()
             with DRAWING_LOCK:
                 had_event = False
-                for event in pygame.event.get():
+                events = waitedEvents + pygame.event.get()
+                motionPoints = []
+                for eventIndex, event in enumerate(events):
                     had_event = True
                     if not self.stopped:
                         if event.type == pygame.MOUSEBUTTONDOWN and event.button <= 3:
@@ -1058,16 +1659,18 @@ class App(object):
                                 'onMouseRelease', (*event.pos, event.button - 1)
                             )
                         elif event.type == pygame.MOUSEMOTION:
-                            if event.buttons == (0, 0, 0):
-                                self.callUserFn('onMouseMove', event.pos)
+                            if not self.coalesceMouseMoves:
+                                self.callMouseMotionFn(event, None)
                             else:
-                                self.callUserFn(
-                                    'onMouseDrag',
-                                    (
-                                        *event.pos,
-                                        [i for i in range(3) if event.buttons[i] != 0],
-                                    ),
+                                motionPoints.append(event.pos)
+                                nextEvent = (
+                                    events[eventIndex + 1]
+                                    if eventIndex + 1 < len(events)
+                                    else None
                                 )
+                                if not self.isSameMotion(event, nextEvent):
+                                    self.callMouseMotionFn(event, motionPoints)
+                                    motionPoints = []
                         elif event.type == pygame.KEYDOWN:
                             self.handleKeyPress(event.key, event.mod)
                         elif event.type == pygame.KEYUP:
@@ -1082,23 +1685,44 @@ class App(object):
                             self.isCtrlKeyDown = event.type == pygame.KEYDOWN
                     elif event.type == pygame.WINDOWSIZECHANGED:
                         self.handleResize(event.x, event.y)
+                    elif event.type == pygame.VIDEOEXPOSE:
+                        self._fullRedraw = True
 
                     pygameEvent.send_robust(event, self.callUserFn, self._wrapper)
 
                 should_redraw = had_event
-
-                msPassed = pygame.time.get_ticks() - lastTick
-                if 1000 / self.stepsPerSecond - msPassed < 1:
-                    lastTick = pygame.time.get_ticks()
-                    if not (self.paused or self.stopped):
-                        self.callUserFn('onStep', ())
-                        if len(self._allKeysDown) > 0:
-                            self.callUserFn(
-                                'onKeyHold',
-                                (list(self._allKeysDown), list(self._modifiers)),
-                            )
-                        onStepEvent.send_robust(self.callUserFn, self._wrapper)
-                        should_redraw = True
+                needsSteps = self.needsSteps()
+                waitMs = IDLE_WAIT_MS
+
+                if self.fixedTimestep:
+                    now = pygame.time.get_ticks()
+                    msPassed = now - lastLoopTick
+                    lastLoopTick = now
+                    if needsSteps:
+                        if self.takeFixedSteps(msPassed) > 0:
+                            should_redraw = True
+                        waitMs = 1000 / self.stepsPerSecond - self._stepBacklog
+                    else:
+                        self._stepBacklog = 0
+                else:
+                    now = pygame.time.get_ticks()
+                    if needsSteps:
+                        msPassed = now - lastTick
+                        waitMs = 1000 / self.stepsPerSecond - msPassed
+                        if waitMs < 1:
+                            lastTick = now
+                            waitMs = 1000 / self.stepsPerSecond
+                            if self.doStep():
+                                should_redraw = True
+                    else:
+                        # Nothing steps, so the time is counted from the last
+                        # loop instead of the last step
+                        msPassed = now - lastLoopTick
+                        lastTick = now
+                    lastLoopTick = now
+
+                if not should_redraw and self.hasUndrawnChanges():
+                    should_redraw = True
 
                 if should_redraw:
                     self.inspector.clearCache()
@@ -1106,8 +1730,11 @@ class App(object):
 
                 onMainLoopEvent.send_robust(msPassed, self.callUserFn, self._wrapper)
 
-                pygame.time.wait(1)
+            # Wait outside of the lock, so that the console can change shapes
+            waitedEvents = self.waitForEvents(int(waitMs))
 
+        self.releaseFrameBuffer()
+        self.stopModalProcess()
         pygame.quit()
         cleanAndClose()
 
@@ -1132,6 +1759,10 @@ class AppWrapper(object):
             'top',
             'setMaxShapeCount',
             'printFullTracebacks',
+            'step',
+            'renderFrame',
+            'getScreenshot',
+            'droppedFrames',
         ]
     )
     readWriteAttrs = set(
@@ -1146,6 +1777,11 @@ class AppWrapper(object):
             'beatsPerMinute',
             'maxShapeCount',
             'inspectorEnabled',
+            'incrementalRedraw',
+            'immediateMode',
+            'textCacheSize',
+            'fixedTimestep',
+            'coalesceMouseMoves',
         ]
     )
     allAttrs = readOnlyAttrs | readWriteAttrs
@@ -1162,13 +1798,13 @@ class AppWrapper(object):
         return sorted(fields)
 
     def __getattribute__(self, attr):
-        attr = toEnglish(attr, 'app-attr')
+        attr = englishAppAttrs.get(attr, attr)
         if attr == '_app' or attr not in AppWrapper.allAttrs:
             return super().__getattribute__(attr)
         return self._app.__getattribute__(attr)
 
     def __setattr__(self, attr, value):
-        attr = toEnglish(attr, 'app-attr')
+        attr = englishAppAttrs.get(attr, attr)
         if (attr != '_app') and (getattr(self._app, 'inRedrawAll', False)):
             raise MvcException(f'Cannot change app.{attr} in redrawAll')
         if attr in AppWrapper.readOnlyAttrs:
@@ -1366,13 +2002,21 @@ def run():
     global MAINLOOP_RUN
     MAINLOOP_RUN = True
 
+    if app._app._headless:
+        # There is no window to keep open, so control returns to the caller
+        app._app.run()
+        return
+
     if not os.environ.get('CI', False):
         threading.Thread(target=CSAcademyConsole().interact).start()
 
     try:
         app._app.run()
     except KeyboardInterrupt:
+        app._app.stopModalProcess()
         cleanAndClose()
+    # run() returns here when the app raised, and its error screen is shown
+    app._app.stopModalProcess()
 
 
 from code import InteractiveConsole
@@ -1429,6 +2073,7 @@ from datetime import datetime
 from datetime import timedelta
 import json
 import subprocess
+import threading
 from cmu_graphics.libs import webrequest
 import __main__
 
@@ -1438,6 +2083,11 @@ UPDATE_CONFIG_FILE_PATH = os.path.join(
     'meta',
     'updates.json',
 )
+UPDATE_VERSION_URL = (
+    'https://s3.amazonaws.com/cmu-cs-academy.lib.prod/desktop-cmu-graphics/version.txt'
+)
+# Seconds to wait for the latest version number before giving up
+UPDATE_CHECK_TIMEOUT = 5
 
 
 def get_update_info():
@@ -1448,8 +2098,12 @@ def get_update_info():
 
 
 def save_update_info(update_info):
-    with open(UPDATE_CONFIG_FILE_PATH, 'w') as f:
+    # The check runs in a daemon thread, which can be stopped partway through
+    # when the app exits, so the file is replaced in one step
+    temp_path = UPDATE_CONFIG_FILE_PATH + '.tmp'
+    with open(temp_path, 'w') as f:
         f.write(json.dumps(update_info))
+    os.replace(temp_path, UPDATE_CONFIG_FILE_PATH)
 
 
 def check_for_update():
@@ -1466,9 +2120,7 @@ def check_for_update():
 
         if last_attempt is None or (datetime.now() - last_attempt > timedelta(days=1)):
             most_recent_version = (
-                webrequest.get(
-                    'https://s3.amazonaws.com/cmu-cs-academy.lib.prod/desktop-cmu-graphics/version.txt'
-                )
+                webrequest.get(UPDATE_VERSION_URL, timeout=UPDATE_CHECK_TIMEOUT)
                 .read()
                 .decode('ascii')
                 .strip()
@@ -1495,8 +2147,16 @@ def check_for_update():
         pass
 
 
+def start_update_check():
+    # The check can wait on the network, so it runs in the background instead
+    # of holding up the import. Any notice is printed when it finishes.
+    thread = threading.Thread(target=check_for_update, daemon=True)
+    thread.start()
+    return thread
+
+
 if 'CMU_GRAPHICS_NO_UPDATE' not in __main__.__dict__:
-    check_for_update()
+    start_update_check()
 
 
 def print_debug_info():
@@ -1552,6 +2212,10 @@ gradient = sli.gradient
 toEnglish = sli.toEnglish
 accentCombinations = sli.accentCombinations
 t = sli.t
+# toEnglish(attr, 'shape-attr') and toEnglish(attr, 'app-attr'), for the
+# attribute lookups that happen on every shape and app access
+englishShapeAttrs = shape_logic.getEnglishLookup('shape-attr')
+englishAppAttrs = shape_logic.getEnglishLookup('app-attr')
 
 SHAPES_CREATED = 0
 MAINLOOP_RUN = False
@@ -1,18 +1,265 @@
+import io
+import json
 import os
-import ssl
-import urllib.request
-
-def get(path):
-    headers = {'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.11 (KHTML, like Gecko) Chrome/23.0.1271.64 Safari/537.11',
-           'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-           'Accept-Charset': 'ISO-8859-1,utf-8;q=0.7,*;q=0.3',
-           'Accept-Encoding': 'none',
-           'Accept-Language': 'en-US,en;q=0.8',
-           'Connection': 'keep-alive'
-    }
+import sys
+import threading
+
+HEADERS = {'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.11 (KHTML, like Gecko) Chrome/23.0.1271.64 Safari/537.11',
+       'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+       'Accept-Charset': 'ISO-8859-1,utf-8;q=0.7,*;q=0.3',
+       'Accept-Encoding': 'none',
+       'Accept-Language': 'en-US,en;q=0.8',
+       'Connection': 'keep-alive'
+}
+MAX_REDIRECTS = 5
+
+def get_user_cache_dir():
+    # The installed package is often read-only, and pip uninstall would leave
+    # files it didn't install behind, so pip installs cache for each user
+    home = os.path.expanduser('~')
+    if sys.platform == 'win32':
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(home, 'AppData', 'Local')
+    elif sys.platform == 'darwin':
+        base = os.path.join(home, 'Library', 'Caches')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(home, '.cache')
+    return os.path.join(base, 'cmu_graphics', 'http_cache')
+
+# Responses fetched with cache=True are saved here, and revalidated with their
+# ETag or Last-Modified header the next time they're requested
+### ZIPFILE VERSION ###
+# The zip version is unpacked by the user, so it keeps its cache with it
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'meta', 'http_cache')
+### END ZIPFILE VERSION ###
+### PYPI VERSION ###
+CACHE_DIR = get_user_cache_dir()
+### END PYPI VERSION ###
+# After each save, the responses used longest ago are removed until the cache
+# is no bigger than this
+MAX_CACHE_BYTES = 50 * 1024 * 1024
+
+# Loading cacert.pem takes a while, so the context is made once and shared
+_ssl_context = None
+# Open connections that aren't in use, by (scheme, host, port)
+_idle_connections = {}
+_lock = threading.Lock()
+
+class Response(io.BytesIO):
+    def __init__(self, body, status, headers):
+        super().__init__(body)
+        self.status = status
+        self.headers = headers
+
+def get_ssl_context():
+    global _ssl_context
+    # ssl is slow to import, and most apps never make a request
+    import ssl
+
+    with _lock:
+        if _ssl_context is None:
+            # This is the January 2025 certifi cacert.pem
+            cafile_path = os.path.join(os.path.dirname(__file__), 'cacert.pem')
+            _ssl_context = ssl.create_default_context(cafile=cafile_path)
+        return _ssl_context
+
+def uses_proxy(url):
+    import urllib.request
+
+    scheme, host = url.scheme, url.hostname or ''
+    return scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(host)
+
+def urllib_get(path, headers, timeout):
+    import urllib.error
+    import urllib.request
+
     request = urllib.request.Request(path, headers=headers)
-    # This is the January 2025 certifi cacert.pem
-    cafile_path = os.path.join(os.path.dirname(__file__), 'cacert.pem')
-    context = ssl.create_default_context(cafile=cafile_path)
-    response = urllib.request.urlopen(request, context=context)
+    kwargs = {'context': get_ssl_context()}
+    if timeout is not None:
+        kwargs['timeout'] = timeout
+    try:
+        with urllib.request.urlopen(request, **kwargs) as response:
+            return Response(response.read(), response.status, response.headers)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return Response(b'', e.code, e.headers)
+        raise
+
+def take_connection(url, timeout):
+    import http.client
+    import socket
+
+    key = (url.scheme, url.hostname, url.port)
+    with _lock:
+        idle = _idle_connections.get(key)
+        if idle:
+            connection = idle.pop()
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout if timeout is not None else socket.getdefaulttimeout())
+            return key, connection, True
+
+    if timeout is None:
+        timeout = socket.getdefaulttimeout()
+    if url.scheme == 'https':
+        connection = http.client.HTTPSConnection(url.hostname, url.port, timeout=timeout,
+            context=get_ssl_context())
+    else:
+        connection = http.client.HTTPConnection(url.hostname, url.port, timeout=timeout)
+    return key, connection, False
+
+def pooled_get(url, headers, timeout):
+    # Sends the request over an open connection to the same host if there is
+    # one, so the TCP and TLS handshakes happen once per host
+    import http.client
+
+    target = url.path or '/'
+    if url.query:
+        target += '?' + url.query
+    while True:
+        key, connection, reused = take_connection(url, timeout)
+        try:
+            connection.request('GET', target, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+            break
+        except (http.client.HTTPException, ConnectionError):
+            connection.close()
+            # The server closed the idle connection or cut the response
+            # short, so try a new one
+            if not reused:
+                raise
+        except Exception:
+            connection.close()
+            raise
+
+    if response.will_close:
+        connection.close()
+    else:
+        with _lock:
+            _idle_connections.setdefault(key, []).append(connection)
+    return Response(body, response.status, response.headers)
+
+def request(path, headers, timeout):
+    import http.client
+    import urllib.error
+    import urllib.parse
+
+    for i in range(MAX_REDIRECTS + 1):
+        url = urllib.parse.urlsplit(path)
+        if url.scheme not in ('http', 'https') or uses_proxy(url):
+            return urllib_get(path, headers, timeout)
+        response = pooled_get(url, headers, timeout)
+        location = response.headers.get('Location')
+        if response.status in (301, 302, 303, 307, 308) and location:
+            path = urllib.parse.urljoin(path, location)
+            continue
+        if response.status >= 400:
+            raise urllib.error.HTTPError(path, response.status,
+                http.client.responses.get(response.status, ''), response.headers, None)
+        return response
+    raise urllib.error.HTTPError(path, response.status, 'Too many redirects', response.headers, None)
+
+def get_cache_paths(path):
+    import hashlib
+
+    name = hashlib.sha256(path.encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, name), os.path.join(CACHE_DIR, name + '.json')
+
+def read_cache(path):
+    body_path, info_path = get_cache_paths(path)
+    try:
+        with open(info_path, 'r') as f:
+            info = json.load(f)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, None
+    try:
+        # The info file's modified time is when the response was last used
+        os.utime(info_path)
+    except OSError:
+        pass
+    return info, body
+
+def trim_cache():
+    entries = []
+    total_size = 0
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        if not name.endswith('.json'):
+            continue
+        info_path = os.path.join(CACHE_DIR, name)
+        body_path = info_path[:-len('.json')]
+        try:
+            size = os.path.getsize(info_path) + os.path.getsize(body_path)
+            used_at = os.path.getmtime(info_path)
+        except OSError:
+            continue
+        entries.append((used_at, size, body_path, info_path))
+        total_size += size
+
+    entries.sort()
+    for used_at, size, body_path, info_path in entries:
+        if total_size <= MAX_CACHE_BYTES:
+            break
+        # Without its info file, a body is never read, so that goes first
+        for file_path in (info_path, body_path):
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+        total_size -= size
+
+def write_cache(path, response):
+    info = {'url': path}
+    if response.headers.get('ETag'):
+        info['etag'] = response.headers['ETag']
+    if response.headers.get('Last-Modified'):
+        info['last_modified'] = response.headers['Last-Modified']
+    if len(info) == 1:
+        return
+
+    body_path, info_path = get_cache_paths(path)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Each file is replaced in one step, so other apps never read half of it
+        for file_path, data, mode in [(body_path, response.getvalue(), 'wb'),
+                (info_path, json.dumps(info), 'w')]:
+            temp_path = '%s.%d.%d.tmp' % (file_path, os.getpid(), threading.get_ident())
+            with open(temp_path, mode) as f:
+                f.write(data)
+            os.replace(temp_path, file_path)
+    except OSError:
+        return
+    trim_cache()
+
+def get(path, timeout=None, cache=False):
+    import http.client
+    import urllib.error
+
+    headers = dict(HEADERS)
+    info, body = read_cache(path) if cache else (None, None)
+    if info is not None:
+        if 'etag' in info:
+            headers['If-None-Match'] = info['etag']
+        if 'last_modified' in info:
+            headers['If-Modified-Since'] = info['last_modified']
+
+    try:
+        response = request(path, headers, timeout)
+    except urllib.error.HTTPError:
+        raise
+    except (OSError, http.client.HTTPException):
+        # Use the saved copy when the server can't be reached or the
+        # response is cut short
+        if info is None:
+            raise
+        return Response(body, 200, {})
+
+    if response.status == 304 and info is not None:
+        return Response(body, 200, response.headers)
+    if cache and response.status == 200:
+        write_cache(path, response)
     return response
@@ -11,6 +11,8 @@ import pygame
 
 ### END PYPI VERSION ###
 import json
+import sys
+import traceback
 
 
 def roundedrec(ctx, x, y, w, h, radius_x=5, radius_y=5):
@@ -422,11 +424,18 @@ class TextBoxModal(object):
         self.button = Button(self)
 
         self.mouseIsDown = False
+        # The text entered, once the button is pressed
+        self.result = ''
 
         pygame.display.set_caption(self.title)
         pygame.init()
-
-        self.run()
+        try:
+            self.run()
+        finally:
+            # The worker shows its next modal with the same pygame, so it's
+            # shut down even when this one fails
+            pygame.display.quit()
+            pygame.quit()
 
     def get_height(self):
         return (self.dividerY - self.top) + self.inputHeight
@@ -503,7 +512,7 @@ class TextBoxModal(object):
 
     def execute(self):
         if self.textBox:
-            print(''.join(self.textBox.buf), end='')
+            self.result = ''.join(self.textBox.buf)
         self.running = False
 
     def run(self):
@@ -578,13 +587,34 @@ class TextBoxModal(object):
             self.redrawAll(screen, cairo_surface, ctx)
             pygame.display.flip()
 
-        pygame.display.quit()
-        pygame.quit()
+
+def runWorker():
+    # Shows a modal for each line of JSON read from stdin, and answers each
+    # with a line of JSON, so that Python only starts and imports pygame and
+    # cairo once however many modals an app shows
+    responses = sys.stdout
+    # Anything else that is printed would be mixed up with the responses
+    sys.stdout = sys.stderr
+    for line in sys.stdin:
+        request = json.loads(line)
+        try:
+            modal = TextBoxModal(
+                request['title'], request['prompt'], request['getInput']
+            )
+            response = {'result': modal.result}
+        except Exception:
+            response = {'error': traceback.format_exc()}
+        responses.write(json.dumps(response) + '\n')
+        responses.flush()
 
 
 def main():
+    if '--worker' in sys.argv[1:]:
+        runWorker()
+        return
     request = json.loads(input())
-    TextBoxModal(request['title'], request['prompt'], request['getInput'])
+    modal = TextBoxModal(request['title'], request['prompt'], request['getInput'])
+    print(modal.result, end='')
 
 
 if __name__ == '__main__':
@@ -1,5 +1,8 @@
 import math
 import copy
+import bisect
+import collections
+import random
 from cmu_graphics import cmu_graphics
 from cmu_graphics import utils
 
@@ -14,103 +17,59 @@ import pygame
 
 from cmu_graphics.libs import webrequest
 from io import BytesIO
-import array
 import sys
 import traceback
 import atexit
-import unicodedata
 import uuid
-import re
-
-# fmt: off
-# start_translate
-TRANSLATED_COLOR_NAMES = {'keys': ['aliceblue', 'antiquewhite', 'aqua', 'aquamarine', 'azure', 'beige', 'bisque', 'black', 'blanchedalmond', 'blue', 'blueviolet', 'brown', 'burlywood', 'cadetblue', 'chartreuse', 'chocolate', 'coral', 'cornsilk', 'cornflowerblue', 'crimson', 'cyan', 'darkblue', 'darkcyan', 'darkgoldenrod', 'darkgray', 'darkgreen', 'darkgrey', 'darkkhaki', 'darkmagenta', 'darkolivegreen', 'darkorange', 'darkorchid', 'darkred', 'darksalmon', 'darkseagreen', 'darkslateblue', 'darkslategray', 'darkslategrey', 'darkturquoise', 'darkviolet', 'deeppink', 'deepskyblue', 'dimgray', 'dimgrey', 'dodgerblue', 'firebrick', 'floralwhite', 'forestgreen', 'fuchsia', 'gainsboro', 'ghostwhite', 'gold', 'goldenrod', 'gray', 'green', 'greenyellow', 'grey', 'honeydew', 'hotpink', 'indianred', 'indigo', 'ivory', 'khaki', 'lavender', 'lavenderblush', 'lawngreen', 'lemonchiffon', 'lightblue', 'lightcoral', 'lightcyan', 'lightgoldenrodyellow', 'lightgray', 'lightgreen', 'lightgrey', 'lightpink', 'lightsalmon', 'lightseagreen', 'lightskyblue', 'lightslategray', 'lightslategrey', 'lightsteelblue', 'lightyellow', 'lime', 'limegreen', 'linen', 'magenta', 'maroon', 'mediumaquamarine', 'mediumblue', 'mediumorchid', 'mediumpurple', 'mediumseagreen', 'mediumslateblue', 'mediumspringgreen', 'mediumturquoise', 'mediumvioletred', 'midnightblue', 'mintcream', 'mistyrose', 'moccasin', 'navajowhite', 'navy', 'oldlace', 'olive', 'olivedrab', 'orange', 'orangered', 'orchid', 'palegoldenrod', 'palegreen', 'paleturquoise', 'palevioletred', 'papayawhip', 'peachpuff', 'peru', 'pink', 'plum', 'powderblue', 'purple', 'red', 'rosybrown', 'royalblue', 'saddlebrown', 'salmon', 'sandybrown', 'seagreen', 'seashell', 'sienna', 'silver', 'skyblue', 'slateblue', 'slategray', 'slategrey', 'snow', 'springgreen', 'steelblue', 'tan', 'teal', 'thistle', 'tomato', 'turquoise', 'violet', 'wheat', 'white', 'whitesmoke', 'yellow', 'yellowgreen'], 'es': {'aliceblue': 'azulalica', 'antiquewhite': 'blancoantiguo', 'aqua': 'agua', 'aquamarine': 'aguamarina', 'azure': 'azur', 'beige': 'beige', 'bisque': 'bisque', 'black': 'negro', 'blanchedalmond': 'almendrablanqueada', 'blue': 'azul', 'blueviolet': 'azulvioleta', 'brown': 'marrón', 'burlywood': 'madera', 'cadetblue': 'azulcadete', 'chartreuse': 'verdeamarillento', 'chocolate': 'chocolate', 'coral': 'coral', 'cornsilk': 'maizseda', 'cornflowerblue': 'azualaciano', 'crimson': 'carmesí', 'cyan': 'cian', 'darkblue': 'azuloscuro', 'darkcyan': 'cianoscuro', 'darkgoldenrod': 'varilladoradaoscura', 'darkgray': 'grisoscuro', 'darkgreen': 'verdeoscuro', 'darkgrey': 'grisoscuro', 'darkkhaki': 'caquioscuro', 'darkmagenta': 'magentaoscuro', 'darkolivegreen': 'verdeolivaoscuro', 'darkorange': 'naranjaoscuro', 'darkorchid': 'orquídeaoscura', 'darkred': 'rojooscuro', 'darksalmon': 'salmónoscuro', 'darkseagreen': 'marverdeoscuro', 'darkslateblue': 'azulpizarraoscuro', 'darkslategray': 'grispizarraoscuro', 'darkslategrey': 'grispizarraoscuro', 'darkturquoise': 'turquesaoscuro', 'darkviolet': 'violetaoscuro', 'deeppink': 'rosadoprofundo', 'deepskyblue': 'azulcieloprofundo', 'dimgray': 'gristurbio', 'dimgrey': 'gristurbio', 'dodgerblue': 'azulgandul', 'firebrick': 'ladrillo', 'floralwhite': 'blancofloral', 'forestgreen': 'verdebosque', 'fuchsia': 'fucsia', 'gainsboro': 'gainsboro', 'ghostwhite': 'blancofantasma', 'gold': 'oro', 'goldenrod': 'varilladorada', 'gray': 'gris', 'green': 'verde', 'greenyellow': 'verdeamarillo', 'grey': 'gris', 'honeydew': 'melón', 'hotpink': 'rosadofuerte', 'indianred': 'rojoindio', 'indigo': 'índigo', 'ivory': 'marfil', 'khaki': 'caqui', 'lavender': 'lavanda', 'lavenderblush': 'ruborlavanda', 'lawngreen': 'cespedverde', 'lemonchiffon': 'limónchifón', 'lightblue': 'azulclaro', 'lightcoral': 'coralclaro', 'lightcyan': 'cianclaro', 'lightgoldenrodyellow': 'varilladoradaclaraamarilla', 'lightgray': 'grisclaro', 'lightgreen': 'verdeclaro', 'lightgrey': 'grisclaro', 'lightpink': 'rosadoclaro', 'lightsalmon': 'salmónclaro', 'lightseagreen': 'marverdeclaro', 'lightskyblue': 'azulcieloclaro', 'lightslategray': 'grispizarraclaro', 'lightslategrey': 'grispizarraclaro', 'lightsteelblue': 'azulaceroclaro', 'lightyellow': 'amarilloclaro', 'lime': 'lima', 'limegreen': 'limaverde', 'linen': 'lino', 'magenta': 'magenta', 'maroon': 'granate', 'mediumaquamarine': 'aguamarinamedio', 'mediumblue': 'azulmedio', 'mediumorchid': 'orquídeamedio', 'mediumpurple': 'púrpuramedio', 'mediumseagreen': 'marverdemedio', 'mediumslateblue': 'pizarraazulmedio', 'mediumspringgreen': 'verdeprimaveramedio', 'mediumturquoise': 'turquesamedio', 'mediumvioletred': 'violetarojomedio', 'midnightblue': 'azulmedianoche', 'mintcream': 'cremamenta', 'mistyrose': 'nebulosarosa', 'moccasin': 'mocasín', 'navajowhite': 'blanconaranja', 'navy': 'azulmarino', 'oldlace': 'cordónviejo', 'olive': 'oliva', 'olivedrab': 'verdemilitar', 'orange': 'naranja', 'orangered': 'rojonaranja', 'orchid': 'orquídea', 'palegoldenrod': 'varilladoradapálida', 'palegreen': 'verdepálido', 'paleturquoise': 'turquesapálido', 'palevioletred': 'rojovioletapálido', 'papayawhip': 'látigodepapaya', 'peachpuff': 'durazno', 'peru': 'naranjamarrón', 'pink': 'rosado', 'plum': 'ciruela', 'powderblue': 'azulpolvo', 'purple': 'púrpura', 'red': 'rojo', 'rosybrown': 'marrónrosado', 'royalblue': 'azulreal', 'saddlebrown': 'marróncuero', 'salmon': 'salmón', 'sandybrown': 'marrónarenoso', 'seagreen': 'marverde', 'seashell': 'caracol', 'sienna': 'tierra', 'silver': 'plateado', 'skyblue': 'azulcielo', 'slateblue': 'azulpizarra', 'slategray': 'grispizarra', 'slategrey': 'grispizarra', 'snow': 'nieve', 'springgreen': 'verdeprimavera', 'steelblue': 'azulacero', 'tan': 'bronceado', 'teal': 'verdeazulado', 'thistle': 'cardo', 'tomato': 'tomate', 'turquoise': 'turquesa', 'violet': 'violeta', 'wheat': 'trigo', 'white': 'blanco', 'whitesmoke': 'humoblanco', 'yellow': 'amarillo', 'yellowgreen': 'amarilloverde'}, 'de': {'aliceblue': 'aliceblau', 'antiquewhite': 'altweiß', 'aqua': 'wasser', 'aquamarine': 'aquamarin', 'azure': 'azurblau', 'beige': 'beige', 'bisque': 'biskuit', 'black': 'schwarz', 'blanchedalmond': 'bleichemandel', 'blue': 'blau', 'blueviolet': 'blauviolett', 'brown': 'braun', 'burlywood': 'wurzelholz', 'cadetblue': 'kadettenblau', 'chartreuse': 'chartreuse', 'chocolate': 'schokolade', 'coral': 'koralle', 'cornsilk': 'maisseide', 'cornflowerblue': 'kornfeldblau', 'crimson': 'purpur', 'cyan': 'cyan', 'darkblue': 'dunkelblau', 'darkcyan': 'dunkelcyan', 'darkgoldenrod': 'dunkelgoldrute', 'darkgray': 'dunkelgrau', 'darkgreen': 'dunkelgrün', 'darkgrey': 'dunkelgrau', 'darkkhaki': 'dunkelkhaki', 'darkmagenta': 'dunkelmagenta', 'darkolivegreen': 'dunkelolivegrün', 'darkorange': 'dunkelorange', 'darkorchid': 'dunkeorchidee', 'darkred': 'dunkelrot', 'darksalmon': 'dunkellachs', 'darkseagreen': 'dunkelseegrün', 'darkslateblue': 'dunkelschieferblau', 'darkslategray': 'dunkelschiefergrau', 'darkslategrey': 'dunkelschiefergraube', 'darkturquoise': 'dunkeltürkis', 'darkviolet': 'dunkelviolett', 'deeppink': 'dunkelrosa', 'deepskyblue': 'dunkelhimmelblau', 'dimgray': 'mittelgrau', 'dimgrey': 'mittelgraube', 'dodgerblue': 'dodgerblau', 'firebrick': 'backstein', 'floralwhite': 'blütenweiß', 'forestgreen': 'waldgrün', 'fuchsia': 'fuchsie', 'gainsboro': 'gainsboro', 'ghostwhite': 'geisterweiß', 'gold': 'gold', 'goldenrod': 'goldrute', 'gray': 'grau', 'green': 'grün', 'greenyellow': 'grüngelb', 'grey': 'graube', 'honeydew': 'honigtau', 'hotpink': 'kräftigpink', 'indianred': 'indischrot', 'indigo': 'indigo', 'ivory': 'eisen', 'khaki': 'khaki', 'lavender': 'lavendel', 'lavenderblush': 'lavendelröte', 'lawngreen': 'rasengrün', 'lemonchiffon': 'zitronenchiffon', 'lightblue': 'hellblau', 'lightcoral': 'hellkoralle', 'lightcyan': 'hellcyan', 'lightgoldenrodyellow': 'leichtgoldrutengelb', 'lightgray': 'hellgrau', 'lightgreen': 'hellgrün', 'lightgrey': 'hellgraube', 'lightpink': 'hellrosa', 'lightsalmon': 'helllachs', 'lightseagreen': 'hellseegrün', 'lightskyblue': 'hellhimmelblau', 'lightslategray': 'hellschiefergrau', 'lightslategrey': 'hellschiefergraube', 'lightsteelblue': 'hellstahlblau', 'lightyellow': 'hellgelb', 'lime': 'limette', 'limegreen': 'limettengrün', 'linen': 'leinen', 'magenta': 'magenta', 'maroon': 'kastanie', 'mediumaquamarine': 'mittelaquamarine', 'mediumblue': 'mittelblau', 'mediumorchid': 'mittelorchidee', 'mediumpurple': 'mittelviolett', 'mediumseagreen': 'mittelseegrün', 'mediumslateblue': 'mittelschieferblau', 'mediumspringgreen': 'mittelfrühlingsgrün', 'mediumturquoise': 'mitteltürkis', 'mediumvioletred': 'mittelviolettrot', 'midnightblue': 'mitternachtsblau', 'mintcream': 'mintcreme', 'mistyrose': 'nebligrose', 'moccasin': 'mokassin', 'navajowhite': 'navajoweiß', 'navy': 'marineblau', 'oldlace': 'altgold', 'olive': 'olive', 'olivedrab': 'trübolive', 'orange': 'orange', 'orangered': 'orangerot', 'orchid': 'orchidee', 'palegoldenrod': 'blassegoldrute', 'palegreen': 'blassgrün', 'paleturquoise': 'blasstürkis', 'palevioletred': 'blasslilarot', 'papayawhip': 'papayafarben', 'peachpuff': 'pfirsich', 'peru': 'peru', 'pink': 'rosa', 'plum': 'pflaume', 'powderblue': 'taubenblau', 'purple': 'lila', 'red': 'rot', 'rosybrown': 'rostbraun', 'royalblue': 'köningsblau', 'saddlebrown': 'sattelbraun', 'salmon': 'lachs', 'sandybrown': 'sandbraun', 'seagreen': 'seegrün', 'seashell': 'muschel', 'sienna': 'sienna', 'silver': 'silber', 'skyblue': 'himmelblau', 'slateblue': 'schieferblau', 'slategray': 'schiefergrau', 'slategrey': 'schiefergraube', 'snow': 'schneeweiß', 'springgreen': 'frühlingsgrün', 'steelblue': 'stahlblau', 'tan': 'gelbbraun', 'teal': 'petrol', 'thistle': 'diestel', 'tomato': 'tomate', 'turquoise': 'türkis', 'violet': 'violett', 'wheat': 'weizen', 'white': 'weiß', 'whitesmoke': 'weißerrauch', 'yellow': 'gelb', 'yellowgreen': 'gelbgrün'}}
-TRANSLATED_GRADIENT_STARTS = {'keys': ['top-left', 'top-right', 'bottom-left', 'bottom-right', 'left-top', 'top', 'right-top', 'left', 'center', 'right', 'left-bottom', 'bottom', 'right-bottom'], 'es': {'top-left': 'superior-izquierda', 'top-right': 'superior-derecha', 'bottom-left': 'inferior-izquierda', 'bottom-right': 'inferior-derecha', 'left-top': 'izquierda-superior', 'top': 'superior', 'right-top': 'derecha-superior', 'left': 'izquierda', 'center': 'centro', 'right': 'derecha', 'left-bottom': 'izquierda-inferior', 'bottom': 'inferior', 'right-bottom': 'derecha-inferior'}, 'de': {'top-left': 'oben-links', 'top-right': 'oben-rechts', 'bottom-left': 'unten-links', 'bottom-right': 'unten-rechts', 'left-top': 'links-oben', 'top': 'oben', 'right-top': 'rechts-oben', 'left': 'links', 'center': 'mitte', 'right': 'rechts', 'left-bottom': 'links-unten', 'bottom': 'unten', 'right-bottom': 'rechts-unten'}}
-TRANSLATED_ALIGNS = {'keys': ['left-top', 'top', 'right-top', 'left', 'center', 'right', 'left-bottom', 'bottom', 'right-bottom', 'top-left', 'top-right', 'bottom-left', 'bottom-right'], 'es': {'left-top': 'izquierda-superior', 'top': 'superior', 'right-top': 'derecha-superior', 'left': 'izquierda', 'center': 'centro', 'right': 'derecha', 'left-bottom': 'izquierda-inferior', 'bottom': 'inferior', 'right-bottom': 'derecha-inferior', 'top-left': 'superior-izquierda', 'top-right': 'superior-derecha', 'bottom-left': 'inferior-izquierda', 'bottom-right': 'inferior-derecha'}, 'de': {'left-top': 'links-oben', 'top': 'oben', 'right-top': 'rechts-oben', 'left': 'links', 'center': 'mitte', 'right': 'rechts', 'left-bottom': 'links-unten', 'bottom': 'unten', 'right-bottom': 'rechts-unten', 'top-left': 'oben-links', 'top-right': 'oben-rechts', 'bottom-left': 'unten-links', 'bottom-right': 'unten-rechts'}}
-TRANSLATED_SHAPE_ATTRS = {'keys': ['group', 'play', 'pause', 'loop', 'restart', 'remove', 'bold', 'opacity', 'centerX', 'hits', 'borderWidth', 'centerY', 'url', 'left', 'add', 'points', 'startAngle', 'toBack', 'x2', 'y1', 'size', 'initialPoints', 'top', 'align', 'dashes', 'right', 'start', 'y2', 'radius', 'border', 'containsShape', 'background', 'height', 'lineWidth', 'toFront', 'roundness', 'arrowEnd', 'x1', 'fill', 'bottom', 'clear', 'sweepAngle', 'value', 'contains', 'italic', 'visible', 'arrowStart', 'hitsShape', 'font', 'children', 'hitTest', 'width', 'rotateAngle', 'red', 'blue', 'green'], 'es': {'group': 'grupo', 'play': 'toca', 'pause': 'pausa', 'loop': 'repetir', 'restart': 'reiniciar', 'remove': 'quitar', 'bold': 'negrito', 'opacity': 'opacidad', 'centerX': 'centroX', 'hits': 'toca', 'borderWidth': 'anchuraDeBorde', 'centerY': 'centroY', 'url': 'url', 'left': 'izquierda', 'add': 'agregar', 'points': 'puntos', 'startAngle': 'ánguloInicial', 'toBack': 'alFondo', 'x2': 'x2', 'y1': 'y1', 'size': 'tamaño', 'initialPoints': 'puntosIniciales', 'top': 'superior', 'align': 'alinear', 'dashes': 'guión', 'right': 'derecha', 'start': 'inicio', 'colors': 'colores', 'y2': 'y2', 'radius': 'radio', 'border': 'borde', 'containsShape': 'contieneFigura', 'background': 'fondo', 'height': 'altura', 'lineWidth': 'anchuraDeLínea', 'toFront': 'alFrente', 'roundness': 'redondez', 'arrowEnd': 'finalDeFlecha', 'x1': 'x1', 'fill': 'relleno', 'bottom': 'inferior', 'clear': 'vaciar', 'sweepAngle': 'ánguloDeBarrido', 'value': 'valor', 'contains': 'contiene', 'italic': 'itálica', 'visible': 'visible', 'arrowStart': 'inicioDeFlecha', 'hitsShape': 'tocaFigura', 'font': 'fuente', 'children': 'hijos', 'hitTest': 'tocarPrueba', 'width': 'ancho', 'rotateAngle': 'rotarÁngulo', 'red': 'red', 'blue': 'blue', 'green': 'green'}, 'de': {'group': 'gruppe', 'play': 'abspielen', 'pause': 'pausieren', 'loop': 'wiederholen', 'restart': 'neustarten', 'remove': 'entferne', 'bold': 'fett', 'opacity': 'deckkraft', 'centerX': 'mitteX', 'hits': 'trifft', 'borderWidth': 'randBreite', 'centerY': 'mitteY', 'url': 'url', 'left': 'links', 'add': 'fügeHinzu', 'points': 'punkte', 'startAngle': 'anfangsWinkel', 'toBack': 'nachHinten', 'x2': 'x2', 'y1': 'y1', 'size': 'größe', 'initialPoints': 'startPunkte', 'top': 'oben', 'align': 'ausrichtung', 'dashes': 'gestrichelt', 'right': 'rechts', 'start': 'start', 'y2': 'y2', 'radius': 'radius', 'border': 'rand', 'containsShape': 'beinhaltetForm', 'background': 'hintergrund', 'height': 'höhe', 'lineWidth': 'linienBreite', 'toFront': 'nachVorn', 'roundness': 'rundung', 'arrowEnd': 'pfeilEnde', 'x1': 'x1', 'fill': 'füllen', 'bottom': 'unten', 'clear': 'leeren', 'sweepAngle': 'krümmungsWinkel', 'value': 'wert', 'contains': 'beinhaltet', 'italic': 'kursiv', 'visible': 'sichtbar', 'arrowStart': 'pfeilStart', 'hitsShape': 'trifftForm', 'font': 'schriftart', 'children': 'kinder', 'hitTest': 'treffenTest', 'width': 'breite', 'rotateAngle': 'drehWinkel', 'red': 'red', 'blue': 'blue', 'green': 'green'}}
-TRANSLATED_BOOLEANS = {'keys': ['True', 'False'], 'es': {'True': 'Verdadero', 'False': 'Falso'}, 'de': {'True': 'Wahr', 'False': 'Falsch'}}
-TRANSLATED_GLOBALS = {'keys': ['Arc', 'Circle', 'Group', 'Image', 'Label', 'Line', 'Oval', 'Polygon', 'Rect', 'RegularPolygon', 'Robot', 'Sound', 'Star', 'almostEqual', 'angleTo', 'app', 'assertEqual', 'choice', 'distance', 'fromPythonAngle', 'getPointInDir', 'gradient', 'makeList', 'onKeyHolds', 'onSteps', 'print', 'pythonRound', 'random', 'randrange', 'rgb', 'round', 'rounded', 'seed', 'toPythonAngle', 'onKeyPresses', 'CMUImage'], 'es': {'Arc': 'Arco', 'Circle': 'Círculo', 'Group': 'Grupo', 'Image': 'Imagen', 'Label': 'Rótulo', 'Line': 'Línea', 'Oval': 'Óvalo', 'Polygon': 'Polígono', 'Rect': 'Rect', 'RegularPolygon': 'PolígonoRegular', 'Robot': 'Robot', 'Sound': 'Sonido', 'Star': 'Estrella', 'almostEqual': 'casiIgualA', 'angleTo': 'ánguloA', 'app': 'app', 'assertEqual': 'afirmarIgualdad', 'choice': 'opción', 'distance': 'distancia', 'fromPythonAngle': 'deÁnguloPython', 'getPointInDir': 'obtenerPuntoEnDir', 'gradient': 'gradiente', 'makeList': 'hacerLista', 'onKeyHolds': 'enTeclasRetenidas', 'onSteps': 'enPasos', 'print': 'imprime', 'pythonRound': 'redondearPython', 'random': 'aleatorio', 'randrange': 'rangoAleatorio', 'rgb': 'rgb', 'round': 'redondear', 'rounded': 'redondeado', 'seed': 'semilla', 'toPythonAngle': 'aÁnguloPython', 'onKeyPresses': 'enTeclaPresionadas', 'CMUImage': 'CMUImage'}, 'de': {'Arc': 'Bogen', 'Circle': 'Kreis', 'Group': 'Gruppe', 'Image': 'Bild', 'Label': 'Beschriftung', 'Line': 'Linie', 'Oval': 'Oval', 'Polygon': 'Vieleck', 'Rect': 'Rechteck', 'RegularPolygon': 'RegelmäßigesVieleck', 'Robot': 'Roboter', 'Sound': 'Geräusch', 'Star': 'Stern', 'almostEqual': 'fastGleich', 'angleTo': 'winkelNach', 'app': 'anwendung', 'assertEqual': 'gleichsetzen', 'choice': 'auswahl', 'distance': 'distanz', 'fromPythonAngle': 'vomPythonWinkel', 'getPointInDir': 'erhaltePunktInRichtung', 'gradient': 'farbverlauf', 'makeList': 'macheListe', 'onKeyHolds': 'wennTasteGedrückt', 'onSteps': 'schrittweise', 'print': 'ausgabe', 'pythonRound': 'pythonRunden', 'random': 'zufall', 'randrange': 'zufallsspanne', 'rgb': 'RGB', 'round': 'runden', 'rounded': 'gerundet', 'seed': 'kerne', 'toPythonAngle': 'zumPythonWinkel', 'onKeyPresses': 'wennTasteGedrückt', 'CMUImage': 'CMUImage'}}
-TRANSLATED_USER_FUNCTION_NAMES = {'keys': ['onKeyHold', 'onKeyPress', 'onKeyRelease', 'onMouseDrag', 'onMouseMove', 'onMousePress', 'onMouseRelease', 'onStep'], 'es': {'onKeyHold': 'enTeclaRetenida', 'onKeyPress': 'enTeclaPresionada', 'onKeyRelease': 'enTeclaSoltada', 'onMouseDrag': 'enRatónArrastrado', 'onMouseMove': 'enRatónMovido', 'onMousePress': 'enRatónPresionado', 'onMouseRelease': 'enRatónSoltado', 'onStep': 'enPaso'}, 'de': {'onKeyHold': 'beiTasteHalten', 'onKeyPress': 'beiTasteRunter', 'onKeyRelease': 'beiTasteHoch', 'onMouseDrag': 'beiMausMitTasteZiehen', 'onMouseMove': 'beiMausbewegung', 'onMousePress': 'beiMaustasteRunter', 'onMouseRelease': 'beiMaustasteHoch', 'onStep': 'beimSchritt'}}
-TRANSLATED_KEY_NAMES = {'keys': ['space', 'enter', 'left', 'right', 'up', 'down', 'pageup', 'pagedown', 'escape', 'delete', 'backspace', 'tab'], 'es': {'space': 'espacio', 'enter': 'intro', 'left': 'izquierda', 'right': 'derecha', 'up': 'arriba', 'down': 'abajo', 'pageup': 'repág', 'pagedown': 'avpág', 'escape': 'escapar', 'delete': 'suprimir', 'backspace': 'retroceso', 'tab': 'pestaña'}, 'de': {'space': 'leertaste', 'enter': 'enter', 'left': 'links', 'right': 'rechts', 'up': 'pfeil-hoch', 'down': 'pfeil-runter', 'pageup': 'bild-hoch', 'pagedown': 'bild-runter', 'escape': 'escape', 'delete': 'entfernen', 'backspace': 'löschen', 'tab': 'tab'}}
-TRANSLATED_APP_ATTRS = {'keys': ['background', 'getTextInput', 'group', 'maxShapeCount', 'paused', 'setTextInputs', 'stepsPerSecond', 'stop', 'stopped', 'setMaxShapeCount'], 'es': {'background': 'fondo', 'getTextInput': 'obtenerEntradaDeTexto', 'group': 'grupo', 'maxShapeCount': 'maxCuentaDeFiguras', 'paused': 'pausada', 'setTextInputs': 'establecerEntradaDeTexto', 'stepsPerSecond': 'pasosPorSegundo', 'stop': 'detener', 'stopped': 'detenido', 'setMaxShapeCount': 'establecerCuentaFormasMaximas'}, 'de': {'background': 'hintergrund', 'getTextInput': 'holeTextEingabe', 'group': 'gruppe', 'maxShapeCount': 'maximaleFormMenge', 'paused': 'pausiert', 'setTextInputs': 'setzeTextEingaben', 'stepsPerSecond': 'schritteProSekunde', 'stop': 'stop', 'stopped': 'gestoppt', 'setMaxShapeCount': 'setzeMaxFormAnzahl'}}
-TRANSLATED_STRINGS = {'keys': ['Arc', 'Circle', 'Group', 'Image', 'Label', 'Line', 'Oval', 'Polygon', 'Rect', 'RegularPolygon', 'Robot', 'Sound', 'Star', 'almostEqual', 'angleTo', 'app', 'assertEqual', 'choice', 'distance', 'fromPythonAngle', 'getPointInDir', 'gradient', 'makeList', 'onKeyHolds', 'onSteps', 'print', 'pythonRound', 'random', 'randrange', 'rgb', 'round', 'rounded', 'seed', 'toPythonAngle', 'onKeyPresses', 'Arc', 'Circle', 'Group', 'Image', 'Label', 'Line', 'Oval', 'Polygon', 'Rect', 'RegularPolygon', 'Robot', 'Sound', 'Star', 'almostEqual', 'angleTo', 'app', 'assertEqual', 'choice', 'distance', 'fromPythonAngle', 'getPointInDir', 'gradient', 'makeList', 'onKeyHolds', 'onSteps', 'print', 'pythonRound', 'random', 'randrange', 'rgb', 'round', 'rounded', 'seed', 'toPythonAngle', 'onKeyPresses', 'remove', 'bold', 'opacity', 'centerX', 'hits', 'borderWidth', 'centerY', 'url', 'left', 'add', 'points', 'startAngle', 'toBack', 'x2', 'y1', 'size', 'initialPoints', 'top', 'align', 'dashes', 'right', 'start', 'y2', 'radius', 'border', 'containsShape', 'background', 'height', 'lineWidth', 'toFront', 'roundness', 'arrowEnd', 'x1', 'fill', 'bottom', 'clear', 'sweepAngle', 'value', 'contains', 'italic', 'visible', 'arrowStart', 'hitsShape', 'font', 'children', 'hitTest', 'width', 'rotateAngle', '"{{align}}" is not a valid Polygon constructor argument', '"{{attr}}" is not a valid shape constructor argument', '**** Error in onError()!!! ****', 'An assertEqual() statement in a test case failed. See the Console for details.', 'An error occurred. Here is the stack trace:', 'App', 'App.group is readonly', 'App.stopped is readonly', 'Arc', 'Arg Count Error: {{callSpec}}() takes {{argNamesLen}} arguments ({{argNames}}), not {{argsLen}}', 'Arguments to setTextInputs must be strings. %r is not a string.', 'Autograder: error executing solution code!', 'Autograder: error executing user code!', 'Autograding is taking a long time. Your code may have an infinite loop.', 'Both rows and cols must be >= 0', "Cannot set Image's url", "Cannot set Label's height", "Cannot set Label's width", "Cannot set Line's border", "Cannot set Line's borderWidth", 'Circle', 'Circle{{attrs}}', 'Failed to get text input', 'Failed to load image data', 'Font not found: {{baseFontName}}\n', 'Group', 'Group()', 'Group.add(shape)', 'Group.remove(shape)', 'Group.{{attr}} cannot be read or modified', "Group.{{attr}} has no value because its children don't all have the same value for {{attr}}", '{{error}}: Illegal gradient start ({{start}})', 'Image', 'Image{{args}}', 'Internal error (no solution shapes!).  Please try again.', 'Label', 'Label({{args}})', 'Line', 'Line{{args}}', 'Must have an even number of x,y values in initialPoints list', 'Need to pass at least 2 colors to gradient(); you gave {{colorsLength}}', 'No activeDrawing for new Shape', 'No such attribute: {{attr}}', 'None', 'Oval', 'Oval{{args}}', 'Polygon', 'Polygon{{args}}', 'Recording Starts In', 'Rect', 'Rect{{args}}', 'RegularPolygon', 'RegularPolygon{{args}}', 'Robot', 'Shape', 'Shape()', 'Shapes drawn in wrong order', "Sorry, you cannot use Python's input function in CMU CS Academy", 'Sound', 'Sound "{{soundSource}}" failed to play. Disabling it.', 'Star', 'Star{{args}}', 'The loop argument to Sound.play must be True or False, got {{loopRepr}}', 'The restart argument to Sound.play must be True or False, got {{restartRepr}}', 'Too many shapes: Your code created more than {{maxShapeCount}} shapes. If you would like to increase this limit even though it may cause your code to run slowly, call app.setMaxShapeCount(n).', 'Traceback (most recent call last):', '{{error}}: None cannot be used inside gradient.colors', '{{error}}: {{callSpec}} should be {{typeName}} (but {{value}} is of type {{valueType}})', '{{error}}: {{color}} cannot be used inside gradient.colors', '{{error}}: {{callSpec}} should be a color, and {{value}} is not a legal color name', 'Undefined poster in new _CmuGraphics', 'Unknown message {{cmd}}', "Use our rounded(n) instead of Python 3's round(n)\n  Python 3's round(n) does not work as one might expect!\n  If you still want Python 3's round, use pythonRound", 'Wait for fonts to load before using them', 'Wrong # of points ({{userPtsLen}} should be {{solnPtsLen}})', 'You are missing {{missingCount}} shape(s)', "You can't change the size of this group because {{shape}} can't be resized", "You can't get or set the align property", 'You have {{extraCount}} extra shape(s)', 'Your code appeared to be in an infinite loop, so it was terminated.', '\nWarning: Your code created labels with more than\n  1,000 total characters of text. This may cause your\n  program to run very slowly.\n', 'addPoint', 'add{{xy}}', 'align', 'app.background should not be {{userBackgroundString}}', 'app.setMaxShapeCount(n)', 'arrowEnd', 'arrowStart', 'at line', 'background', 'black', 'bold', 'border', 'borderWidth', 'bottom', 'bottom-left', 'bottom-right', 'center', 'centerX', 'centerY', 'centroidX', 'centroidY', 'color', 'containsShape(targetShape)', 'dashes', 'fill', 'font', 'gradient({{colors}}, start={{start}})', 'height', 'hits(x, y)', 'hitsShape(targetShape)', 'initialPoints', 'initialPoints (x value)', 'initialPoints (y value)', 'integer', 'italic', 'keys must be a list', 'left', 'left-bottom', 'left-top', 'line', 'lineWidth', 'list', 'n', 'non-negative-number', 'number', 'number-greater-than-2', 'number-in-range-{{lo}}-{{hi}}', 'opacity', 'oval size', 'points', 'positive-number', 'radius', 'rgb({{r}}, {{g}}, {{b}})', 'right', 'right-bottom', 'right-top', 'rotate.cx', 'rotate.cy', 'rotate.degrees', 'rotateAngle', 'roundness', 'scale{{xy}}', 'shape', 'size', 'startAngle', 'string', 'sweepAngle', 'targetShape', 'top', 'top-left', 'top-right', 'url', 'value', 'visible', 'width', 'x', 'x1', 'x2', 'y', 'y1', 'y2', '{{actual}} != {{expected}}', '{{attr}} in {{object}}', '{{attr}} should not be {{value}}', '{{ordinalName}} point mismatch at {{location}}', 'play', 'pause', 'restart', 'loop', 'TypeError', '{{error}}: in {{callSpec}}, {{value}} is not a legal align value', "{{error}}: {{callSpec}} got an unexpected keyword argument '{{arg}}'", 'contains(x, y)', 'hitTest(x, y)', 'addPoint(x, y)', 'red', 'green', 'blue', '{{callSpec}} must start with http:// or https://'], 'es': {'Arc': 'Arco', 'Circle': 'Círculo', 'Group': 'Grupo', 'Image': 'Imagen', 'Label': 'Rótulo', 'Line': 'Línea', 'Oval': 'Óvalo', 'Polygon': 'Polígono', 'Rect': 'Rect', 'RegularPolygon': 'PolígonoRegular', 'Robot': 'Robot', 'Sound': 'Sonido', 'Star': 'Estrella', 'almostEqual': 'casiIgualA', 'angleTo': 'ánguloA', 'app': 'app', 'assertEqual': 'afirmarIgualdad', 'choice': 'opción', 'distance': 'distancia', 'fromPythonAngle': 'deÁnguloPython', 'getPointInDir': 'obtenerPuntoEnDir', 'gradient': 'gradiente', 'makeList': 'hacerLista', 'onKeyHolds': 'enTeclasRetenidas', 'onSteps': 'enPasos', 'print': 'imprime', 'pythonRound': 'redondearPython', 'random': 'aleatorio', 'randrange': 'rangoAleatorio', 'rgb': 'rgb', 'round': 'redondear', 'rounded': 'redondeado', 'seed': 'semilla', 'toPythonAngle': 'aÁnguloPython', 'onKeyPresses': 'enTeclaPresionadas', 'remove': 'quitar', 'bold': 'negrito', 'opacity': 'opacidad', 'centerX': 'centroX', 'hits': 'toca', 'borderWidth': 'anchuraDeBorde', 'centerY': 'centroY', 'url': 'url', 'left': 'izquierda', 'add': 'agregar', 'points': 'puntos', 'startAngle': 'ánguloInicial', 'toBack': 'alFondo', 'x2': 'x2', 'y1': 'y1', 'size': 'tamaño', 'initialPoints': 'puntosIniciales', 'top': 'superior', 'align': 'alinear', 'dashes': 'guión', 'right': 'derecha', 'start': 'inicio', 'colors': 'colores', 'y2': 'y2', 'radius': 'radio', 'border': 'borde', 'containsShape': 'contieneFigura', 'background': 'fondo', 'height': 'altura', 'lineWidth': 'anchuraDeLínea', 'toFront': 'alFrente', 'roundness': 'redondez', 'arrowEnd': 'finalDeFlecha', 'x1': 'x1', 'fill': 'relleno', 'bottom': 'inferior', 'clear': 'vaciar', 'sweepAngle': 'ánguloDeBarrido', 'value': 'valor', 'contains': 'contiene', 'italic': 'itálica', 'visible': 'visible', 'arrowStart': 'inicioDeFlecha', 'hitsShape': 'tocaFigura', 'font': 'fuente', 'children': 'hijos', 'hitTest': 'tocarPrueba', 'width': 'ancho', 'rotateAngle': 'rotarÁngulo', '"{{align}}" is not a valid Polygon constructor argument': '"alinear" no es un argumento de constructor de Polígono válido', '"{{attr}}" is not a valid shape constructor argument': '"{{attr}}" no es un argumento de constructor de formas válido', '**** Error in onError()!!! ****': '**** ¡¡¡Error dentro de enError()!!! ****', 'An assertEqual() statement in a test case failed. See the Console for details.': 'Una sentencia assertEqual() dentro de un caso de prueba falló. Mire la consola para detalles.', 'An error occurred. Here is the stack trace:': 'Ocurrió un error. Aquí está el seguimiento de la pila:', 'App': 'App', 'App.group is readonly': 'App.grupo es sólo lectura', 'App.stopped is readonly': 'App.detenido es sólo lectura', 'Arg Count Error: {{callSpec}}() takes {{argNamesLen}} arguments ({{argNames}}), not {{argsLen}}': 'Arg Count Error: {{callSpec}}() toma {{argNamesLen}} argumentos ({{argNames}}), no {{argsLen}}', 'Arguments to setTextInputs must be strings. %r is not a string.': 'Arguments to setTextInputs must be strings. %r is not a string.', 'Autograder: error executing solution code!': 'Evaluador: ¡error al ejecutar el código de la solución!', 'Autograder: error executing user code!': 'Evaluador: ¡error al ejecutar el código del usuario!', 'Autograding is taking a long time. Your code may have an infinite loop.': 'El evaluador está tardando mucho. Su código puede tener un bucle infinito.', 'Both rows and cols must be >= 0': 'Ambos las filas y las cols deben ser >= 0', "Cannot set Image's url": 'No se puede establecer el url de una Imagen', "Cannot set Label's height": 'No se puede establecer la altura de una Línea', "Cannot set Label's width": 'No se puede establecer la anchura de una Línea', "Cannot set Line's border": 'No se puede establecer el borde de una Línea', "Cannot set Line's borderWidth": 'No se puede establecer la anchura de una Línea', 'Circle{{attrs}}': 'Círculo{{attrs}}', 'Failed to get text input': 'No se pudo obtener entrade de texto', 'Failed to load image data': 'No se puedo cargar los datos de la imagen', 'Font not found: {{baseFontName}}\n': 'Fuente no encontrada: {{baseFontName}}\\n', 'Group()': 'Grupo()', 'Group.add(shape)': 'Grupo.agregar(figura)', 'Group.remove(shape)': 'Grupo.quitar(figura)', 'Group.{{attr}} cannot be read or modified': 'Grupo.{{attr}} no se puede leer ni modificar', "Group.{{attr}} has no value because its children don't all have the same value for {{attr}}": 'Grupo.{{attr}} no tiene valor porque no todos sus elementos secundarios tienen el mismo valor para {{attr}}', '{{error}}: Illegal gradient start ({{start}})': '{{error}}: Inicio de gradiente ilegal ({{start}})', 'Image{{args}}': 'Imagen{{args}}', 'Internal error (no solution shapes!).  Please try again.': 'Error internal (¡no figuras en su solución!).  Por favor inténtelo otra vez.', 'Label({{args}})': 'Rótulo({{args}})', 'Line{{args}}': 'Línea{{args}}', 'Must have an even number of x,y values in initialPoints list': 'Debe tener un número par de valores x,y dentro de la lista puntosIniciales', 'Need to pass at least 2 colors to gradient(); you gave {{colorsLength}}': 'Necesita dar al menos 2 colores a gradiente(); diste {{colorsLength}}', 'No activeDrawing for new Shape': 'No hay un dibujoActivo para la Figura nueva', 'No such attribute: {{attr}}': 'No existe tal atributo: {{attr}}', 'None': 'None', 'Oval{{args}}': 'Óvalo{{args}}', 'Polygon{{args}}': 'Polígono{{args}}', 'Recording Starts In': 'Grabación comenzando en', 'Rect{{args}}': 'Rect{{args}}', 'RegularPolygon{{args}}': 'PolígonoRegular{{args}}', 'Shape': 'Figura', 'Shape()': 'Figura()', 'Shapes drawn in wrong order': 'Figuras dibujadas en el orden equivocado', "Sorry, you cannot use Python's input function in CMU CS Academy": 'Lo lamento, no puede usar la función de entrada de Python en CMU CS Academy', 'Sound "{{soundSource}}" failed to play. Disabling it.': 'Sonido "{{soundSource}}" no pudo jugar. Desactivando.', 'Star{{args}}': 'Estrella{{args}}', 'The loop argument to Sound.play must be True or False, got {{loopRepr}}': 'El argumento de repetición de Sonido.tocar debe ser Verdadero o Falso, obtuvo {{loopRepr}}', 'The restart argument to Sound.play must be True or False, got {{restartRepr}}': 'El argumento de reinicio de Sonido.tocar debe ser Verdadero o Falso, obtuvo {{reiniciarRepr}}', 'Too many shapes: Your code created more than {{maxShapeCount}} shapes. If you would like to increase this limit even though it may cause your code to run slowly, call app.setMaxShapeCount(n).': 'Demasiadas formas: Su código creó más de {{maxShapeCount}} formas. Si desea aumentar este límite, aunque puede hacer que su código se ejecute lentamente, llame a app.establecerCuentaFormasMaximas(n).', 'Traceback (most recent call last):': 'rastreo (última llamada más reciente):', '{{error}}: None cannot be used inside gradient.colors': '{{error}}: None no se puede usar dentro de gradientes.colores', '{{error}}: {{callSpec}} should be {{typeName}} (but {{value}} is of type {{valueType}})': '{{error}}: {{callSpec}} debe ser {{typeName}} (pero {{value}} es de tipo {{valueType}})', '{{error}}: {{color}} cannot be used inside gradient.colors': '{{error}}: {{color}} no se puede utilizar dentro de gradiente.colores', '{{error}}: {{callSpec}} should be a color, and {{value}} is not a legal color name': '{{error}}: {{callSpec}} debe ser un color, y {{value}} no es un nombre de color legal', 'Undefined poster in new _CmuGraphics': 'Posteador indefinido en nuevo _CmuGraphics', 'Unknown message {{cmd}}': 'Mensaje desconocido {{cmd}}', "Use our rounded(n) instead of Python 3's round(n)\n  Python 3's round(n) does not work as one might expect!\n  If you still want Python 3's round, use pythonRound": 'Use nuestra función redondear(n) en lugar del "round(n)" de Python\\n ¡La función "round(n)" de Python 3 no funciona como uno espera!\\n Si todavía quiere usar el "round" de Python, use "pythonRound"', 'Wait for fonts to load before using them': 'Espere a que se carguen las fuentes antes de usarlas', 'Wrong # of points ({{userPtsLen}} should be {{solnPtsLen}})': '# incorrecto de puntos ({{userPtsLen}} debe ser {{solnPtsLen}})', 'You are missing {{missingCount}} shape(s)': 'Te faltan {{missingCount}} forma(s)', "You can't change the size of this group because {{shape}} can't be resized": 'No puedes cambiar el tamaño de este grupo porque no se puede cambiar el tamaño de {{shape}}', "You can't get or set the align property": 'No puede obtener o establecer la propiedad de alinear', 'You have {{extraCount}} extra shape(s)': 'Tienes {{extraCount}} forma(s) adicionales', 'Your code appeared to be in an infinite loop, so it was terminated.': 'Your code appeared to be in an infinite loop, so it was terminated.', '\nWarning: Your code created labels with more than\n  1,000 total characters of text. This may cause your\n  program to run very slowly.\n': '\\nAdvertencia: Su código creó rótulos con más de\\n  1,000 caracteres de texto en total. Esto puede hacer que su\\n programa se ejecute muy lentamente.\\n', 'addPoint': 'agregarPunto', 'add{{xy}}': 'añadir{{xy}}', 'app.background should not be {{userBackgroundString}}': 'app.fondo no debe ser {{userBackgroundString}}', 'app.setMaxShapeCount(n)': 'app.establecerMáximaCuentaDeFiguras(n)', 'at line': 'en la línea', 'black': 'negro', 'bottom-left': 'inferior-izquierda', 'bottom-right': 'inferior-derecha', 'center': 'centro', 'centroidX': 'centroideX', 'centroidY': 'centroideY', 'color': 'color', 'containsShape(targetShape)': 'contieneFigura(figuraObjetivo)', 'gradient({{colors}}, start={{start}})': 'gradient({{colors}}, start={{start}})', 'hits(x, y)': 'toca(x, y)', 'hitsShape(targetShape)': 'tocaFigura(figuraObjetivo)', 'initialPoints (x value)': 'puntosIniciales (valor x)', 'initialPoints (y value)': 'puntosIniciales (valor y)', 'integer': 'número entero', 'keys must be a list': 'teclas debe ser una lista', 'left-bottom': 'izquierda-inferior', 'left-top': 'izquierda-superior', 'line': 'línea', 'list': 'lista', 'n': 'n', 'non-negative-number': 'número-no-negativo', 'number': 'número', 'number-greater-than-2': 'número-mayor-que-2', 'number-in-range-{{lo}}-{{hi}}': 'número-en-rango-{{lo}}-{{hi}}', 'oval size': 'tamaño de óvalo', 'positive-number': 'número-positivo', 'rgb({{r}}, {{g}}, {{b}})': 'rgb({{r}}, {{g}}, {{b}})', 'right-bottom': 'derecha-inferior', 'right-top': 'derecha-superior', 'rotate.cx': 'rotar.cx', 'rotate.cy': 'rotar.cy', 'rotate.degrees': 'rotar.grados', 'scale{{xy}}': 'escala{{xy}}', 'shape': 'figura', 'string': 'cadena', 'targetShape': 'figuraObjetivo', 'top-left': 'superior-izquierda', 'top-right': 'superior-derecha', 'x': 'x', 'y': 'y', '{{actual}} != {{expected}}': '{{actual}} != {{expected}}', '{{attr}} in {{object}}': '{{attr}} dentro de {{object}}', '{{attr}} should not be {{value}}': '{{attr}} no debe ser {{value}}', '{{ordinalName}} point mismatch at {{location}}': '{{ordinalName}} desajuste de puntos en {{location}}', 'play': 'toca', 'pause': 'pausa', 'restart': 'reiniciar', 'loop': 'repetir', 'TypeError': 'Error de tipo', '{{error}}: in {{callSpec}}, {{value}} is not a legal align value': '{{error}}: en {{callSpec}}, {{value}} no es un valor legal de alineación', "{{error}}: {{callSpec}} got an unexpected keyword argument '{{arg}}'": "{{error}}: {{callSpec}} tiene un argumento de palabra clave inesperado '{{arg}}'", 'contains(x, y)': 'contiene(x, y)', 'hitTest(x, y)': 'tocarPrueba(x, y)', 'addPoint(x, y)': 'agregarPunto(x, y)', 'red': 'red', 'green': 'green', 'blue': 'blue', '{{callSpec}} must start with http:// or https://': '{{callSpec}} debe comenzar con http:// o https://', "Cannot modify attribute '{{attr}}' of '{{className}}' object": "No se puede modificar el atributo '{{attr}}' del objeto de '{{className}}'"}, 'de': {'Arc': 'Bogen', 'Circle': 'Kreis', 'Group': 'Gruppe', 'Image': 'Bild', 'Label': 'Beschriftung', 'Line': 'Linie', 'Oval': 'Oval', 'Polygon': 'Vieleck', 'Rect': 'Rechteck', 'RegularPolygon': 'RegelmäßigesVieleck', 'Robot': 'Roboter', 'Sound': 'Geräusch', 'Star': 'Stern', 'almostEqual': 'fastGleich', 'angleTo': 'winkelNach', 'app': 'anwendung', 'assertEqual': 'gleichsetzen', 'choice': 'auswahl', 'distance': 'distanz', 'fromPythonAngle': 'vomPythonWinkel', 'getPointInDir': 'erhaltePunktInRichtung', 'gradient': 'farbverlauf', 'makeList': 'macheListe', 'onKeyHolds': 'wennTasteGedrückt', 'onSteps': 'schrittweise', 'print': 'ausgabe', 'pythonRound': 'pythonRunden', 'random': 'zufall', 'randrange': 'zufallsspanne', 'rgb': 'RGB', 'round': 'runden', 'rounded': 'gerundet', 'seed': 'kerne', 'toPythonAngle': 'zumPythonWinkel', 'onKeyPresses': 'wennTasteGedrückt', 'remove': 'entferne', 'bold': 'fett', 'opacity': 'deckkraft', 'centerX': 'mitteX', 'hits': 'trifft', 'borderWidth': 'randBreite', 'centerY': 'mitteY', 'url': 'url', 'left': 'links', 'add': 'fügeHinzu', 'points': 'punkte', 'startAngle': 'anfangsWinkel', 'toBack': 'nachHinten', 'x2': 'x2', 'y1': 'y1', 'size': 'größe', 'initialPoints': 'startPunkte', 'top': 'oben', 'align': 'ausrichtung', 'dashes': 'gestrichelt', 'right': 'rechts', 'start': 'start', 'y2': 'y2', 'radius': 'radius', 'border': 'rand', 'containsShape': 'beinhaltetForm', 'background': 'hintergrund', 'height': 'höhe', 'lineWidth': 'linienBreite', 'toFront': 'nachVorn', 'roundness': 'rundung', 'arrowEnd': 'pfeilEnde', 'x1': 'x1', 'fill': 'füllen', 'bottom': 'unten', 'clear': 'leeren', 'sweepAngle': 'krümmungsWinkel', 'value': 'wert', 'contains': 'beinhaltet', 'italic': 'kursiv', 'visible': 'sichtbar', 'arrowStart': 'pfeilStart', 'hitsShape': 'trifftForm', 'font': 'schriftart', 'children': 'kinder', 'hitTest': 'treffenTest', 'width': 'breite', 'rotateAngle': 'drehWinkel', '"{{align}}" is not a valid Polygon constructor argument': '"alinear" ist kein gültiges Argument für den Konstruktor von Polygon',  '"{{attr}}" is not a valid shape constructor argument': '"{{attr}}" ist kein valides Argument des Konstruktors von Form', '**** Error in onError()!!! ****': '**** Fehler in wennFehler()!!! ****', 'An assertEqual() statement in a test case failed. See the Console for details.': 'Eine assertEqual() Anweisung in einem Testfall ist fehlgeschlagen. Schau auf die Konsole um Details zu sehen.', 'An error occurred. Here is the stack trace:': 'Ein unbekannter Fehler ist aufgetreten. Hier ist der Stack Tracke:', 'App': 'Anwendung', 'App.group is readonly': 'App.gruppe nur lesbar', 'App.stopped is readonly': 'App.gestoppt ist nur lesbar', 'Arg Count Error: {{callSpec}}() takes {{argNamesLen}} arguments ({{argNames}}), not {{argsLen}}': 'Fehlerhafte Anzahl der Argumente: {{callSpec}} () akzeptiert {{argNamesLen}} Argumente ({{argNames}}), nicht {{argsLen}}', 'Arguments to setTextInputs must be strings. %r is not a string.': 'Arguments to setTextInputs must be strings. %r is not a string.', 'Autograder: error executing solution code!': 'Autograder: Fehler beim Ausführen des Lösungscodes!', 'Autograder: error executing user code!': 'Autograder: Fehler beim Ausführen des Benutzercodes!', 'Autograding is taking a long time. Your code may have an infinite loop.': 'Autograding dauert lange. Möglicherweise gibt es eine Endlosschleife in deinem Code.', 'Both rows and cols must be >= 0': 'Sowohl Zeilen als auch Spalten müssen >= 0 sein', "Cannot set Image's url": 'Die URL des Bildes kann nicht festgelegt werden', "Cannot set Label's height": 'Die Höhe des Labels kann nicht eingestellt werden', "Cannot set Label's width": 'Breite des Labels kann nicht gesetzt werden', "Cannot set Line's border": 'Der Linienrand kann nicht festgelegt werden', "Cannot set Line's borderWidth": 'Die Rahmenbreite von Line kann nicht festgelegt werden', 'Circle{{attrs}}': 'Kreis{{attrs}}', 'Failed to get text input': 'Fehler bei der Texteingabe', 'Failed to load image data': 'Fehler beim Laden der Bilddaten', 'Font not found: {{baseFontName}}\n': 'Schriftart nicht gefunden: {{baseFontName}}\\n', 'Group()': 'Gruppe()', 'Group.add(shape)': 'Gruppe.fügeHinzu(form)', 'Group.remove(shape)': 'Gruppe.entferne(form)', 'Group.{{attr}} cannot be read or modified': 'Gruppe.{{attr}} kann nicht gelesen oder geändert werden', "Group.{{attr}} has no value because its children don't all have the same value for {{attr}}": 'Gruppe.{{attr}} hat keinen Wert, da die untergeordneten Elemente nicht alle den gleichen Wert für {{attr}} haben', '{{error}}: Illegal gradient start ({{start}})': '{{error}}: Illegaler Start des Farbverlaufs ({{start}})', 'Image{{args}}': 'Bild{{args}}', 'Internal error (no solution shapes!).  Please try again.': 'Interner Fehler (keine Lösungsformen!). Bitte versuche es noche einmal.', 'Label({{args}})': 'Beschriftung({{args}})', 'Line{{args}}': 'Linie{{args}}', 'Must have an even number of x,y values in initialPoints list': 'Muss eine gerade Anzahl von x,y Werten in der Liste anfangsPunkte haben', 'Need to pass at least 2 colors to gradient(); you gave {{colorsLength}}': 'Es müssen mindestens 2 Farben an farbverlauf() übergeben werden. Du hast {{farbenLänge}} gegeben', 'No activeDrawing for new Shape': 'Keine aktiveZeichnung für neue Form', 'No such attribute: {{attr}}': 'Kein solches Attribut: {{attr}}', 'None': 'None', 'Oval{{args}}': 'Oval{{args}}', 'Polygon{{args}}': 'Polygon{{args}}', 'Recording Starts In': 'Aufnahme startet in', 'Rect{{args}}': 'Rechteck{{args}}', 'RegularPolygon{{args}}': 'RegularPolygon {{args}}', 'Shape': 'Form', 'Shape()': 'Form()', 'Shapes drawn in wrong order': 'Formen werden in der falschen Reihenfolge gezeichnet', "Sorry, you cannot use Python's input function in CMU CS Academy": "Leider kannst du Python's input Funktion nicht in CMU CS Academy nutzen", 'Sound "{{soundSource}}" failed to play. Disabling it.': 'Klang "{{soundSource}}" konnte nicht abgespielt werden. Wird deaktiviert.', 'Star{{args}}': 'Stern{{args}}', 'The loop argument to Sound.play must be True or False, got {{loopRepr}}': 'Das Schleifenargument für Sound.play muss True oder False sein, {{loopRepr}}', 'The restart argument to Sound.play must be True or False, got {{restartRepr}}': 'Das Argument um Sound.play neuzustarten muss True oder False sein und {{restartRepr}} erhalten haben', 'Too many shapes: Your code created more than {{maxShapeCount}} shapes. If you would like to increase this limit even though it may cause your code to run slowly, call app.setMaxShapeCount(n).': 'Zu viele Formen:  Ihr Code hat mehr als {{maxShapeCount}} Formen erstellt. Wenn Sie dieses Limit erhöhen möchten, obwohl Ihr Code dadurch möglicherweise langsam ausgeführt wird, rufen Sie app.setzeMaxFormAnzahl(n) auf.', 'Traceback (most recent call last):': 'Aufrufliste (jüngster Aufruf zuletzt)', '{{error}}: None cannot be used inside gradient.colors': '{{error}}: None kann nicht innerhalb von farbverlauf.farben verwendet werden', '{{error}}: {{callSpec}} should be {{typeName}} (but {{value}} is of type {{valueType}})': '{{error}}: {{callSpec}} sollte {{typeName}} sein (aber {{value}} ist vom Typ {{valueType}})', '{{error}}: {{color}} cannot be used inside gradient.colors': '{{error}}: {{color}} kann nicht in gradient.colors verwendet werden', '{{error}}: {{callSpec}} should be a color, and {{value}} is not a legal color name': '{{error}}: {{callSpec}} sollte eine Farbe sein, und {{value}} ist kein zulässiger Farbname', 'Undefined poster in new _CmuGraphics': 'Nicht definiertes Poster in neuem _CmuGraphics', 'Unknown message {{cmd}}': 'Unbekannte Nachricht {{cmd}}', "Use our rounded(n) instead of Python 3's round(n)\n  Python 3's round(n) does not work as one might expect!\n  If you still want Python 3's round, use pythonRound": "Verwenden Sie unsere Funktion rounded(n) anstelle der Python 3 Funktion round(n)\\n Python 3's round(n) funktioniert nicht wie erwartet!\\n Wenn Sie die Funktion round() von Python 3 weiterhin verwenden möchten, dann nutzen Sie pythonRound", 'Wait for fonts to load before using them': 'Warte, bis Zeichensatz geladen ist, bevor du ihn verwendest', 'Wrong # of points ({{userPtsLen}} should be {{solnPtsLen}})': 'Falsche Anzahl von Punkten ({{userPtsLen}} sollte ${{solnPtsLen}} sein)', 'You are missing {{missingCount}} shape(s)': 'Ihnen fehlen {{missingCount}} Form(en)', "You can't change the size of this group because {{shape}} can't be resized": 'Sie können die Größe dieser Gruppe nicht ändern, da die Größe von {{form}} nicht geändert werden kann', "You can't get or set the align property": 'Sie können die Align-Eigenschaft nicht abrufen oder festlegen', 'You have {{extraCount}} extra shape(s)': 'Du hast {{extraCount}} zusätzliche Form(en)', 'Your code appeared to be in an infinite loop, so it was terminated.': 'Your code appeared to be in an infinite loop, so it was terminated.', '\nWarning: Your code created labels with more than\n  1,000 total characters of text. This may cause your\n  program to run very slowly.\n': '\\nWarnung: Ihr Code hat Beschriftungen mit insgesamt mehr als\\n 1.000 Textzeichen erstellt. Dies kann dazu führen, dass Ihr\\n Programm sehr langsam ausgeführt wird.\\n', 'addPoint': 'fügePunktHinzu', 'add{{xy}}': 'addiere{{xy}}', 'app.background should not be {{userBackgroundString}}': 'anwendung.hintergrund sollte nicht {{userBackgroundString}} sein', 'app.setMaxShapeCount(n)': 'anwendung.setzeMaxFormAnzahl(n)', 'at line': 'in Zeile', 'black': 'schwarz', 'bottom-left': 'unten-links', 'bottom-right': 'unten-rechts', 'center': 'mitte', 'centroidX': 'mittelpunktX', 'centroidY': 'mittelpunktY', 'color': 'Farbe', 'containsShape(targetShape)': 'beinhaltetForm(zielForm)', 'gradient({{colors}}, start={{start}})': 'gradient({{colors}}, start={{start}})', 'hits(x, y)': 'trifft(x,y)', 'hitsShape(targetShape)': 'trifftForm(zielForm)', 'initialPoints (x value)': 'anfangsPunkte (x wert)', 'initialPoints (y value)': 'anfangsPunkte (y wert)', 'integer': 'Integer', 'keys must be a list': 'Schlüssel müssen eine Liste sein', 'left-bottom': 'links-unten', 'left-top': 'links-oben', 'line': 'Linie', 'list': 'Liste', 'n': 'n', 'non-negative-number': 'Nicht-negative Zahl', 'number': 'Nummer', 'number-greater-than-2': 'Zahl-größer-als-2', 'number-in-range-{{lo}}-{{hi}}': 'Aufnahme startet in', 'oval size': 'Größe Oval', 'positive-number': 'Positive Zahl', 'rgb({{r}}, {{g}}, {{b}})': 'RGB({{r}}, {{g}}, {{b}})', 'right-bottom': 'rechts-unten', 'right-top': 'rechts-oben', 'rotate.cx': 'drehung.cx', 'rotate.cy': 'drehung.cy', 'rotate.degrees': 'drehung.winkel', 'scale{{xy}}': 'skaliere{{xy}}', 'shape': 'Form', 'string': 'string', 'targetShape': 'zielForm', 'top-left': 'oben-links', 'top-right': 'oben-rechts', 'x': 'x', 'y': 'y', '{{actual}} != {{expected}}': '{{aktuell}}! = {{erwartet}}', '{{attr}} in {{object}}': '{{attr}} in {{object}}', '{{attr}} should not be {{value}}': '{{attr}} sollte nicht {{value}} sein', '{{ordinalName}} point mismatch at {{location}}': '{{ordinalName}} Punkt stimmt nicht mit {{location}} überein', 'play': 'abspielen', 'pause': 'pausieren', 'restart': 'neustarten', 'loop': 'wiederholen', 'TypeError': 'Typfehler', '{{error}}: in {{callSpec}}, {{value}} is not a legal align value': '{{error}}: in {{callSpec}}, {{value}} is not a legal align value', "{{error}}: {{callSpec}} got an unexpected keyword argument '{{arg}}'": "{{error}}: {{callSpec}} got an unexpected keyword argument '{{arg}}'", 'contains(x, y)': 'beinhaltet(x, y)', 'hitTest(x, y)': 'treffenTest(x, y)', 'addPoint(x, y)': 'fügePunktHinzu(x, y)', 'red': 'red', 'green': 'green', 'blue': 'blue', '{{callSpec}} must start with http:// or https://': '{{callSpec}} muss mit http:// or https:// beginnen'}}
-
-# end_translate
-# fmt: on
-
-cmuGraphicsLanguage = 'en'
-
-
-def deburr(s):
-    return re.sub('[\u0300-\u036f]', '', unicodedata.normalize('NFD', s))
+import weakref
+from cmu_graphics.translations import (
+    TRANSLATED_STRINGS,
+    TRANSLATED_USER_FUNCTION_NAMES,
+    TRANSLATION_CONTEXT_LOOKUP,
+    accentCombinations,
+    loadPrecompiledTranslations,
+    reverseTranslationDict,
+)
 
 
-def accentCombinations(word):
-    if word == '':
-        return ['']
+cmuGraphicsLanguage = 'en'
 
-    output = []
-    partials = accentCombinations(word[1:])
 
-    letter = word[0]
-    deburredLetter = deburr(letter)
+# The reverse dicts for each toEnglish context, built the first time the
+# context is looked up, since most apps only ever use a few contexts
+reverseTranslationDicts = dict()
+
+
+def getReverseTranslationDict(context):
+    # Any other context searches all strings
+    if context not in TRANSLATION_CONTEXT_LOOKUP:
+        context = None
+    if context not in reverseTranslationDicts:
+        reverseDict = None
+        if context is None:
+            # Only the all strings dict is slow enough to build that loading
+            # the build's copy of it is faster
+            reverseDict = loadPrecompiledTranslations()
+        if reverseDict is None:
+            reverseDict = reverseTranslationDict(
+                TRANSLATION_CONTEXT_LOOKUP.get(context, TRANSLATED_STRINGS)
+            )
+        reverseTranslationDicts[context] = reverseDict
+    return reverseTranslationDicts[context]
 
-    for partial in partials:
-        output.append(letter + partial)
-        if letter != deburredLetter:
-            output.append(deburredLetter + partial)
 
-    return output
+# Maps each language to every spelling of each user function name in it, with
+# and without accents. Built the first time the language is looked up.
+userFunctionNames = dict()
 
 
-def reverseTranslationDict(d):
-    reverseDict = dict()
-    for language in d:
-        if language != 'keys':
-            reverseDict[language] = dict()
-            for key in d[language]:
-                for accentCombination in accentCombinations(d[language][key]):
-                    reverseDict[language][accentCombination] = key
-
-    reverseDict['en'] = dict()
-    for key in d['keys']:
-        reverseDict['en'][key] = key
-
-    return reverseDict
-
-
-REVERSE_TRANSLATED_COLOR_NAMES = reverseTranslationDict(TRANSLATED_COLOR_NAMES)
-REVERSE_TRANSLATED_GRADIENT_STARTS = reverseTranslationDict(TRANSLATED_GRADIENT_STARTS)
-REVERSE_TRANSLATED_ALIGNS = reverseTranslationDict(TRANSLATED_ALIGNS)
-REVERSE_TRANSLATED_SHAPE_ATTRS = reverseTranslationDict(TRANSLATED_SHAPE_ATTRS)
-REVERSE_TRANSLATED_BOOLEANS = reverseTranslationDict(TRANSLATED_BOOLEANS)
-REVERSE_TRANSLATED_GLOBALS = reverseTranslationDict(TRANSLATED_GLOBALS)
-REVERSE_TRANSLATED_USER_FUNCTION_NAMES = reverseTranslationDict(
-    TRANSLATED_USER_FUNCTION_NAMES
-)
-REVERSE_TRANSLATED_KEY_NAMES = reverseTranslationDict(TRANSLATED_KEY_NAMES)
-REVERSE_TRANSLATED_APP_ATTRS = reverseTranslationDict(TRANSLATED_APP_ATTRS)
-REVERSE_TRANSLATED_STRINGS = reverseTranslationDict(TRANSLATED_STRINGS)
-
-for language in TRANSLATED_USER_FUNCTION_NAMES:
-    if language == 'keys':
-        continue
-    for en_name, trans_name in TRANSLATED_USER_FUNCTION_NAMES[language].items():
-        TRANSLATED_USER_FUNCTION_NAMES[language][en_name] = accentCombinations(
-            trans_name
-        )
-
-TRANSLATION_CONTEXT_LOOKUP = {
-    'shape-attr': REVERSE_TRANSLATED_SHAPE_ATTRS,
-    'align': REVERSE_TRANSLATED_ALIGNS,
-    'gradient-start': REVERSE_TRANSLATED_GRADIENT_STARTS,
-    'color': REVERSE_TRANSLATED_COLOR_NAMES,
-    'boolean': REVERSE_TRANSLATED_BOOLEANS,
-    'global': REVERSE_TRANSLATED_GLOBALS,
-    'user-function-name': REVERSE_TRANSLATED_USER_FUNCTION_NAMES,
-    'key-name': REVERSE_TRANSLATED_KEY_NAMES,
-    'app-attr': REVERSE_TRANSLATED_APP_ATTRS,
-}
+def getUserFunctionNames(language):
+    if language not in userFunctionNames:
+        userFunctionNames[language] = {
+            enName: accentCombinations(name)
+            for enName, name in TRANSLATED_USER_FUNCTION_NAMES[language].items()
+        }
+    return userFunctionNames[language]
 
 
 def getOrDefault(d, key):
@@ -130,6 +89,34 @@ def reverseSearchLanguageDict(d, key):
     return key, None
 
 
+# Maps each translation context (and None, for all other strings) to a dict
+# from every word toEnglish accepts to its English translation, so toEnglish
+# is a single lookup. Words in the current language take priority, as in
+# reverseSearchLanguageDict. Each dict is filled the first time its context is
+# used, and updated in place when the language changes, so they can be kept.
+englishLookups = dict()
+
+
+def fillEnglishLookup(context, lookup):
+    searchDict = getReverseTranslationDict(context)
+    lookup.clear()
+    for language in [cmuGraphicsLanguage, *searchDict]:
+        for key, translation in searchDict[language].items():
+            lookup.setdefault(key, translation)
+
+
+def getEnglishLookup(context):
+    if context not in englishLookups:
+        englishLookups[context] = dict()
+        fillEnglishLookup(context, englishLookups[context])
+    return englishLookups[context]
+
+
+def updateEnglishLookups():
+    for context, lookup in englishLookups.items():
+        fillEnglishLookup(context, lookup)
+
+
 def t(key, variables=None, language=None):
     if language is None:
         language = cmuGraphicsLanguage
@@ -147,16 +134,13 @@ def toEnglish(key, context, returnLanguage=False):
     if context == 'color':
         key = key.lower()
 
-    searchDict = TRANSLATION_CONTEXT_LOOKUP.get(context, None)
-    if searchDict is None:
-        searchDict = REVERSE_TRANSLATED_STRINGS
+    if not returnLanguage:
+        lookup = englishLookups.get(context)
+        if lookup is None:
+            lookup = getEnglishLookup(context)
+        return lookup.get(key, key)
 
-    translation, originalLanguage = reverseSearchLanguageDict(searchDict, key)
-
-    if returnLanguage:
-        return translation, originalLanguage
-    else:
-        return translation
+    return reverseSearchLanguageDict(getReverseTranslationDict(context), key)
 
 
 supportedLanguages = ['en', 'es', 'de']
@@ -545,16 +529,23 @@ def getAlignAttrs(align):
     return [xattr, yattr]
 
 
+def rgbaToCairoPixels(rgbaBytes):
+    # Cairo's ARGB32 pixels are stored as BGRA bytes, so swap red and blue
+    pixels = bytearray(rgbaBytes)
+    pixels[0::4], pixels[2::4] = pixels[2::4], pixels[0::4]
+    return pixels
+
+
 def cairoSurfaceFromPilImage(image):
     image = image.convert('RGBA')  # ensure we have the correct number of channels
-    a = array.array('B', image.tobytes('raw', 'RGBA'))
+    a = rgbaToCairoPixels(image.tobytes('raw', 'RGBA'))
     surface = cairo.ImageSurface.create_for_data(
         a, cairo.FORMAT_ARGB32, image.size[0], image.size[1]
     )
     return surface
 
 def cairoSurfaceFromPygameSurface(pygameSurface):
-    a = array.array('B', pygame.image.tostring(pygameSurface, 'RGBA'))
+    a = rgbaToCairoPixels(pygame.image.tostring(pygameSurface, 'RGBA'))
     surface = cairo.ImageSurface.create_for_data(
         a, cairo.FORMAT_ARGB32, *pygameSurface.get_size()
     )
@@ -584,7 +575,7 @@ def loadImageFromStringReference(reference):
     if reference.startswith('http'):
         # reference is a url
         try:
-            response = webrequest.get(reference)
+            response = webrequest.get(reference, cache=True)
             image = pygame.image.load(BytesIO(response.read()))
         except Exception:
             pyThrow(t('Failed to load image data'))
@@ -660,6 +651,7 @@ def initShapeAttrs():
     ShapeAttr('bold', checkBoolean, False)
     ShapeAttr('italic', checkBoolean, False)
     ShapeAttr('visible', checkBoolean, True)
+    ShapeAttr('cached', checkBoolean, False)
     ShapeAttr('url', checkUrl, None)
     ShapeAttr('db', checkValue, '')
     ShapeAttr('group', checkValue, None)
@@ -1034,13 +1026,45 @@ class Gradient(object, metaclass=_ShapeMetaclass):
 Gradient.__name__ = 'gradient'
 
 
+def getColorRGBA(color, opacity):
+    if color is None:
+        return (0, 0, 0, 1)
+    if isinstance(color, str):
+        color = CSS3_COLORS_TO_RGB[toEnglish(color, 'color').lower()]
+    return (color.red / 255, color.green / 255, color.blue / 255, opacity / 100)
+
+
 class Drawing(object):
     def __init__(self):
         self.tlg = None
         self.images = {}
-        self.addCounter = 0
         self.appProperties = {'maxShapeCount': 2000}
         self.nextShapeId = 0
+        # Maps shape ids to (shape, box last drawn) for every shape changed
+        # since the last frame, or None when damage tracking is off
+        self.damage = None
+        # Incremented whenever something inside a top level group changes,
+        # so the main loop can tell when an idle app needs redrawing
+        self.changeCount = 0
+
+    def setDamageTracking(self, enabled):
+        self.damage = {} if enabled else None
+
+    def takeDamage(self):
+        # Returns the (left, top, right, bottom) boxes that need repainting
+        # since the last call, or None if damage tracking is off
+        if self.damage is None:
+            return None
+        boxes = []
+        for shape, oldBox in self.damage.values():
+            if oldBox is not None:
+                boxes.append(oldBox)
+            if shape._group is not None:
+                newBox = shape.getDamageBox()
+                if newBox is not None:
+                    boxes.append(newBox)
+        self.damage = {}
+        return boxes
 
 
 activeDrawing = Drawing()
@@ -1071,15 +1095,35 @@ def shape_property(getter, setter=None):
 
 
 class Shape(object):
+    # Shapes have fixed fields, since apps can have many thousands of them
+    __slots__ = (
+        '__weakref__',
+        '_group',
+        '_node',
+        '_versionCache',
+        'attrDefaults',
+        'attrs',
+        'defaultAlign',
+        'id',
+        'oldGroup',
+        'studentShape',
+        'version',
+        'zindex',
+    )
+    isGroup = False
+
     def __init__(self, attrs=None):
         self.id = activeDrawing.nextShapeId
         activeDrawing.nextShapeId += 1
+        # Incremented by every attribute change
+        self.version = 0
+        # (version, values) for getCachedValue
+        self._versionCache = None
 
         self._group = self.oldGroup = None
-        # A list of shapes that this shape was in front of its current/previous group
-        self.shapesToBeInFrontOf = []
-        self.shapesInOldGroup = {}
-        self.isGroup = False
+        # This shape's link in its current group's list of children, or its
+        # ghost link in its previous group
+        self._node = None
         # zIndex is global across all groups
         self.zindex = -1
         self.attrs = {'class': self.__class__.__name__}
@@ -1104,9 +1148,76 @@ class Shape(object):
         return t(self.attrDefaults[attr])
 
     def setAttr(self, attr, value):
+        self.invalidate()
         self.attrs[attr] = value
+        self.version += 1
+        if self._group is not None:
+            self._group.childChanged(self)
         return value
 
+    def countShapes(self):
+        # How much this shape counts towards app.maxShapeCount
+        return 1
+
+    def invalidate(self):
+        # Must be called before the shape changes, so that the damage tracker
+        # can record where the shape was last drawn
+        damage = activeDrawing.damage
+        if damage is not None and self._group is not None and self.id not in damage:
+            damage[self.id] = (self, self.getDamageBox())
+
+    def getDamageBox(self):
+        attrs = self.attrs
+        if 'centerX' not in attrs or 'width' not in attrs:
+            return None
+        halfWidth = attrs['width'] / 2
+        halfHeight = attrs['height'] / 2
+        pad = self.getDamagePadding()
+        return (
+            attrs['centerX'] - halfWidth - pad,
+            attrs['centerY'] - halfHeight - pad,
+            attrs['centerX'] + halfWidth + pad,
+            attrs['centerY'] + halfHeight + pad,
+        )
+
+    def getCachedValue(self, key, compute):
+        # Returns compute(), reusing the result until the shape's version
+        # changes. The result must not be modified.
+        cache = self._versionCache
+        if cache is None or cache[0] != self.version:
+            cache = self._versionCache = (self.version, dict())
+        values = cache[1]
+        if key not in values:
+            values[key] = compute()
+        return values[key]
+
+    def getHitBounds(self):
+        return self.getCachedValue('hitBounds', self.computeHitBounds)
+
+    def computeHitBounds(self):
+        # Returns (left, top, right, bottom) around every point that hits or
+        # contains can be True for, or None if that isn't known
+        pts = self.getApproxPoints()
+        if not pts:
+            return None
+        box = utils.getBoxDims(pts)
+        return (
+            box['left'],
+            box['top'],
+            box['left'] + box['width'],
+            box['top'] + box['height'],
+        )
+
+    def getDrawnBox(self):
+        # Returns (left, top, right, bottom) around everything draw() paints,
+        # or None if that isn't known
+        return self.getDamageBox()
+
+    def getDamagePadding(self):
+        # Antialiasing touches the pixels just outside the shape, and debug
+        # points are drawn over its edges
+        return 8 if self.attrs.get('db') else 2
+
     def set(self, attrs):
         result = None
         for attr in attrs:
@@ -1383,14 +1494,14 @@ class Shape(object):
         x, y = arguments
         checkNumber(t('contains(x, y)'), 'x', x, True)
         checkNumber(t('contains(x, y)'), 'y', y, True)
-        return utils.polygonContainsPoint(self.getApproxPoints(), x, y)
+        return utils.polygonContainsPoint(self.getPointArray(), x, y)
 
     def _filled(self):
         return self.fill is not None or isinstance(self, CMUImage)
 
     def _hits(self, x, y):
         # Internal method used by hitsShape and hits, no typechecking
-        pts = self.getApproxPoints()
+        pts = self.getPointArray()
         if not utils.polygonContainsPoint(pts, x, y):
             return False
         if self._filled():
@@ -1410,7 +1521,17 @@ class Shape(object):
         checkNumber(t('hits(x, y)'), t('y'), y, True)
         return self._hits(x, y)
 
+    def getPointArray(self):
+        # The approximate points in the form that the utils geometry
+        # functions handle fastest
+        return self.getCachedValue(
+            'pointArray', lambda: utils.toPointArray(self.getApproxPoints())
+        )
+
     def getEdges(self):
+        return self.getCachedValue('edges', self.computeEdges)
+
+    def computeEdges(self):
         edges = []
         approxPoints = self.getApproxPoints()
         for i in range(len(approxPoints)):
@@ -1446,6 +1567,9 @@ class Shape(object):
         return not self.edgesIntersect(targetShape) and self.contains(x, y)
 
     def getBounds(self):
+        return self.getCachedValue('bounds', self.computeBounds)
+
+    def computeBounds(self):
         return {
             'left': self.left,
             'top': self.top,
@@ -1534,15 +1658,21 @@ class Shape(object):
             self.group._toBack(self)
 
     def setFillOrStrokeStyle(self, ctx, fillOrBorder):
-        style = self.getFillOrStrokeStyle(fillOrBorder)
+        # Gradients aren't hashable, but the one being drawn is held by the
+        # shape's attrs for as long as its version (and so the cache) lasts
+        if isinstance(fillOrBorder, Gradient):
+            key = ('style', id(fillOrBorder))
+        else:
+            key = ('style', fillOrBorder)
+        style = self.getCachedValue(
+            key, lambda: self.getFillOrStrokeStyle(fillOrBorder)
+        )
         if isinstance(style, cairo.Gradient):
             ctx.set_source(style)
         else:
             ctx.set_source_rgba(*style)
 
     def getFillOrStrokeStyle(self, fillOrBorder):
-        if fillOrBorder is None:
-            return (0, 0, 0, 1)
         if isinstance(fillOrBorder, Gradient):
             gradient = fillOrBorder
             g = self.createBaseGradient(gradient)
@@ -1551,16 +1681,7 @@ class Shape(object):
                 color = gradient.colors[i]
                 g.add_color_stop_rgba(i / (n - 1), *self.getFillOrStrokeStyle(color))
             return g
-        if isinstance(fillOrBorder, str):
-            fillOrBorder = CSS3_COLORS_TO_RGB[toEnglish(fillOrBorder, 'color').lower()]
-        # Flips RGBA to BGRA because Cairo is going to flip it back
-        rgba = (
-            fillOrBorder.blue / 255,
-            fillOrBorder.green / 255,
-            fillOrBorder.red / 255,
-            self.opacity / 100,
-        )
-        return rgba
+        return getColorRGBA(fillOrBorder, self.opacity)
 
     def setDashes(self, ctx):
         if isinstance(self.dashes, bool):
@@ -1636,8 +1757,11 @@ class Shape(object):
     def draw(self, ctx):
         ctx.save()
         if self.isGroup:
-            for s in self._shapes:
-                s.draw(ctx)
+            if self.get('cached'):
+                self.drawCached(ctx)
+            else:
+                for s in self._shapes:
+                    s.draw(ctx)
         else:
             bw = self.borderWidth if self.border else 0
             if isinstance(self, Label):
@@ -1653,14 +1777,19 @@ class Shape(object):
                     ctx.rotate(utils.toRadians(self.rotateAngle))
                     ctx.translate(-targetX, -targetY)
 
-                ctx.select_font_face(*getFont(self.font, self.bold, self.italic))
+                fontFace = getFont(self.font, self.bold, self.italic)
+                ctx.select_font_face(*fontFace)
                 ctx.set_font_size(self.size)
                 text = str(self.value)
 
+                # Same path as ctx.text_path, but the glyphs are cached. The
+                # translation is undone before setting the source so that
+                # gradients stay where they belong.
+                x = targetX - self.attrs['xAdjust']
                 ctx.new_path()
-                ctx.move_to(targetX - self.attrs['xAdjust'], targetY)
-
-                ctx.text_path(text)
+                ctx.translate(x, targetY)
+                ctx.glyph_path(getTextGlyphs(ctx, text, fontFace, self.size))
+                ctx.translate(-x, -targetY)
 
                 self.setFillOrStrokeStyle(ctx, self.fill)
                 ctx.fill_preserve()
@@ -1718,9 +1847,7 @@ def countShapesInGroup(shape):
     # First make it a sl shape so hasattr doesn't call getattr and crash
     if hasattr(shape, '_shape'):
         shape = shape._shape
-    if not hasattr(shape, '_shapes') or not shape._shapes:
-        return 1
-    return sum(map(countShapesInGroup, shape))
+    return shape.countShapes()
 
 
 def checkRecursiveGroupAddition(group, shape):
@@ -1731,15 +1858,723 @@ def checkRecursiveGroupAddition(group, shape):
             checkRecursiveGroupAddition(group, subshape)
 
 
+# Groups prune the ghosts of removed children that aren't needed once they
+# have this many more new ghosts than they had nodes after their last prune
+MIN_GHOSTS_TO_PRUNE = 32
+
+# Groups with at least this many children keep a SpatialGrid of them, so
+# that hitTest, hits and contains only look at the children near the point
+HIT_INDEX_MIN_SHAPES = 64
+HIT_INDEX_CELL_SIZE = 32
+# Shapes that cover more cells than this are checked on every lookup instead
+HIT_INDEX_MAX_CELLS = 64
+# Points this close to a polygon's edge count as inside it (see
+# utils.polygonContainsPoint)
+HIT_INDEX_MARGIN = 0.05
+
+
+def padHitBounds(bounds):
+    # Returns the bounds with HIT_INDEX_MARGIN added, or None if they can't
+    # be used to rule anything out
+    if bounds is None or not all(map(utils.isFinite, bounds)):
+        return None
+    left, top, right, bottom = bounds
+    return (
+        left - HIT_INDEX_MARGIN,
+        top - HIT_INDEX_MARGIN,
+        right + HIT_INDEX_MARGIN,
+        bottom + HIT_INDEX_MARGIN,
+    )
+
+
+def hitBoundsOverlap(bounds1, bounds2):
+    return (
+        bounds1[0] <= bounds2[2]
+        and bounds2[0] <= bounds1[2]
+        and bounds1[1] <= bounds2[3]
+        and bounds2[1] <= bounds1[3]
+    )
+
+
+class SpatialGrid(object):
+    # Buckets shapes by the grid cells that their hit bounds overlap
+    def __init__(self):
+        self.cells = dict()
+        # Maps shape ids to (shape, bounds, cell keys)
+        self.entries = dict()
+        # Shapes without usable bounds, which could be at any point
+        self.unboundedShapes = dict()
+
+    def remove(self, shape):
+        entry = self.entries.pop(shape.id, None)
+        if entry is not None:
+            for key in entry[2]:
+                cell = self.cells[key]
+                del cell[shape.id]
+                if not cell:
+                    del self.cells[key]
+        self.unboundedShapes.pop(shape.id, None)
+
+    def getCellKeys(self, bounds):
+        # Returns the cells that the padded bounds overlap, or None if there
+        # are too many of them
+        col0, row0, col1, row1 = (int(v // HIT_INDEX_CELL_SIZE) for v in bounds)
+        if (col1 - col0 + 1) * (row1 - row0 + 1) > HIT_INDEX_MAX_CELLS:
+            return None
+        return [
+            (col, row) for col in range(col0, col1 + 1) for row in range(row0, row1 + 1)
+        ]
+
+    def add(self, shape, bounds):
+        self.remove(shape)
+        bounds = padHitBounds(bounds)
+        keys = None if bounds is None else self.getCellKeys(bounds)
+        if keys is None:
+            self.unboundedShapes[shape.id] = shape
+            return
+        for key in keys:
+            self.cells.setdefault(key, dict())[shape.id] = shape
+        self.entries[shape.id] = (shape, bounds, keys)
+
+    def getShapesAt(self, x, y):
+        shapes = list(self.unboundedShapes.values())
+        key = (int(x // HIT_INDEX_CELL_SIZE), int(y // HIT_INDEX_CELL_SIZE))
+        for shapeId in self.cells.get(key, ()):
+            shape, (left, top, right, bottom), _ = self.entries[shapeId]
+            if left <= x <= right and top <= y <= bottom:
+                shapes.append(shape)
+        return shapes
+
+    def getShapesIn(self, bounds):
+        # Returns the shapes whose hit bounds may overlap the padded bounds,
+        # or None if that would take longer than checking every shape
+        keys = self.getCellKeys(bounds)
+        if keys is None:
+            return None
+        shapes = dict(self.unboundedShapes)
+        for key in keys:
+            for shapeId, shape in self.cells.get(key, dict()).items():
+                if shapeId not in shapes and hitBoundsOverlap(
+                    bounds, self.entries[shapeId][1]
+                ):
+                    shapes[shapeId] = shape
+        return list(shapes.values())
+
+
+class ShapeNode(object):
+    # A node for one stay of a shape in a group. When the shape is removed
+    # the node stays behind as a ghost, which records where the shape was
+    # while it was in the group. Nodes never move past each other, so the
+    # ghosts show which shapes were behind which when a shape was removed,
+    # and adding it back can put it where it was.
+    __slots__ = (
+        'addedAt',
+        'ghostOf',
+        'group',
+        'left',
+        'liveCount',
+        'minAddedAt',
+        'minId',
+        'nextStay',
+        'parent',
+        'prevStay',
+        'priority',
+        'removedAt',
+        'right',
+        'shape',
+    )
+
+    def __init__(self, group, shape, addedAt):
+        self.group = group
+        self.shape = shape
+        # A weak reference to the removed shape, for ghosts
+        self.ghostOf = None
+        # The group's clock when the shape was added and removed
+        self.addedAt = addedAt
+        self.removedAt = None
+        # The shape's previous and next stays in the same group
+        self.prevStay = self.nextStay = None
+        # The node's place in its group's ShapeTree, and the live nodes under
+        # it: how many there are, and the smallest addedAt and shape id
+        self.parent = self.left = self.right = None
+        self.priority = random.random()
+        self.liveCount = 1
+        self.minAddedAt = addedAt
+        self.minId = shape.id
+
+    def isGhost(self):
+        return self.shape is None
+
+
+class ShapeTree(object):
+    # A group's nodes, live and ghost, back to front. It's a treap: a binary
+    # tree in list order whose nodes are also ordered by random priorities,
+    # which keeps its depth O(log n), so each method below that doesn't visit
+    # every node takes O(log n) time.
+    def __init__(self):
+        self.root = None
+
+    def __iter__(self):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node
+                node = node.right
+
+    def update(self, node):
+        if node.shape is None:
+            liveCount = 0
+            minAddedAt = minId = math.inf
+        else:
+            liveCount = 1
+            minAddedAt = node.addedAt
+            minId = node.shape.id
+        left = node.left
+        if left is not None:
+            liveCount += left.liveCount
+            if left.minAddedAt < minAddedAt:
+                minAddedAt = left.minAddedAt
+            if left.minId < minId:
+                minId = left.minId
+        right = node.right
+        if right is not None:
+            liveCount += right.liveCount
+            if right.minAddedAt < minAddedAt:
+                minAddedAt = right.minAddedAt
+            if right.minId < minId:
+                minId = right.minId
+        node.liveCount = liveCount
+        node.minAddedAt = minAddedAt
+        node.minId = minId
+
+    def ghost(self, node, shape):
+        # Called after node's shape, which was shape, is removed. The smallest
+        # values above it only change where they came from node.
+        self.update(node)
+        addedAt = node.addedAt
+        shapeId = shape.id
+        node = node.parent
+        while node is not None:
+            node.liveCount -= 1
+            if node.minAddedAt == addedAt or node.minId == shapeId:
+                self.update(node)
+            node = node.parent
+
+    def rotateUp(self, node):
+        parent = node.parent
+        grandparent = parent.parent
+        if node is parent.left:
+            parent.left = node.right
+            if node.right is not None:
+                node.right.parent = parent
+            node.right = parent
+        else:
+            parent.right = node.left
+            if node.left is not None:
+                node.left.parent = parent
+            node.left = parent
+        parent.parent = node
+        node.parent = grandparent
+        if grandparent is None:
+            self.root = node
+        elif grandparent.left is parent:
+            grandparent.left = node
+        else:
+            grandparent.right = node
+        self.update(parent)
+
+    def attach(self, node, parent, isLeft):
+        node.parent = parent
+        if parent is None:
+            self.root = node
+        elif isLeft:
+            parent.left = node
+        else:
+            parent.right = node
+        while node.parent is not None and node.priority > node.parent.priority:
+            self.rotateUp(node)
+        self.update(node)
+        # The nodes above have one more live node under them
+        addedAt = node.addedAt
+        shapeId = node.shape.id
+        node = node.parent
+        while node is not None:
+            node.liveCount += 1
+            if addedAt < node.minAddedAt:
+                node.minAddedAt = addedAt
+            if shapeId < node.minId:
+                node.minId = shapeId
+            node = node.parent
+
+    def getFirst(self, node):
+        while node is not None and node.left is not None:
+            node = node.left
+        return node
+
+    def getLast(self, node):
+        while node is not None and node.right is not None:
+            node = node.right
+        return node
+
+    def insertBefore(self, node, nextNode):
+        # Puts node right behind nextNode, or at the front if it's None
+        if nextNode is None:
+            self.attach(node, self.getLast(self.root), False)
+        elif nextNode.left is None:
+            self.attach(node, nextNode, True)
+        else:
+            self.attach(node, self.getLast(nextNode.left), False)
+
+    def insertAfter(self, node, prevNode):
+        # Puts node right in front of prevNode, or at the back if it's None
+        if prevNode is None:
+            self.attach(node, self.getFirst(self.root), True)
+        elif prevNode.right is None:
+            self.attach(node, prevNode, False)
+        else:
+            self.attach(node, self.getFirst(prevNode.right), True)
+
+    def getRank(self, node):
+        # Returns the number of live nodes behind node
+        rank = node.left.liveCount if node.left is not None else 0
+        while node.parent is not None:
+            if node is node.parent.right:
+                rank += node.parent.liveCount - node.liveCount
+            node = node.parent
+        return rank
+
+    def getLiveNode(self, index):
+        node = self.root
+        while node is not None:
+            leftCount = node.left.liveCount if node.left is not None else 0
+            if index < leftCount:
+                node = node.left
+                continue
+            index -= leftCount
+            if not node.isGhost():
+                if index == 0:
+                    return node
+                index -= 1
+            node = node.right
+        return None
+
+    def findLast(self, before, limit, byId):
+        # Returns the frontmost live node behind before, or anywhere if before
+        # is None, whose addedAt (or shape id, if byId) is below limit
+        if before is None:
+            return self.findLastUnder(self.root, limit, byId)
+        found = self.findLastUnder(before.left, limit, byId)
+        node = before
+        while found is None and node.parent is not None:
+            parent = node.parent
+            if node is parent.right:
+                if not parent.isGhost() and (
+                    parent.shape.id if byId else parent.addedAt
+                ) < limit:
+                    return parent
+                found = self.findLastUnder(parent.left, limit, byId)
+            node = parent
+        return found
+
+    def findLastUnder(self, node, limit, byId):
+        while node is not None and (node.minId if byId else node.minAddedAt) < limit:
+            right = node.right
+            if right is not None and (right.minId if byId else right.minAddedAt) < limit:
+                node = right
+            elif not node.isGhost() and (node.shape.id if byId else node.addedAt) < limit:
+                return node
+            else:
+                node = node.left
+        return None
+
+    def getPath(self, node):
+        # Returns a list that sorts like the node's place: its turns from the
+        # root, 0 for left and 2 for right, followed by a 1
+        path = [1]
+        while node.parent is not None:
+            path.append(0 if node is node.parent.left else 2)
+            node = node.parent
+        path.reverse()
+        return path
+
+    def isBefore(self, node, otherNode):
+        return self.getPath(node) < self.getPath(otherNode)
+
+    def rebuild(self, nodes):
+        # Makes the tree hold nodes, which are in list order, in linear time
+        stack = []
+        for node in nodes:
+            node.parent = node.right = None
+            lowerNode = None
+            while stack and stack[-1].priority < node.priority:
+                lowerNode = stack.pop()
+            node.left = lowerNode
+            if lowerNode is not None:
+                lowerNode.parent = node
+            if stack:
+                stack[-1].right = node
+                node.parent = stack[-1]
+            stack.append(node)
+        self.root = stack[0] if stack else None
+
+        # Children are updated before their parents
+        order = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(child for child in (node.left, node.right) if child is not None)
+        for node in reversed(order):
+            self.update(node)
+
+
 class Group(Shape):
+    __slots__ = (
+        '_bitmap',
+        '_clock',
+        '_descendantCount',
+        '_grid',
+        '_gridStaleShapes',
+        '_nodeCount',
+        '_nodes',
+        '_nodesByTime',
+        '_pruneAt',
+        '_shapeCount',
+        '_shapeList',
+        '_stays',
+    )
+    isGroup = True
+
     def __init__(self, attrs):
+        # Children are kept back to front in _shapes, which is changed in
+        # place, and their nodes, with the ghosts of removed children, in a
+        # ShapeTree. Finding a child's place takes O(log n) time, except that
+        # putting a child back where it was also checks each node added since
+        # it was removed (see getRestorePoint). _shapes is then changed with
+        # one list insert or delete.
+        self._nodes = ShapeTree()
+        # Every node in the order it was added, and each shape's latest node
+        self._nodesByTime = []
+        self._stays = dict()
+        # Unneeded ghosts are pruned once there are more than _pruneAt ghosts
+        self._nodeCount = 0
+        self._pruneAt = MIN_GHOSTS_TO_PRUNE
+        # Counts the shapes added to and removed from this group
+        self._clock = 0
+        self._shapeCount = 0
+        # The total of countShapes() over the children
+        self._descendantCount = 0
+        self._shapeList = []
+        # The SpatialGrid of the children, once there are enough of them, and
+        # the children that may have moved since it was last updated
+        self._grid = None
+        self._gridStaleShapes = None
+        # (surface, x, y, key) of the children drawn when group.cached is
+        # True, until any of them changes
+        self._bitmap = None
         super().__init__(attrs)
-        self.isGroup = True
-        self._shapes = []
+
+    def getShapeList(self):
+        return self._shapeList
+
+    _shapes = property(getShapeList)
+
+    def countShapes(self):
+        # An empty group counts as one shape
+        return self._descendantCount if self._shapeCount else 1
+
+    def addToShapeCounts(self, shapeCount, descendantCount):
+        oldCount = self.countShapes()
+        self._shapeCount += shapeCount
+        self._descendantCount += descendantCount
+        # Every group above this one counts this one's descendants too
+        delta = self.countShapes() - oldCount
+        group = self._group
+        while group is not None and delta != 0:
+            group._descendantCount += delta
+            group = group._group
+
+    def addNode(self, node):
+        # Called after node is put in the tree
+        shape = node.shape
+        prevStay = self._stays.get(shape.id)
+        if prevStay is not None:
+            prevStay.nextStay = node
+            node.prevStay = prevStay
+        self._stays[shape.id] = node
+        self._nodesByTime.append(node)
+        self._nodeCount += 1
+        shape._node = node
+        self._shapeList.insert(self._nodes.getRank(node), shape)
+        self.addToShapeCounts(1, shape.countShapes())
+
+    def tick(self):
+        self._clock += 1
+        return self._clock
+
+    def isRestorePoint(self, node):
+        # Whether node is the ghost of a shape that goes back to where it was
+        # when it's added to this group again
+        shape = node.ghostOf()
+        return shape is not None and shape._node is node and shape.oldGroup is self
+
+    def isGhostNeeded(self, node, removalTimes):
+        # A ghost is needed while its shape may come back to where it was, or
+        # while its shape was in the group when such a shape was removed
+        if node.ghostOf() is None:
+            return False
+        if self.isRestorePoint(node):
+            return True
+        i = bisect.bisect_right(removalTimes, node.addedAt)
+        return i < len(removalTimes) and removalTimes[i] < node.removedAt
+
+    def pruneGhosts(self):
+        # Drops the ghosts that aren't needed, and rebuilds the tree from the
+        # other nodes. This visits every node, so _pruneAt is set to make the
+        # next prune wait for more new ghosts than there are nodes now.
+        removalTimes = sorted(
+            node.removedAt
+            for node in self._nodesByTime
+            if node.isGhost() and self.isRestorePoint(node)
+        )
+        keptNodes = []
+        for node in self._nodes:
+            if not node.isGhost() or self.isGhostNeeded(node, removalTimes):
+                keptNodes.append(node)
+                continue
+            node.group = None
+            if node.prevStay is not None:
+                node.prevStay.nextStay = node.nextStay
+            if node.nextStay is not None:
+                node.nextStay.prevStay = node.prevStay
+        self._stays = dict()
+        for node in keptNodes:
+            if node.nextStay is None:
+                shape = node.shape if not node.isGhost() else node.ghostOf()
+                self._stays[shape.id] = node
+        self._nodesByTime = [node for node in self._nodesByTime if node.group is self]
+        self._nodes.rebuild(keptNodes)
+        self._nodeCount = len(keptNodes)
+        self._pruneAt = 2 * self._nodeCount - self._shapeCount + MIN_GHOSTS_TO_PRUNE
+
+    def getRestorePoint(self, shape):
+        # Returns the node that shape goes right in front of when it's added
+        # back to this group, or None if it goes at the back. Like a list of
+        # children that never changes order, it goes in front of every shape
+        # that was behind it when it was removed, and of every older shape
+        # that has been added since.
+        anchor = shape._node
+        if anchor is None or anchor.group is not self or not anchor.isGhost():
+            # Where it was isn't known, so it only goes in front of the
+            # older shapes
+            return self._nodes.findLast(None, shape.id, True)
+
+        # Shapes that have stayed in the group since then were behind it if
+        # their nodes are
+        removedAt = anchor.removedAt
+        restorePoint = self._nodes.findLast(anchor, removedAt, False)
+
+        # The nodes added since then are checked one at a time, so this takes
+        # O(log n) time for each shape added or moved since shape was removed
+        lo, hi = 0, len(self._nodesByTime)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._nodesByTime[mid].addedAt < removedAt:
+                lo = mid + 1
+            else:
+                hi = mid
+        for node in self._nodesByTime[lo:]:
+            if node.isGhost() or not self.wasBehind(node, shape, anchor):
+                continue
+            if restorePoint is None or self._nodes.isBefore(restorePoint, node):
+                restorePoint = node
+        return restorePoint
+
+    def wasBehind(self, node, shape, anchor):
+        # Whether the live node's shape was behind shape when shape was
+        # removed, leaving the ghost anchor. Shapes that weren't in the group
+        # then count as behind it if they're older.
+        stay = node.prevStay
+        while stay is not None and stay.addedAt > anchor.removedAt:
+            stay = stay.prevStay
+        if stay is not None and stay.removedAt > anchor.removedAt:
+            return self._nodes.isBefore(stay, anchor)
+        return node.shape.id < shape.id
+
+    def ghostAllNodes(self):
+        # Removes every child, as if none of them had a place to go back to
+        removedAt = self.tick()
+        for node in self._nodes:
+            if not node.isGhost():
+                node.shape._node = None
+                node.ghostOf = weakref.ref(node.shape)
+                node.shape = None
+                node.removedAt = removedAt
+            # No node has live nodes under it any more
+            node.liveCount = 0
+            node.minAddedAt = node.minId = math.inf
+        self.addToShapeCounts(-self._shapeCount, -self._descendantCount)
+        # A new list, so that loops over the old one aren't disturbed
+        self._shapeList = []
+
+    def childChanged(self, shape):
+        # Called when a child, or anything inside it, may have moved, and when
+        # a child is added or removed
+        self._versionCache = None
+        self._bitmap = None
+        if self._grid is not None:
+            self._gridStaleShapes[shape.id] = shape
+        if self._group is not None:
+            self._group.childChanged(self)
+        else:
+            activeDrawing.changeCount += 1
+
+    def getGrid(self):
+        if self._grid is None:
+            if self._shapeCount < HIT_INDEX_MIN_SHAPES:
+                return None
+            self._grid = SpatialGrid()
+            self._gridStaleShapes = {shape.id: shape for shape in self._shapes}
+        for shape in self._gridStaleShapes.values():
+            if shape._group is self:
+                self._grid.add(shape, shape.getHitBounds())
+            else:
+                self._grid.remove(shape)
+        self._gridStaleShapes = dict()
+        return self._grid
+
+    def getShapesAt(self, x, y):
+        # Returns the children that may hit or contain (x, y), front to back
+        grid = None
+        if all(utils.isNumber(v) and utils.isFinite(v) for v in (x, y)):
+            grid = self.getGrid()
+        if grid is None:
+            return reversed(self._shapes)
+        return sorted(
+            grid.getShapesAt(x, y),
+            key=lambda shape: self._nodes.getRank(shape._node),
+            reverse=True,
+        )
+
+    def computeHitBounds(self):
+        shapes = self._shapes
+        if not shapes:
+            return None
+        left = top = math.inf
+        right = bottom = -math.inf
+        for shape in shapes:
+            bounds = shape.getHitBounds()
+            if bounds is None:
+                return None
+            left = min(left, bounds[0])
+            top = min(top, bounds[1])
+            right = max(right, bounds[2])
+            bottom = max(bottom, bounds[3])
+        return (left, top, right, bottom)
 
     def toString(self):
         return t('Group()')
 
+    def invalidate(self):
+        if activeDrawing.damage is not None:
+            for shape in self._shapes:
+                shape.invalidate()
+
+    def getDamageBox(self):
+        return None
+
+    def getDrawnBox(self):
+        return self.getCachedValue('drawnBox', self.computeDrawnBox)
+
+    def computeDrawnBox(self):
+        shapes = self._shapes
+        if not shapes:
+            return None
+        left = top = math.inf
+        right = bottom = -math.inf
+        for shape in shapes:
+            box = shape.getDrawnBox()
+            if box is None:
+                return None
+            left = min(left, box[0])
+            top = min(top, box[1])
+            right = max(right, box[2])
+            bottom = max(bottom, box[3])
+        return (left, top, right, bottom)
+
+    def get_cached(self):
+        return self.get('cached')
+
+    def set_cached(self, v):
+        self._bitmap = None
+        return self.set({'cached': v})
+
+    cached = shape_property(get_cached, set_cached)
+
+    def drawCached(self, ctx):
+        # Draws the children into an offscreen surface the first time, and
+        # then paints that surface until a child changes (see childChanged),
+        # the context is scaled or moved, or the canvas is resized, since the
+        # bitmap is cut off at the canvas edges
+        target = ctx.get_target()
+        key = (tuple(ctx.get_matrix()),)
+        if isinstance(target, cairo.ImageSurface):
+            key += (target.get_width(), target.get_height())
+        bitmap = self._bitmap
+        if bitmap is None or bitmap[3] != key:
+            bitmap = self._bitmap = self.drawBitmap(ctx, key)
+        if bitmap is None:
+            for s in self._shapes:
+                s.draw(ctx)
+            return
+        surface, x, y, _ = bitmap
+        if surface is None:
+            return
+        ctx.save()
+        ctx.identity_matrix()
+        ctx.set_source_surface(surface, x, y)
+        ctx.paint()
+        ctx.restore()
+
+    def drawBitmap(self, ctx, key):
+        # Returns (surface, x, y, key) with the children drawn as ctx would
+        # draw them, where x and y are the device position of the surface and
+        # key is what drawCached checks before painting it again. The surface is None if none of the children can be seen, and None
+        # is returned if it isn't known where they are drawn.
+        box = self.getDrawnBox()
+        if box is None:
+            return None
+        corners = [
+            ctx.user_to_device(x, y) for x in (box[0], box[2]) for y in (box[1], box[3])
+        ]
+        left = math.floor(min(x for x, _ in corners))
+        top = math.floor(min(y for _, y in corners))
+        right = math.ceil(max(x for x, _ in corners))
+        bottom = math.ceil(max(y for _, y in corners))
+        target = ctx.get_target()
+        if isinstance(target, cairo.ImageSurface):
+            # Nothing outside of the canvas can be seen
+            left = max(left, 0)
+            top = max(top, 0)
+            right = min(right, target.get_width())
+            bottom = min(bottom, target.get_height())
+        width = right - left
+        height = bottom - top
+        if width <= 0 or height <= 0:
+            return (None, left, top, key)
+        surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+        bitmapCtx = cairo.Context(surface)
+        bitmapCtx.translate(-left, -top)
+        bitmapCtx.transform(ctx.get_matrix())
+        for s in self._shapes:
+            s.draw(bitmapCtx)
+        return (surface, left, top, key)
+
     def __iter__(self):
         return iter(self.children)
 
@@ -1751,73 +2586,60 @@ class Group(Shape):
     def insert(self, shape, newIndex=None):
         if shape._group:
             shape._group.remove(shape)
-        # By default, put this shape at the top of the group
-        if newIndex is None:
-            newIndex = len(self._shapes)
-            # But if it was in this group before, put it back in front of all the
-            # shapes that it was in front of before
-            if shape.oldGroup == self:
-                newIndex = 0
-                for s2 in shape.shapesToBeInFrontOf:
-                    s2Index = self._shapes.index(s2) if s2 in self._shapes else -1
-                    if s2Index >= 0:
-                        newIndex = max(newIndex, s2Index + 1)
-
-                for i, s2 in enumerate(self._shapes):
-                    if s2.id not in shape.shapesInOldGroup and shape.id > s2.id:
-                        newIndex = max(newIndex, i + 1)
-
-        self._shapes.insert(newIndex, shape)
+        # By default, put this shape at the top of the group. But if it was in
+        # this group before, put it back where it was.
+        if newIndex is not None:
+            if newIndex < 0:
+                newIndex = max(0, self._shapeCount + newIndex)
+            node = ShapeNode(self, shape, self.tick())
+            self._nodes.insertBefore(node, self._nodes.getLiveNode(newIndex))
+        elif shape.oldGroup == self:
+            restorePoint = self.getRestorePoint(shape)
+            node = ShapeNode(self, shape, self.tick())
+            self._nodes.insertAfter(node, restorePoint)
+        else:
+            node = ShapeNode(self, shape, self.tick())
+            self._nodes.insertBefore(node, None)
+        self.addNode(node)
+
         shape._group = self
+        shape.invalidate()
         shape.zindex = -1
         shape.oldGroup = None
-        shape.shapesToBeInFrontOf = []
-        shape.shapesInOldGroup = {}
+        self.childChanged(shape)
+        if self._nodeCount - self._shapeCount > self._pruneAt:
+            self.pruneGhosts()
 
     def add(self, *shapes):
         for i in range(len(shapes)):
             checkShape(t('Group.add(shape)'), t('shape'), shapes[i], True)
             checkRecursiveGroupAddition(self, shapes[i])
-            activeDrawing.addCounter += 1
-            if activeDrawing.addCounter % 100 == 0:
-                if (
-                    countShapesInGroup(activeDrawing.tlg)
-                    > activeDrawing.appProperties['maxShapeCount']
-                ):
-                    pyThrow(
-                        t(
-                            'Too many shapes: Your code created more than {{maxShapeCount}} shapes. If you would like to increase this limit even though it may cause your code to run slowly, call app.setMaxShapeCount(n).',
-                            {
-                                'maxShapeCount': str(
-                                    activeDrawing.appProperties['maxShapeCount']
-                                )
-                            },
-                        )
+            if (
+                countShapesInGroup(activeDrawing.tlg)
+                > activeDrawing.appProperties['maxShapeCount']
+            ):
+                pyThrow(
+                    t(
+                        'Too many shapes: Your code created more than {{maxShapeCount}} shapes. If you would like to increase this limit even though it may cause your code to run slowly, call app.setMaxShapeCount(n).',
+                        {
+                            'maxShapeCount': str(
+                                activeDrawing.appProperties['maxShapeCount']
+                            )
+                        },
                     )
+                )
             self.insert(shapes[i])
 
     def _toFront(self, shape):
         self.remove(shape)
-        self.insert(shape, len(self._shapes))
+        self.insert(shape, self._shapeCount)
 
     def _toBack(self, shape):
         self.remove(shape)
         self.insert(shape, 0)
 
-    def remove(self, shape):
-        checkShape(t('Group.remove(shape)'), t('shape'), shape, True)
-        currentIndex = self._shapes.index(shape) if shape in self._shapes else -1
-        shape.shapesToBeInFrontOf = self._shapes[:currentIndex]
-        shape.shapesInOldGroup = {}
-
-        for s in self._shapes:
-            shape.shapesInOldGroup[s.id] = s
-
-        for i in range(currentIndex + 1, len(self._shapes)):
-            self._shapes[i].shapesToBeInFrontOf.append(shape)
-
-        if shape in self._shapes:
-            self._shapes.remove(shape)
+    def detachShape(self, shape):
+        shape.invalidate()
         shape.oldGroup = self
         shape._group = None
         shape.zindex = -1
@@ -1831,28 +2653,138 @@ class Group(Shape):
 
         f(shape)
 
+    def remove(self, shape):
+        checkShape(t('Group.remove(shape)'), t('shape'), shape, True)
+        node = shape._node
+        if shape._group is self:
+            # Leave a ghost behind in the shape's place
+            del self._shapeList[self._nodes.getRank(node)]
+            node.shape = None
+            node.ghostOf = weakref.ref(shape)
+            node.removedAt = self.tick()
+            self._nodes.ghost(node, shape)
+            self.addToShapeCounts(-1, -shape.countShapes())
+        elif node is not None and node.isGhost():
+            shape._node = None
+        self.detachShape(shape)
+        self.childChanged(shape)
+
     def clear(self):
         shapes = self._shapes
-        self._shapes = []
+        self.ghostAllNodes()
+        for shape in shapes:
+            self.detachShape(shape)
+        self._versionCache = None
+        self._bitmap = None
+        self._grid = None
+        self._gridStaleShapes = None
+        if self._group is not None:
+            self._group.childChanged(self)
+        else:
+            activeDrawing.changeCount += 1
+
+    def setShapes(self, shapes):
+        # Makes shapes the children of this group, in that order. Children
+        # that are left out are removed as if by clear(), but children that
+        # stay in the group are not removed and inserted again
+        newIds = {shape.id for shape in shapes}
+        keptInOldOrder = []
+        oldShapes = self._shapes
+        self.ghostAllNodes()
+        for shape in oldShapes:
+            if shape.id in newIds:
+                keptInOldOrder.append(shape)
+            else:
+                self.detachShape(shape)
+                self.childChanged(shape)
+
+        keptIds = {shape.id for shape in keptInOldOrder}
+        keptInNewOrder = [shape for shape in shapes if shape.id in keptIds]
+        if keptInNewOrder != keptInOldOrder:
+            # Shapes that changed places may now overlap differently
+            for shape in keptInNewOrder:
+                shape.invalidate()
+
         for shape in shapes:
-            self.remove(shape)
+            if shape.id in keptIds:
+                node = ShapeNode(self, shape, self.tick())
+                self._nodes.insertBefore(node, None)
+                self.addNode(node)
+            else:
+                self.insert(shape, self._shapeCount)
+        if self._nodeCount - self._shapeCount > self._pruneAt:
+            self.pruneGhosts()
 
     def hits(self, x, y):
         return self.hitTest(x, y) is not None
 
     def hitTest(self, x, y):
-        for i in range(len(self._shapes) - 1, -1, -1):
-            shape = self._shapes[i]
+        for shape in self.getShapesAt(x, y):
             if shape.hits(x, y):
                 return shape.studentShape
         return None
 
     def contains(self, x, y):
-        return any(shape.contains(x, y) for shape in self._shapes)
+        return any(shape.contains(x, y) for shape in self.getShapesAt(x, y))
 
     def containsShape(self, target):
         return any(shape.containsShape(target) for shape in self._shapes)
 
+    def collidingPairs(self):
+        # Returns every pair of children that hit each other. Only the pairs
+        # whose hit bounds overlap are passed to hitsShape, and those are
+        # found by sweeping the bounds from left to right.
+        shapes = self._shapes
+        boxes = []
+        unbounded = []
+        for i, shape in enumerate(shapes):
+            bounds = padHitBounds(shape.getHitBounds())
+            if bounds is None:
+                unbounded.append(i)
+            else:
+                boxes.append((bounds, i))
+        boxes.sort(key=lambda box: box[0][0])
+
+        candidates = set()
+        active = []
+        for bounds, i in boxes:
+            # Drop the boxes that end before this one starts
+            active = [box for box in active if box[0][2] >= bounds[0]]
+            for otherBounds, j in active:
+                if bounds[1] <= otherBounds[3] and otherBounds[1] <= bounds[3]:
+                    candidates.add((min(i, j), max(i, j)))
+            active.append((bounds, i))
+        for i in unbounded:
+            for j in range(len(shapes)):
+                if i != j:
+                    candidates.add((min(i, j), max(i, j)))
+
+        # Pairs are ordered back to front, like the children
+        return [
+            (shapes[i].studentShape, shapes[j].studentShape)
+            for i, j in sorted(candidates)
+            if shapes[i].hitsShape(shapes[j])
+        ]
+
+    def hitsAny(self, shape):
+        checkShape(t('Group.hitsAny(shape)'), t('shape'), shape, True)
+        bounds = padHitBounds(shape.getHitBounds())
+        grid = None if bounds is None else self.getGrid()
+        candidates = None if grid is None else grid.getShapesIn(bounds)
+        if candidates is None:
+            candidates = []
+            for child in self._shapes:
+                childBounds = padHitBounds(child.getHitBounds())
+                if (
+                    bounds is None
+                    or childBounds is None
+                    or hitBoundsOverlap(bounds, childBounds)
+                ):
+                    candidates.append(child)
+        return any(
+            child is not shape and child.hitsShape(shape) for child in candidates
+        )
+
     def addx(self, dx):
         for shape in self._shapes:
             shape.left += dx
@@ -2229,7 +3161,102 @@ def getFont(baseFontName, isBold=False, isItalic=False):
     return (fontName, italic, bold)
 
 
+class LRUCache(object):
+    # Keeps the maxSize most recently used values. Labels use these for text
+    # measurements and glyphs, so ones whose values keep changing (scores,
+    # timers) mostly skip the font lookup
+    def __init__(self, maxSize):
+        self.maxSize = maxSize
+        self.entries = collections.OrderedDict()
+
+    def setMaxSize(self, maxSize):
+        self.maxSize = maxSize
+        while len(self.entries) > maxSize:
+            self.entries.popitem(last=False)
+
+    def get(self, key, compute):
+        entries = self.entries
+        if key in entries:
+            entries.move_to_end(key)
+            return entries[key]
+        value = compute()
+        if self.maxSize > 0:
+            entries[key] = value
+            if len(entries) > self.maxSize:
+                entries.popitem(last=False)
+        return value
+
+
+TEXT_CACHE_SIZE = 1024
+textDimsCache = LRUCache(TEXT_CACHE_SIZE)
+textGlyphsCache = LRUCache(TEXT_CACHE_SIZE)
+
+
+def setTextCacheSize(size):
+    textDimsCache.setMaxSize(size)
+    textGlyphsCache.setMaxSize(size)
+
+
+def getTextGlyphs(ctx, text, fontFace, size):
+    # Returns the glyphs that ctx.text_path(text) would add at the origin,
+    # with ctx's font already set to fontFace and size. Hinting depends on
+    # how the context is scaled and rotated, so that is part of the key.
+    xx, yx, xy, yy, _, _ = ctx.get_matrix()
+    return textGlyphsCache.get(
+        (text, fontFace, size, xx, yx, xy, yy),
+        lambda: ctx.get_scaled_font().text_to_glyphs(0, 0, text, False),
+    )
+
+
+def getLabelTextDims(stringValue, font, bold, italic, size):
+    # Returns the unrotated width and height of a label's text, and how far
+    # left of the label the text has to start for its ink to line up
+    return textDimsCache.get(
+        (stringValue, font, bool(bold), bool(italic), size),
+        lambda: computeLabelTextDims(stringValue, font, bold, italic, size),
+    )
+
+
+def computeLabelTextDims(stringValue, font, bold, italic, size):
+    fontCtx.save()
+    fontCtx.select_font_face(*getFont(font, bold, italic))
+    fontCtx.set_font_size(size)
+    xBearing, yBearing, width, height, xAdvance, yAdvance = fontCtx.text_extents(
+        stringValue
+    )
+    fontCtx.restore()
+    height = -yBearing
+    unrotatedWidth = width
+    hasOuterSpaces = len(stringValue) > 0 and (
+        stringValue[0] == ' ' or stringValue[-1] == ' '
+    )
+    if hasOuterSpaces:
+        unrotatedWidth = max(unrotatedWidth, xAdvance)
+    # unrotatedHeight = -height
+    unrotatedHeight = height
+    return unrotatedWidth, unrotatedHeight, 0 if hasOuterSpaces else xBearing
+
+
+def getLabelPoints(cx, cy, unrotatedWidth, unrotatedHeight):
+    x0 = cx - unrotatedWidth / 2
+    y0 = cy - unrotatedHeight / 2
+    x1 = cx + unrotatedWidth / 2
+    y1 = cy + unrotatedHeight / 2
+    return [
+        [x0, y0],
+        [(x0 + x1) / 2, y0],
+        [x1, y0],
+        [x1, (y0 + y1) / 2],
+        [x1, y1],
+        [(x0 + x1) / 2, y1],
+        [x0, y1],
+        [x0, (y0 + y1) / 2],
+    ]
+
+
 class Label(Shape):
+    __slots__ = ('valueStr',)
+
     def __init__(self, attrs):
         super().__init__(attrs)
         self.valueStr = None
@@ -2245,46 +3272,27 @@ class Label(Shape):
         self.setDims()
 
     def setDims(self):
-        fontCtx.save()
-        fontCtx.select_font_face(*getFont(self.font, self.bold, self.italic))
-        fontCtx.set_font_size(self.size)
-
         cx = self.attrs['centerX']
         cy = self.attrs['centerY']
         stringValue = utils.convertLabelValue(self.value)
-        xBearing, yBearing, width, height, xAdvance, yAdvance = fontCtx.text_extents(
-            stringValue
+        unrotatedWidth, unrotatedHeight, xAdjust = getLabelTextDims(
+            stringValue, self.font, self.bold, self.italic, self.size
         )
-        height = -yBearing
-        unrotatedWidth = width
-        hasOuterSpaces = len(stringValue) > 0 and (
-            stringValue[0] == ' ' or stringValue[-1] == ' '
-        )
-        if hasOuterSpaces:
-            unrotatedWidth = max(unrotatedWidth, xAdvance)
-        # unrotatedHeight = -height
-        unrotatedHeight = height
-        x0 = cx - unrotatedWidth / 2
-        y0 = cy - unrotatedHeight / 2
-        x1 = cx + unrotatedWidth / 2
-        y1 = cy + unrotatedHeight / 2
-        pts = [
-            [x0, y0],
-            [(x0 + x1) / 2, y0],
-            [x1, y0],
-            [x1, (y0 + y1) / 2],
-            [x1, y1],
-            [(x0 + x1) / 2, y1],
-            [x0, y1],
-            [x0, (y0 + y1) / 2],
-        ]
+        pts = getLabelPoints(cx, cy, unrotatedWidth, unrotatedHeight)
         a = self.rotateAngle
         if a:
             pts = utils.rotatePoints(pts, a, self.centerX, self.centerY)
-        self.set({'approxPoints': pts, 'xAdjust': 0 if hasOuterSpaces else xBearing})
+        self.set({'approxPoints': pts, 'xAdjust': xAdjust})
         box = utils.getBoxDims(pts)
         self.set({'width': box['width'], 'height': box['height']})
-        fontCtx.restore()
+
+    def getDamagePadding(self):
+        # Descenders hang below the box computed by setDims, and borders are
+        # stroked outside of the glyph outlines
+        pad = super().getDamagePadding() + self.size / 2
+        if self.border:
+            pad += self.borderWidth
+        return pad
 
     def get_area(self):
         return self.width * self.height
@@ -2425,6 +3433,8 @@ class Label(Shape):
 
 
 class Polygon(Shape):
+    __slots__ = ('_cachedArea', '_cachedCentroid')
+
     def __init__(self, attrs=None):
         if attrs is not None and 'initialPoints' in attrs:
             if len(attrs['initialPoints']) % 2 != 0:
@@ -2446,6 +3456,8 @@ class Polygon(Shape):
                 x, y = pts[i], pts[i + 1]
                 pointList.append([x, y])
             self.pointList = pointList
+            # Only pointList is used from here on
+            del self.attrs['initialPoints']
 
     def get_pointList(self):
         return self.get('pointList')
@@ -2680,6 +3692,8 @@ class Polygon(Shape):
 
 
 class Rect(Polygon):
+    __slots__ = ()
+
     def __init__(self, attrs=None):
         if attrs is not None:
             right = attrs['left'] + attrs['width']
@@ -2706,6 +3720,8 @@ class Rect(Polygon):
 
 
 class Line(Polygon):
+    __slots__ = ('exactValues',)
+
     def __init__(self, attrs):
         attrs['initialPoints'] = utils.flatten(
             utils.getLinePoints(attrs['x1'], attrs['y1'], attrs['x2'], attrs['y2'], 2)
@@ -2881,6 +3897,13 @@ class Line(Polygon):
         if self.arrowStart:
             drawArrow(self.x1, self.y1, 1)
 
+    def getDamagePadding(self):
+        pad = super().getDamagePadding()
+        if self.arrowStart or self.arrowEnd:
+            # Arrowheads are wider than the line itself (see drawArrows)
+            pad += min(50, 10 * math.sqrt(self.lineWidth)) / 3
+        return pad
+
     def isPoint(self):
         return self.x1 == self.x2 and self.y1 == self.y2
 
@@ -2922,6 +3945,8 @@ class Line(Polygon):
 
 
 class PolygonInCircle(Polygon):
+    __slots__ = ()
+
     def get_radius(self):
         return self.get('radius')
 
@@ -2960,6 +3985,8 @@ class PolygonInCircle(Polygon):
 
 
 class RegularPolygon(PolygonInCircle):
+    __slots__ = ()
+
     def __init__(self, attrs):
         attrs['initialPoints'] = utils.flatten(
             utils.getRegularPolygonPoints(
@@ -2979,6 +4006,8 @@ class RegularPolygon(PolygonInCircle):
 
 
 class Star(PolygonInCircle):
+    __slots__ = ()
+
     def __init__(self, attrs):
         attrs['initialPoints'] = utils.flatten(
             utils.getStarPoints(
@@ -3021,6 +4050,8 @@ class Star(PolygonInCircle):
 
 
 class PolygonWithTransform(Polygon):
+    __slots__ = ()
+
     def get_transformMatrix(self):
         return self.get('transformMatrix')
 
@@ -3059,6 +4090,8 @@ class PolygonWithTransform(Polygon):
 
 
 class CMUImage(PolygonWithTransform):
+    __slots__ = ()
+
     def __init__(self, attrs):
         if attrs is not None:
             imageData = loadImage(attrs['url'])
@@ -3109,6 +4142,8 @@ class CMUImage(PolygonWithTransform):
 
 
 class Oval(PolygonWithTransform):
+    __slots__ = ()
+
     def __init__(self, attrs):
         attrs['initialPoints'] = utils.flatten(
             utils.getArcPoints(
@@ -3136,8 +4171,15 @@ class Oval(PolygonWithTransform):
         )
         super().__init__(attrs)
 
+    # Maps (startAngle, sweepAngle, isMvc) to the bezier points for it, which
+    # are shared by every oval with those angles and must not be modified
+    sharedBezierPoints = dict()
+
     @staticmethod
     def getBezierPoints(startAngle, sweepAngle, isMvc):
+        key = (startAngle, sweepAngle, isMvc)
+        if key in Oval.sharedBezierPoints:
+            return Oval.sharedBezierPoints[key]
         offset = utils.toRadians(startAngle)
         remaining = sweepAngle
         bp = []
@@ -3149,6 +4191,8 @@ class Oval(PolygonWithTransform):
             )
             offset += math.pi / 2
             remaining -= 90
+        if len(Oval.sharedBezierPoints) < 256:
+            Oval.sharedBezierPoints[key] = bp
         return bp
 
     @staticmethod
@@ -3257,6 +4301,8 @@ class Oval(PolygonWithTransform):
 
 
 class Arc(Oval):
+    __slots__ = ()
+
     def __init__(self, attrs):
         super().__init__(attrs)
         self.ovalWidth = attrs['width']
@@ -3376,6 +4422,8 @@ class Arc(Oval):
 
 
 class Circle(Oval):
+    __slots__ = ()
+
     def __init__(self, attrs):
         attrs['width'] = attrs['height'] = 2 * attrs['radius']
         super().__init__(attrs)
@@ -3433,6 +4481,175 @@ class Circle(Oval):
         self._exactRadius = None
 
 
+class CommandBuffer(object):
+    # Cairo drawing commands recorded by drawRect, drawCircle and drawLabel
+    # when app.immediateMode is on. Each command draws exactly what the
+    # corresponding shape would, without building the shape.
+
+    # Control points of a unit circle, as Oval builds them in CS3 Mode
+    unitCircleBezierPoints = None
+
+    def __init__(self):
+        self.commands = []
+
+    def getStyle(self, attrs):
+        opacity = attrs.get('opacity', 100)
+        fill = attrs.get('fill', 'black')
+        border = attrs.get('border', None)
+        return (
+            getColorRGBA(fill, opacity) if fill else None,
+            getColorRGBA(border, opacity),
+            attrs.get('borderWidth', 2) if border else 0,
+        )
+
+    def addRect(self, attrs):
+        left, top = attrs['left'], attrs['top']
+        right = left + attrs['width']
+        bottom = top + attrs['height']
+        pts = [[left, top], [right, top], [right, bottom], [left, bottom]]
+        align = attrs.get('align', None)
+        if align is not None:
+            # Move the points the same way Polygon's setters do
+            xattr, yattr = getAlignAttrs(toEnglish(align, 'align'))
+            for varIndex, attr, v in ((0, xattr, left), (1, yattr, top)):
+                values = [pt[varIndex] for pt in pts]
+                if attr in ('left', 'top'):
+                    d = v - min(values)
+                elif attr in ('right', 'bottom'):
+                    d = v - max(values)
+                else:
+                    box = utils.getBoxDims(pts)
+                    d = v - (
+                        box['left'] + box['width'] / 2
+                        if varIndex == 0
+                        else box['top'] + box['height'] / 2
+                    )
+                if d != 0:
+                    for pt in pts:
+                        pt[varIndex] += d
+        self.commands.append(
+            (
+                self.drawPolygon,
+                pts,
+                attrs.get('dashes', False),
+                self.getStyle(attrs),
+            )
+        )
+
+    def addCircle(self, attrs):
+        if CommandBuffer.unitCircleBezierPoints is None:
+            CommandBuffer.unitCircleBezierPoints = Oval.getBezierPoints(0, 360, True)
+        r = attrs['radius']
+        bp = [[r * p[0], r * p[1]] for p in CommandBuffer.unitCircleBezierPoints]
+        self.commands.append(
+            (
+                self.drawOval,
+                (attrs['centerX'], attrs['centerY'], bp),
+                attrs.get('dashes', False),
+                self.getStyle(attrs),
+            )
+        )
+
+    def addLabel(self, attrs):
+        value = attrs['value']
+        font = attrs.get('font', 'arial')
+        bold = attrs.get('bold', False)
+        italic = attrs.get('italic', False)
+        size = attrs.get('size', 12)
+        cx, cy = attrs['centerX'], attrs['centerY']
+        unrotatedWidth, unrotatedHeight, xAdjust = getLabelTextDims(
+            utils.convertLabelValue(value), font, bold, italic, size
+        )
+        align = attrs.get('align', None)
+        if align is not None:
+            # Move the center so that (centerX, centerY) is the aligned edge
+            # or corner, as Label's setters do
+            xattr, yattr = getAlignAttrs(toEnglish(align, 'align'))
+            if xattr == 'left':
+                cx += unrotatedWidth / 2
+            elif xattr == 'right':
+                cx -= unrotatedWidth / 2
+            if yattr == 'top':
+                cy += unrotatedHeight / 2
+            elif yattr == 'bottom':
+                cy -= unrotatedHeight / 2
+        targetX, targetY = getLabelPoints(cx, cy, unrotatedWidth, unrotatedHeight)[6]
+        self.commands.append(
+            (
+                self.drawText,
+                (
+                    targetX - xAdjust,
+                    targetY,
+                    str(value),
+                    getFont(font, bold, italic),
+                    size,
+                ),
+                False,
+                self.getStyle(attrs),
+            )
+        )
+
+    def drawPolygon(self, ctx, pts):
+        utils.makePolygonPath(pts, ctx)
+
+    def drawOval(self, ctx, path):
+        cx, cy, bp = path
+        ctx.save()
+        ctx.new_path()
+        ctx.translate(cx, cy)
+        ctx.move_to(bp[0][0], bp[0][1])
+        for i in range(0, len(bp) // 4):
+            i2 = i * 4
+            ctx.curve_to(
+                bp[i2 + 1][0],
+                bp[i2 + 1][1],
+                bp[i2 + 2][0],
+                bp[i2 + 2][1],
+                bp[i2 + 3][0],
+                bp[i2 + 3][1],
+            )
+        ctx.close_path()
+        ctx.restore()
+
+    def drawText(self, ctx, text):
+        x, y, value, fontFace, size = text
+        ctx.select_font_face(*fontFace)
+        ctx.set_font_size(size)
+        ctx.new_path()
+        ctx.translate(x, y)
+        ctx.glyph_path(getTextGlyphs(ctx, value, fontFace, size))
+
+    def draw(self, ctx):
+        # Mirrors Shape.draw
+        for makePath, path, dashes, (fill, border, bw) in self.commands:
+            ctx.save()
+            makePath(ctx, path)
+            if makePath == self.drawText:
+                ctx.set_source_rgba(*(fill or (0, 0, 0, 1)))
+                ctx.fill_preserve()
+                if bw:
+                    ctx.set_source_rgba(*border)
+                    ctx.set_line_width(bw)
+                    ctx.stroke()
+            else:
+                ctx.close_path()
+                if fill:
+                    ctx.set_source_rgba(*fill)
+                    ctx.fill_preserve()
+                if bw:
+                    # Only the inner half of a double-width border shows, as
+                    # in Shape.draw
+                    ctx.clip_preserve()
+                    ctx.set_source_rgba(*border)
+                    if isinstance(dashes, bool):
+                        ctx.set_dash([5, 5] if dashes else [])
+                    else:
+                        ctx.set_dash(dashes)
+                    ctx.set_line_width(bw * 2)
+                    ctx.stroke()
+            ctx.restore()
+
+
 objConstructors = {
     'Arc': Arc,
     'Circle': Circle,
@@ -3721,8 +4938,8 @@ class Inspector(object):
             return
 
         black = (0, 0, 0)
-        red = (0, 0, 255)
-        gold = (0, 215, 255)
+        red = (255, 0, 0)
+        gold = (255, 215, 0)
         white = (255, 255, 255)
 
         for pt in self.keyPoints:
@@ -3866,6 +5083,7 @@ class ShapeLogicInterface(object):
         global cmuGraphicsLanguage
         if language in supportedLanguages:
             cmuGraphicsLanguage = language
+            updateEnglishLookups()
 
     def rgb(self, r, g, b):
         return RGB(r, g, b)
@@ -3,6 +3,16 @@ import math
 from . import shape_logic
 from collections import defaultdict
 
+# NumPy is optional. When it's installed, the geometry functions below work on
+# long point lists with arrays instead of Python loops.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Shorter point lists are faster to loop over than to convert to arrays
+NUMPY_MIN_POINTS = 48
+
 
 def toDegrees(radians):
     return radians * 180 / math.pi
@@ -102,8 +112,56 @@ def internalError(err):
     raise Exception('Internal Error: {err}'.format(err=err))
 
 
+def useNumpy(pts):
+    return numpy is not None and len(pts) >= NUMPY_MIN_POINTS
+
+
+def toPointArray(pts):
+    # Returns pts as an n x 2 array of floats if the NumPy versions of the
+    # functions below should be used for it, and pts itself otherwise
+    if not useNumpy(pts) or isinstance(pts, numpy.ndarray):
+        return pts
+    return numpy.array(pts, dtype=numpy.float64)
+
+
+def getSegmentArrays(pts):
+    # Returns the x and y arrays of the start and end of each polygon edge
+    pts = toPointArray(pts)
+    x1 = pts[:, 0]
+    y1 = pts[:, 1]
+    x2 = numpy.roll(x1, -1)
+    y2 = numpy.roll(y1, -1)
+    return x1, y1, x2, y2
+
+
+def distancesToLineSegments2(x, y, x1, y1, x2, y2):
+    # Array version of distanceToLineSegment2
+    dx = x2 - x1
+    dy = y2 - y1
+    l2 = dx**2 + dy**2
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        t = ((x - x1) * dx + (y - y1) * dy) / l2
+    t = numpy.clip(t, 0, 1)
+    d2 = (x - (x1 + t * dx)) ** 2 + (y - (y1 + t * dy)) ** 2
+    return numpy.where(l2 == 0, numpy.sqrt((x - x1) ** 2 + (y - y1) ** 2), d2)
+
+
+def numpyPolygonContainsPoint(pts, px, py):
+    q1x, q1y, q2x, q2y = getSegmentArrays(pts)
+    if (distancesToLineSegments2(px, py, q1x, q1y, q2x, q2y) < 0.0002).any():
+        return True
+    dy = q2y - q1y
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        crossX = (q2x - q1x) * (py - q1y) / dy + q1x
+    x = (q1y > py) != (q2y > py)
+    y = (dy == 0) | (px < crossX)
+    return bool(numpy.count_nonzero(x & y) % 2)
+
+
 def polygonContainsPoint(pts, px, py):
     # based on: https://github.com/mathigon/fermat.js/blob/master/src/geometry.js
+    if useNumpy(pts):
+        return numpyPolygonContainsPoint(pts, px, py)
     n = len(pts)
     inside = False
     for i in range(n):
@@ -128,6 +186,9 @@ def polygonContainsPoint(pts, px, py):
 def pointNearPolygonBorder(pts, x, y, d):
     # does not check if the polygon contains the point!
     d2 = d**2
+    if useNumpy(pts):
+        distances = distancesToLineSegments2(x, y, *getSegmentArrays(pts))
+        return bool((distances <= d2).any())
     n = len(pts)
     for i in range(n):
         p1 = pts[i]
@@ -237,7 +298,21 @@ def getChildShapes(shape):
     return result
 
 
+def getCrossTerms(pts):
+    # Returns x[i] * y[i + 1] - x[i + 1] * y[i] for each point, as an array
+    x1, y1, x2, y2 = getSegmentArrays(pts)
+    return x1 * y2 - x2 * y1
+
+
+def sumInOrder(values):
+    # Adds up the array from left to right, like a Python loop would, so the
+    # rounding matches the pure Python versions
+    return float(numpy.cumsum(values)[-1]) if len(values) else 0
+
+
 def getPolygonArea(pts):
+    if useNumpy(pts):
+        return sumInOrder(getCrossTerms(pts)) / 2
     A = 0
     for i in range(0, len(pts)):
         j = (i + 1) % len(pts)
@@ -250,12 +325,21 @@ def getPolygonCentroid(pts):
     if A < 0.00001:
         # If the area of the polygon is small enough, average the points instead
         # of returning a value that is heavily influenced by floating point error
+        if useNumpy(pts):
+            pts = toPointArray(pts)
+            return [sumInOrder(pts[:, 0]) / len(pts), sumInOrder(pts[:, 1]) / len(pts)]
         sumX = 0
         sumY = 0
         for i in range(0, len(pts)):
             sumX += pts[i][0]
             sumY += pts[i][1]
         return [sumX / len(pts), sumY / len(pts)]
+    if useNumpy(pts):
+        x1, y1, x2, y2 = getSegmentArrays(pts)
+        terms = getCrossTerms(pts)
+        cx = sumInOrder((x1 + x2) * terms)
+        cy = sumInOrder((y1 + y2) * terms)
+        return [cx / (6 * A), cy / (6 * A)]
     cx, cy = 0, 0
     for i in range(0, len(pts)):
         j = (i + 1) % len(pts)
@@ -276,6 +360,16 @@ def rotatePoint(pt, degrees, cx, cy):
 
 
 def rotatePoints(pts, degrees, cx, cy):
+    cos = intCos(degrees)
+    sin = intSin(degrees)
+    # Right angles keep integer points as ints, so they stay in Python
+    if useNumpy(pts) and isinstance(cos, float):
+        pts = toPointArray(pts)
+        x = pts[:, 0] - cx
+        y = pts[:, 1] - cy
+        return numpy.column_stack(
+            (cx + (x * cos - y * sin), cy + (x * sin + y * cos))
+        ).tolist()
     return list(map(lambda pt: rotatePoint(pt, degrees, cx, cy), pts))
 
 
@@ -352,6 +446,13 @@ def getArcPoints(
     startAngle = toRadians(startAngle) if isMvc else toRadians(90 - startAngle)
     sweepAngle = toRadians(sweepAngle)
     multiplyFactor = 1 if isMvc else -1
+    if numpy is not None and n >= NUMPY_MIN_POINTS:
+        theta = startAngle + (
+            multiplyFactor * (sweepAngle * numpy.arange(n) / denominator)
+        )
+        x = cx + a * numpy.cos(theta)
+        y = cy - b * numpy.sin(theta)
+        return pts + numpy.column_stack((x, y)).tolist()
     for i in range(n):
         theta = startAngle + (multiplyFactor * (sweepAngle * i / denominator))
         x = cx + a * math.cos(theta)
@@ -364,6 +465,11 @@ def isNumber(value):
     return isinstance(value, int) or isinstance(value, float)
 
 
+def isFinite(value):
+    # Unlike math.isfinite, this works for ints too big to be floats
+    return -math.inf < value < math.inf
+
+
 def round6(value):
     return pythonRound((value + 0.00000001) * 1000000) / 1000000
 
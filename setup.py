@@ -29,6 +29,6 @@ setuptools.setup(
         "pycairo>=1.20",
     ],
     packages=["cmu_graphics", "cmu_graphics.samples", "cmu_graphics.libs"],
-    package_data={"cmu_graphics": ["meta/version.txt", "libs/cacert.pem"]},
+    package_data={"cmu_graphics": ["meta/version.txt", "meta/translations.marshal", "libs/cacert.pem"]},
     python_requires=">=3.6, <4",
 )
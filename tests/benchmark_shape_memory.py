@@ -0,0 +1,37 @@
+# Reports how much memory each kind of shape takes, for scenes with many
+# shapes. Run with: python benchmark_shape_memory.py [count]
+import gc
+import os
+import sys
+import tracemalloc
+
+CMU_GRAPHICS_NO_UPDATE = True
+from cmu_graphics import *
+
+COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+SHAPES = {
+    'Rect': lambda i: Rect(i % 400, i % 397, 4, 4),
+    'Circle': lambda i: Circle(i % 400, i % 397, 2),
+    'Line': lambda i: Line(i % 400, 0, 0, i % 397),
+    'Polygon': lambda i: Polygon(i % 400, 0, 10, 10, 0, i % 397),
+    'Label': lambda i: Label(i, i % 400, i % 397),
+}
+
+app.maxShapeCount = COUNT * (len(SHAPES) + 1)
+
+print('%-10s %12s' % ('shape', 'bytes each'))
+for name, makeShape in SHAPES.items():
+    group = Group()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(COUNT):
+        group.add(makeShape(i))
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print('%-10s %12.0f' % (name, (after - before) / COUNT))
+    group.clear()
+
+os._exit(0)
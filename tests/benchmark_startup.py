@@ -0,0 +1,55 @@
+# Reports how long `from cmu_graphics import *` takes, and which modules the
+# time goes to, from python -X importtime. Fails if the import takes longer
+# than the budget. Run with: python benchmark_startup.py [runs]
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+BUDGET_MS = 500
+SHOWN_MODULES = 15
+
+IMPORT_CODE = 'CMU_GRAPHICS_NO_UPDATE = True\nfrom cmu_graphics import *'
+
+
+def getImportTimes():
+    # Returns {module: (self us, cumulative us)} for one fresh interpreter
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='hide')
+    # Installed packages have .pyc files, so time the import with them
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_CODE],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        env=env,
+        check=True,
+    )
+    times = dict()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        selfTime, cumulativeTime, module = line[len('import time:') :].split('|')
+        times[module.strip()] = (int(selfTime), int(cumulativeTime))
+    return times
+
+
+# The first run also writes the .pyc files, so it isn't counted
+getImportTimes()
+runs = [getImportTimes() for i in range(RUNS)]
+
+
+def medianMs(module, index):
+    return statistics.median(run.get(module, (0, 0))[index] for run in runs) / 1000
+
+
+modules = sorted(runs[0], key=lambda module: medianMs(module, 0), reverse=True)
+print('%-40s %10s %10s' % ('module', 'self ms', 'total ms'))
+for module in modules[:SHOWN_MODULES]:
+    print('%-40s %10.1f %10.1f' % (module, medianMs(module, 0), medianMs(module, 1)))
+
+totalMs = medianMs('cmu_graphics', 1)
+print()
+print('import cmu_graphics: %.1f ms (budget %d ms)' % (totalMs, BUDGET_MS))
+os._exit(0 if totalMs <= BUDGET_MS else 1)
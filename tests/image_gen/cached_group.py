@@ -0,0 +1,38 @@
+# Cached groups paint a bitmap of their children until one of them changes
+
+background = Group(cached=True)
+for row in range(8):
+    for col in range(8):
+        fill = 'lightSteelBlue' if (row + col) % 2 == 0 else 'white'
+        background.add(Rect(col * 50, row * 50, 50, 50, fill=fill))
+background.add(Label('cached', 200, 200, size=40, fill=gradient('red', 'blue')))
+marker = Circle(75, 75, 20, fill='crimson', border='black')
+background.add(marker)
+assert background.cached
+
+# -
+marker.centerX = 325
+marker.fill = gradient('gold', 'orange', start='center')
+
+# -
+shadow = Group(Oval(200, 320, 160, 40, fill='gray', opacity=50))
+background.add(shadow)
+shadow.children[0].width = 240
+
+# -
+background.centerY += 25
+background.rotateAngle = 10
+
+# -
+background.cached = False
+marker.centerY = 325
+
+# -
+# The bitmap is cut off at the canvas edges, so it's drawn again when the
+# canvas grows
+background.cached = True
+app.width = 200
+app.height = 200
+app.renderFrame()
+app.width = 400
+app.height = 400
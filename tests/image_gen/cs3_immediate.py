@@ -0,0 +1,24 @@
+def onAppStart(app):
+    app.immediateMode = True
+
+def redrawAll(app):
+    drawRect(0, 0, 400, 400, fill='lightBlue')
+    drawRect(200, 100, 150, 80, align='center', border='navy', dashes=True)
+    drawCircle(100, 250, 60, fill='orange', border='black', borderWidth=4)
+    drawOval(100, 250, 80, 40, fill='purple')
+    drawCircle(100, 250, 10, fill='white', opacity=50)
+    drawLabel('Immediate', 200, 350, size=30, bold=True, align='left')
+
+# -
+
+def onAppStart(app):
+    app.immediateMode = True
+    app.x = 100
+
+def onMousePress(app, mouseX, mouseY):
+    app.x = 300
+
+def redrawAll(app):
+    drawRect(app.x, 200, 100, 100, fill='red', rotateAngle=45, align='center')
+    drawCircle(app.x, 200, 30, fill=gradient('white', 'black'))
+    drawLabel(app.x, app.x, 200, fill='yellow', size=20)
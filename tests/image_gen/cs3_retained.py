@@ -0,0 +1,44 @@
+def onAppStart(app):
+    app.x = 100
+    app.color = 'red'
+
+def onMousePress(app, mouseX, mouseY):
+    app.x = 50
+    app.color = 'blue'
+
+def redrawAll(app):
+    drawRect(0, 0, 400, 400, fill='lightYellow')
+    for i in range(3):
+        drawCircle(app.x + i * 100, 100, 40, fill=app.color, border='black')
+    drawLabel('Unchanged', 200, 300, size=30)
+
+# -
+
+def onAppStart(app):
+    app.swapped = False
+
+def onMousePress(app, mouseX, mouseY):
+    app.swapped = True
+
+def drawItem(cx, color):
+    drawCircle(cx, 200, 80, fill=color, opacity=80)
+
+def redrawAll(app):
+    items = [(150, 'red'), (250, 'blue')]
+    if app.swapped:
+        items.reverse()
+    for cx, color in items:
+        drawItem(cx, color)
+
+# -
+
+def onAppStart(app):
+    app.count = 5
+
+def onMousePress(app, mouseX, mouseY):
+    app.count = 2
+
+def redrawAll(app):
+    for i in range(app.count):
+        drawRect(20 + i * 75, 150, 60, 100, fill='green')
+    drawLine(0, 380, 400, 380)
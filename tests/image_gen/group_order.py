@@ -0,0 +1,75 @@
+a = Rect(50, 50, 100, 100, fill='red')
+b = Rect(75, 75, 100, 100, fill='green')
+c = Rect(100, 100, 100, 100, fill='blue')
+
+b.visible = False
+Rect(125, 125, 100, 100, fill='yellow')
+a.toBack()
+b.visible = True
+
+# -
+
+g = Group(
+    Circle(100, 100, 50, fill='red'),
+    Circle(150, 100, 50, fill='green'),
+    Circle(200, 100, 50, fill='blue'),
+)
+shapes = g.children
+for shape in shapes:
+    g.remove(shape)
+g.add(shapes[2])
+g.add(shapes[0])
+g.add(shapes[1])
+
+g.clear()
+for shape in reversed(shapes):
+    g.add(shape)
+shapes[1].toFront()
+
+# -
+
+# Showing a shape puts it back where it was, even when the shapes around it
+# were moved while it was hidden
+def makeShapes(top):
+    return [
+        Rect(50, top, 80, 80, fill='red'),
+        Rect(90, top + 20, 80, 80, fill='green'),
+        Rect(130, top + 40, 80, 80, fill='blue'),
+    ]
+
+a, b, c = shapes = makeShapes(10)
+g = Group(*shapes)
+b.visible = False
+a.toFront()
+b.visible = True
+assert g.children == [c, a, b]
+
+a, b, c = shapes = makeShapes(140)
+g = Group(*shapes)
+c.visible = False
+b.toFront()
+c.visible = True
+assert g.children == [a, b, c]
+
+a, b, c = shapes = makeShapes(270)
+g = Group(*shapes)
+a.visible = False
+b.toBack()
+a.visible = True
+assert g.children == [a, b, c]
+
+# Enough moves for the group to prune the ghosts of removed shapes, and the
+# ones still needed put shapes back where they were
+g = Group(*[Rect(0, 0, 10, 10) for i in range(100)])
+shapes = g.children
+shapes[40].visible = False
+for shape in shapes[:40]:
+    shape.toFront()
+shapes[40].visible = True
+assert g.children == shapes[41:] + shapes[:41]
+
+g.clear()
+for shape in reversed(shapes):
+    g.add(shape)
+assert g.children == shapes
+g.visible = False
@@ -0,0 +1,44 @@
+# Groups with many children look up hitTest, hits and contains in a grid
+
+tiles = Group()
+grid = []
+for row in range(10):
+    for col in range(10):
+        tile = Rect(col * 40, row * 40, 38, 38, fill='lightGray')
+        tiles.add(tile)
+        grid.append(tile)
+
+assert tiles.hitTest(5, 5) == grid[0]
+assert tiles.hitTest(39, 5) is None
+assert tiles.hitTest(45, 5) == grid[1]
+
+cover = Rect(100, 100, 100, 100, fill='red')
+tiles.add(cover)
+assert tiles.hitTest(150, 150) == cover
+
+cover.centerX = 300
+assert tiles.hitTest(150, 150) == grid[33]
+assert tiles.hitTest(300, 150) == cover
+
+cover.toBack()
+assert tiles.hitTest(300, 150) == grid[37]
+cover.toFront()
+tiles.remove(grid[37])
+assert tiles.hitTest(300, 150) == cover
+tiles.remove(cover)
+assert tiles.hitTest(300, 150) is None
+
+outline = Circle(200, 200, 60, fill=None, border='blue', borderWidth=4)
+tiles.add(outline)
+assert tiles.hitTest(200, 141) == outline
+assert tiles.hitTest(210, 210) == grid[55]
+assert tiles.contains(150, 150)
+assert not tiles.contains(300, 150)
+assert not tiles.contains(-5, -5)
+assert not tiles.hits(-5, -5)
+
+star = Group(Star(20, 380, 15, 5, fill='gold'))
+tiles.add(star)
+star.centerX = 380
+assert tiles.hitTest(380, 380) == star
+assert tiles.hitTest(20, 380) == grid[90]
@@ -69,4 +69,18 @@ assert regPoly1.hitsShape(polygon1)
 # Test 8: Concave and Convex Polygons
 star1 = Star(50, 50, 30, 5)
 rect1 = Rect(40, 40, 50, 50)
-assert star1.hitsShape(rect1)
\ No newline at end of file
+assert star1.hitsShape(rect1)
+
+# -
+
+# Test 9: Broad-phase collisions in a group
+a = Rect(200, 200, 40, 40)
+b = Circle(250, 220, 15)
+c = Line(300, 300, 380, 380)
+d = Rect(330, 330, 20, 20)
+e = Oval(100, 300, 30, 20)
+shapes = Group(a, b, c, d, e)
+assert shapes.collidingPairs() == [(a, b), (c, d)]
+assert shapes.hitsAny(Circle(100, 300, 5))
+assert not shapes.hitsAny(Circle(20, 380, 5))
+assert not shapes.hitsAny(e)
@@ -0,0 +1,31 @@
+app.incrementalRedraw = True
+app.background = 'honeydew'
+
+r = Rect(20, 20, 100, 100, fill='orange', border='black', borderWidth=6)
+c = Circle(200, 200, 60, fill='cyan')
+l = Label('Damage', 200, 300, size=30, italic=True)
+ln = Line(20, 380, 380, 380, lineWidth=4, arrowEnd=True)
+g = Group(Star(320, 80, 50, 5, fill='gold'), Oval(320, 180, 80, 40))
+
+# -
+r.centerX += 150
+r.centerY += 40
+
+# -
+c.toBack()
+l.value = 'Damaged tracking'
+l.rotateAngle = 20
+
+# -
+g.visible = False
+ln.x2 = 200
+ln.y2 = 250
+
+# -
+g.visible = True
+g.rotateAngle = 45
+c.radius = 100
+
+# -
+app.incrementalRedraw = False
+r.fill = 'purple'
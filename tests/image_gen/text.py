@@ -30,3 +30,13 @@ assert str(l) == "Label({'a': 10}, 200, 200)", str(l)
 l.value = ""
 l.value = "--------------------"
 l.left = 200
+
+# -
+# Labels measured through the text cache match freshly measured ones
+l.value = 'Score: 10'
+cachedWidth = l.width
+app.textCacheSize = 0
+l.value = 'Score: 1'
+l.value = 'Score: 10'
+assert l.width == cachedWidth
+app.textCacheSize = 1024
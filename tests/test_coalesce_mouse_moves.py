@@ -0,0 +1,76 @@
+# Exits with a 0 return code if, with app.coalesceMouseMoves, queued mouse
+# motion events reach the app as one onMouseMove or onMouseDrag call per run
+# of moves with the same buttons held. Exits with a 1 return code otherwise.
+
+import os
+import threading
+import time
+import traceback
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+CMU_GRAPHICS_NO_UPDATE = True
+from cmu_graphics import *
+
+pygame = cmu_graphics.pygame
+app.coalesceMouseMoves = True
+calls = []
+
+# Takes the points argument, so it gets every position since the last call
+def onMouseMove(mouseX, mouseY, points):
+    calls.append(('move', mouseX, mouseY, points))
+
+# Doesn't take the points argument, so it's called as usual
+def onMouseDrag(mouseX, mouseY, buttons):
+    calls.append(('drag', mouseX, mouseY, buttons))
+
+def postMotion(pos, buttons):
+    pygame.event.post(
+        pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=buttons)
+    )
+
+def check():
+    global onMouseMove
+    try:
+        rawApp = app._app
+        while not rawApp._running:
+            time.sleep(0.01)
+        # Holding the lock keeps the loop from handling the events until
+        # they're all queued
+        with cmu_graphics.DRAWING_LOCK:
+            postMotion((10, 10), (0, 0, 0))
+            postMotion((20, 20), (0, 0, 0))
+            postMotion((30, 30), (0, 0, 0))
+            # Pressing a button starts a drag, which is a separate batch
+            postMotion((40, 40), (1, 0, 0))
+            postMotion((50, 50), (1, 0, 0))
+            postMotion((60, 60), (1, 0, 1))
+            postMotion((70, 70), (0, 0, 0))
+        time.sleep(cmu_graphics.IDLE_WAIT_MS * 3 / 1000)
+        with cmu_graphics.DRAWING_LOCK:
+            assert calls == [
+                ('move', 30, 30, [(10, 10), (20, 20), (30, 30)]),
+                ('drag', 50, 50, [0]),
+                ('drag', 60, 60, [0, 2]),
+                ('move', 70, 70, [(70, 70)]),
+            ], calls
+
+            # Handlers without the points argument get one call per batch too
+            def onMouseMove(mouseX, mouseY):
+                calls.append(('move', mouseX, mouseY))
+
+            calls.clear()
+            postMotion((80, 80), (0, 0, 0))
+            postMotion((90, 90), (0, 0, 0))
+        time.sleep(cmu_graphics.IDLE_WAIT_MS * 3 / 1000)
+        with cmu_graphics.DRAWING_LOCK:
+            assert calls == [('move', 90, 90)], calls
+    except Exception:
+        traceback.print_exc()
+        os._exit(1)
+    os._exit(0)
+
+threading.Thread(target=check, daemon=True).start()
+# Runs the main loop without the console, which would wait for stdin
+app._app.run()
+os._exit(1)
@@ -0,0 +1,71 @@
+# Exits with a 0 return code if a headless app can be stepped and drawn
+# without opening a window. Exits with a 1 return code otherwise.
+
+import os
+import sys
+
+CMU_GRAPHICS_HEADLESS = True
+CMU_GRAPHICS_NO_UPDATE = True
+from cmu_graphics import *
+
+app.width = 200
+app.height = 100
+app.background = 'black'
+r = Rect(0, 0, 20, 20, fill='red')
+
+def onStep():
+    r.left += 10
+
+def pixel(surface, x, y):
+    offset = y * surface.get_stride() + x * 4
+    return int.from_bytes(surface.get_data()[offset : offset + 4], sys.byteorder)
+
+try:
+    cmu_graphics.run()
+    assert not cmu_graphics.pygame.display.get_init()
+
+    app.step(5)
+    assert r.left == 50, r.left
+    surface = app.renderFrame()
+    assert (surface.get_width(), surface.get_height()) == (200, 100)
+    assert pixel(surface, 60, 10) == 0xFFFF0000
+    assert pixel(surface, 10, 10) == 0xFF000000
+
+    app.paused = True
+    app.step(5)
+    assert r.left == 50, r.left
+
+    app.width = 300
+    assert app.renderFrame().get_width() == 300
+    app.getScreenshot('headless.png')
+    assert os.path.exists('headless.png')
+    os.remove('headless.png')
+
+    # With app.fixedTimestep, steps that came due while a frame was drawn are
+    # caught up, at most MAX_CATCH_UP_STEPS at a time, and every step but the
+    # last counts as a dropped frame
+    rawApp = app._app
+    app.paused = False
+    app.fixedTimestep = True
+    app.stepsPerSecond = 10
+    r.left = 0
+    assert rawApp.takeFixedSteps(50) == 0
+    assert rawApp.takeFixedSteps(50) == 1
+    assert (r.left, app.droppedFrames) == (10, 0), (r.left, app.droppedFrames)
+    assert rawApp.takeFixedSteps(350) == 3
+    assert (r.left, app.droppedFrames) == (40, 2), (r.left, app.droppedFrames)
+    assert rawApp.takeFixedSteps(5000) == cmu_graphics.MAX_CATCH_UP_STEPS
+    assert app.droppedFrames == 2 + cmu_graphics.MAX_CATCH_UP_STEPS - 1
+    # The time past the cap was dropped, not saved for later
+    assert rawApp.takeFixedSteps(50) == 0
+
+    app.paused = True
+    assert rawApp.takeFixedSteps(500) == 0
+    assert r.left == 90, r.left
+except Exception:
+    import traceback
+
+    traceback.print_exc()
+    os._exit(1)
+
+os._exit(0)
@@ -0,0 +1,76 @@
+# Exits with a 0 return code if the main loop of an app with nothing to do
+# sleeps instead of stepping or redrawing, and still wakes up for events.
+# Exits with a 1 return code otherwise.
+
+import os
+import threading
+import time
+import traceback
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+CMU_GRAPHICS_NO_UPDATE = True
+from cmu_graphics import *
+
+IDLE_SECONDS = 1
+
+Rect(0, 0, 20, 20, fill='red')
+steps = 0
+
+def onStep():
+    global steps
+    steps += 1
+
+# The app has an onStep, but nothing runs it while paused
+app.paused = True
+
+rawApp = app._app
+redraws = 0
+realRedrawAll = rawApp.redrawAll
+
+def countRedraws(*args):
+    global redraws
+    redraws += 1
+    return realRedrawAll(*args)
+
+rawApp.redrawAll = countRedraws
+
+passes = []
+cmu_graphics.onMainLoopEvent.connect(lambda msPassed, *args: passes.append(msPassed))
+
+events = []
+cmu_graphics.pygameEvent.connect(lambda event, *args: events.append(event.type))
+
+def check():
+    try:
+        while not rawApp._running:
+            time.sleep(0.01)
+        time.sleep(IDLE_SECONDS)
+        with cmu_graphics.DRAWING_LOCK:
+            assert steps == 0, steps
+            # Only the first frame was drawn
+            assert redraws == 1, redraws
+            # The loop only woke up every IDLE_WAIT_MS, and msPassed is the
+            # time since the last pass, not since the app started
+            maxPasses = IDLE_SECONDS * 1000 / cmu_graphics.IDLE_WAIT_MS + 2
+            assert 2 <= len(passes) <= maxPasses, len(passes)
+            assert max(passes) < 4 * cmu_graphics.IDLE_WAIT_MS, passes
+
+        # An event wakes the loop, which handles it and draws once
+        cmu_graphics.pygame.event.post(
+            cmu_graphics.pygame.event.Event(cmu_graphics.pygame.USEREVENT)
+        )
+        time.sleep(cmu_graphics.IDLE_WAIT_MS * 3 / 1000)
+        with cmu_graphics.DRAWING_LOCK:
+            assert cmu_graphics.pygame.USEREVENT in events, events
+            assert redraws == 2, redraws
+            assert steps == 0, steps
+    except Exception:
+        traceback.print_exc()
+        os._exit(1)
+    os._exit(0)
+
+threading.Thread(target=check, daemon=True).start()
+# Runs the main loop without the console, which would wait for stdin
+rawApp.run()
+os._exit(1)
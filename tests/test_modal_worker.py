@@ -0,0 +1,107 @@
+# Exits with a 0 return code if getTextInput and showMessage reuse one modal
+# worker process, report errors from it, start a new one when it dies, and
+# can start it ahead of time and stop it.
+# The worker shows a fake modal, so no window opens. Exits with a 1 return
+# code otherwise.
+
+import os
+import subprocess
+import sys
+import traceback
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+CMU_GRAPHICS_NO_UPDATE = True
+from cmu_graphics import *
+
+MODAL_DIRECTORY = os.path.dirname(os.path.realpath(cmu_graphics.__file__))
+
+# Runs modal.runWorker with a TextBoxModal that answers right away. The prompt
+# 'fail' makes it raise, and the prompt 'die' kills the worker.
+FAKE_WORKER = '''
+import os
+import sys
+
+sys.path.insert(0, sys.argv[1])
+import modal
+
+class FakeTextBoxModal(object):
+    def __init__(self, title, prompt, getInput):
+        if prompt == 'fail':
+            raise Exception('The fake modal failed')
+        if prompt == 'die':
+            os._exit(1)
+        self.result = '%s %s %d' % (title, prompt, os.getpid()) if getInput else ''
+
+modal.TextBoxModal = FakeTextBoxModal
+modal.runWorker()
+'''
+
+def spawnFakeModalProcess():
+    return subprocess.Popen(
+        [sys.executable, '-c', FAKE_WORKER, MODAL_DIRECTORY],
+        stdout=subprocess.PIPE,
+        stdin=subprocess.PIPE,
+        cwd=MODAL_DIRECTORY,
+    )
+
+def assertRaises(fn):
+    try:
+        fn()
+    except Exception:
+        return
+    raise AssertionError('%r did not raise' % fn)
+
+try:
+    rawApp = app._app
+    rawApp.spawnModalProcess = spawnFakeModalProcess
+    app.title = 'Test'
+
+    # Every modal is shown by the same worker
+    first = app.getTextInput('one')
+    title, prompt, pid = first.split(' ')
+    assert (title, prompt) == ('Test', 'one'), first
+    app.showMessage('two')
+    assert app.getTextInput('three') == 'Test three %s' % pid
+    assert rawApp._modalProcess.pid == int(pid)
+
+    # A modal that raises is reported, and the worker keeps going
+    assertRaises(lambda: app.getTextInput('fail'))
+    assertRaises(lambda: app.showMessage('fail'))
+    assert app.getTextInput('four') == 'Test four %s' % pid
+
+    # When the worker dies, the next modal starts a new one
+    assertRaises(lambda: app.getTextInput('die'))
+    restarted = app.getTextInput('five')
+    newPid = restarted.split(' ')[2]
+    assert newPid != pid, restarted
+    assert rawApp._modalProcess.pid == int(newPid)
+
+    # A worker started ahead of time shows the next modal, and stopping it
+    # waits for it to exit
+    rawApp.stopModalProcess()
+    assert rawApp._modalProcess is None
+    prewarmed = rawApp.startModalProcess()
+    assert rawApp.startModalProcess() is prewarmed
+    assert app.getTextInput('six') == 'Test six %d' % prewarmed.pid
+    rawApp.stopModalProcess()
+    assert prewarmed.returncode == 0, prewarmed.returncode
+    assert rawApp._modalProcess is None
+
+    # A real modal that fails still shuts down pygame, so the worker can show
+    # the next one
+    sys.path.insert(0, MODAL_DIRECTORY)
+    import modal
+
+    class FailingTextBoxModal(modal.TextBoxModal):
+        def run(self):
+            assert modal.pygame.get_init()
+            raise Exception('The modal failed')
+
+    assertRaises(lambda: FailingTextBoxModal('Test', 'seven', True))
+    assert not modal.pygame.get_init()
+except Exception:
+    traceback.print_exc()
+    os._exit(1)
+
+os._exit(0)
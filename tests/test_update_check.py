@@ -0,0 +1,64 @@
+# Exits with a 0 return code if the update check runs in the background,
+# against a slow local stand-in for the version server, and gives up after
+# its timeout. Exits with a 1 return code otherwise.
+
+import http.server
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+CMU_GRAPHICS_NO_UPDATE = True
+from cmu_graphics import *
+
+class VersionHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(3 if self.path == '/hang' else 0.5)
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b'99.0.0')
+
+    def log_message(self, *args):
+        pass
+
+server = http.server.HTTPServer(('127.0.0.1', 0), VersionHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = 'http://127.0.0.1:%d' % server.server_port
+
+try:
+    cmu_graphics.UPDATE_CONFIG_FILE_PATH = os.path.join(tempfile.mkdtemp(), 'updates.json')
+    cmu_graphics.UPDATE_VERSION_URL = url + '/version.txt'
+    output = io.StringIO()
+    sys.stdout = output
+
+    start = time.time()
+    thread = cmu_graphics.start_update_check()
+    assert time.time() - start < 0.25
+    assert thread.is_alive()
+    thread.join(10)
+    assert not thread.is_alive()
+    assert 'newer version 99.0.0 is available' in output.getvalue()
+    with open(cmu_graphics.UPDATE_CONFIG_FILE_PATH) as f:
+        assert json.load(f)['most_recent_version'] == '99.0.0'
+
+    # A server that doesn't answer in time is skipped without a notice
+    os.remove(cmu_graphics.UPDATE_CONFIG_FILE_PATH)
+    output.truncate(0)
+    cmu_graphics.UPDATE_VERSION_URL = url + '/hang'
+    cmu_graphics.UPDATE_CHECK_TIMEOUT = 0.5
+    thread = cmu_graphics.start_update_check()
+    thread.join(2)
+    assert not thread.is_alive()
+    assert output.getvalue() == ''
+    assert not os.path.exists(cmu_graphics.UPDATE_CONFIG_FILE_PATH)
+except Exception:
+    import traceback
+
+    sys.stdout = sys.__stdout__
+    traceback.print_exc()
+    os._exit(1)
+
+os._exit(0)
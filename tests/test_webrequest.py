@@ -0,0 +1,120 @@
+# Exits with a 0 return code if webrequest reuses connections to a local
+# stand-in server, and saves responses and revalidates them with their ETag.
+# Exits with a 1 return code otherwise.
+
+import http.client
+import http.server
+import os
+import tempfile
+import threading
+import time
+import urllib.error
+
+CMU_GRAPHICS_NO_UPDATE = True
+from cmu_graphics.libs import webrequest
+
+connections = []
+requests = []
+truncate = False
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        connections.append(self.client_address)
+
+    def do_GET(self):
+        requests.append((self.path, self.headers.get('If-None-Match')))
+        if truncate:
+            # Promise more than is sent, then hang up
+            self.send_response(200)
+            self.send_header('Content-Length', '100')
+            self.end_headers()
+            self.wfile.write(b'image')
+            self.close_connection = True
+        elif self.path == '/moved':
+            self.send_response(302)
+            self.send_header('Location', '/sprite.png')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        elif self.path == '/missing':
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        elif self.headers.get('If-None-Match') == '"v1"':
+            self.send_response(304)
+            self.send_header('ETag', '"v1"')
+            self.end_headers()
+        else:
+            body = ('image ' + self.path).encode()
+            self.send_response(200)
+            self.send_header('ETag', '"v1"')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+url = 'http://127.0.0.1:%d' % server.server_port
+
+try:
+    webrequest.CACHE_DIR = tempfile.mkdtemp()
+
+    for i in range(5):
+        assert webrequest.get(url + '/sprite%d.png' % i).read() == b'image /sprite%d.png' % i
+    assert len(connections) == 1, connections
+    assert webrequest.get(url + '/moved').read() == b'image /sprite.png'
+    try:
+        webrequest.get(url + '/missing')
+        assert False
+    except urllib.error.HTTPError as e:
+        assert e.code == 404
+
+    # Saved responses are revalidated, and used if the server is unreachable
+    del requests[:]
+    assert webrequest.get(url + '/cached.png', cache=True).read() == b'image /cached.png'
+    assert webrequest.get(url + '/cached.png', cache=True).read() == b'image /cached.png'
+    assert requests == [('/cached.png', None), ('/cached.png', '"v1"')], requests
+
+    # The cache is kept under MAX_CACHE_BYTES by removing the responses used
+    # longest ago
+    cacheSize = sum(
+        os.path.getsize(os.path.join(webrequest.CACHE_DIR, name))
+        for name in os.listdir(webrequest.CACHE_DIR)
+    )
+    webrequest.MAX_CACHE_BYTES = cacheSize * 2
+    # File times can be a few milliseconds coarse, so the steps are spaced out
+    for path in ['/cache1.png', '/cached.png', '/cache2.png']:
+        time.sleep(0.05)
+        webrequest.get(url + path, cache=True)
+    assert webrequest.read_cache(url + '/cache1.png') == (None, None)
+    assert webrequest.read_cache(url + '/cache2.png')[1] == b'image /cache2.png'
+    assert len(os.listdir(webrequest.CACHE_DIR)) == 4, os.listdir(webrequest.CACHE_DIR)
+
+    # A response cut short falls back to the saved copy too
+    truncate = True
+    assert webrequest.get(url + '/cached.png', cache=True).read() == b'image /cached.png'
+    try:
+        webrequest.get(url + '/uncached.png')
+        assert False
+    except http.client.IncompleteRead:
+        pass
+    truncate = False
+
+    server.shutdown()
+    server.server_close()
+    for idle in webrequest._idle_connections.values():
+        for connection in idle:
+            connection.close()
+    assert webrequest.get(url + '/cached.png', cache=True).read() == b'image /cached.png'
+except Exception:
+    import traceback
+
+    traceback.print_exc()
+    os._exit(1)
+
+os._exit(0)